@@ -1,46 +1,62 @@
 """Vercel serverless MCP endpoint for Smithery.
 
 Handles MCP protocol over HTTP (JSON-RPC POST requests).
+The canon data ships inside the deployment bundle and cannot change, so it
+is loaded once per instance (mcp.server is the one that hot-reloads).
 Deploy: vercel --prod
 """
 
 import json
 import re
+import threading
 from http.server import BaseHTTPRequestHandler
 from pathlib import Path
 
 DATA_DIR = Path(__file__).parent.parent / "data" / "canons"
 
-_CANONS = None
-_DOMAIN_INDEX = None
 
+class _Corpus:
+    """Immutable snapshot of the canons and domain index."""
 
-def _load_canons():
-    global _CANONS
-    if _CANONS is not None:
-        return _CANONS
+    def __init__(self, canons):
+        self.canons = canons
+        index = {}
+        for c in canons:
+            d = c["error"]["domain"]
+            sig = c["error"]["signature"]
+            index.setdefault(d, [])
+            if sig not in index[d]:
+                index[d].append(sig)
+        self.domain_index = index
+
+
+_CORPUS = None
+_load_lock = threading.Lock()
+
+
+def _load_corpus():
     canons = []
     for f in sorted(DATA_DIR.rglob("*.json")):
         with open(f, encoding="utf-8") as fh:
             canons.append(json.load(fh))
-    _CANONS = canons
-    return canons
+    return _Corpus(canons)
+
+
+def _get_corpus():
+    global _CORPUS
+    if _CORPUS is None:
+        with _load_lock:
+            if _CORPUS is None:
+                _CORPUS = _load_corpus()
+    return _CORPUS
+
+
+def _load_canons():
+    return _get_corpus().canons
 
 
 def _get_domain_index():
-    global _DOMAIN_INDEX
-    if _DOMAIN_INDEX is not None:
-        return _DOMAIN_INDEX
-    canons = _load_canons()
-    index = {}
-    for c in canons:
-        d = c["error"]["domain"]
-        sig = c["error"]["signature"]
-        index.setdefault(d, [])
-        if sig not in index[d]:
-            index[d].append(sig)
-    _DOMAIN_INDEX = index
-    return index
+    return _get_corpus().domain_index
 
 
 def match_error(error_message, canons):
@@ -317,7 +333,8 @@ TOOLS = [
 ]
 
 
-def handle_mcp(method, params, canons):
+def handle_mcp(method, params, corpus):
+    canons = corpus.canons
     if method == "initialize":
         return {
             "protocolVersion": "2024-11-05",
@@ -348,7 +365,7 @@ def handle_mcp(method, params, canons):
                 text = (
                     "No matching errors found in deadends.dev database.\n\n"
                     f"Searched {len(canons)} error patterns across "
-                    f"{len(_get_domain_index())} domains.\n"
+                    f"{len(corpus.domain_index)} domains.\n"
                 )
                 if suggested != "unknown":
                     text += (
@@ -650,11 +667,10 @@ class handler(BaseHTTPRequestHandler):
             )
             return
 
-        canons = _load_canons()
         result = handle_mcp(
             request.get("method", ""),
             request.get("params", {}),
-            canons,
+            _get_corpus(),
         )
 
         if result is None:
@@ -0,0 +1,329 @@
+"""Shared HTTP client for the pipeline collectors (StackOverflow, GitHub).
+
+One ApiClient per API: a pooled requests.Session behind a thread-safe token
+bucket. The client honors the StackExchange "backoff" field and GitHub's
+rate-limit headers by pausing its bucket, so concurrent callers slow down
+together instead of each sleeping on its own. An optional HttpCache keeps
+responses on disk so re-runs cost little or no API quota.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+PROJECT_ROOT = Path(__file__).parent.parent
+HTTP_CACHE_DIR = PROJECT_ROOT / "data" / "pipeline" / "http-cache"
+
+SO_API_BASE = "https://api.stackexchange.com/2.3"
+GH_API_BASE = "https://api.github.com"
+
+# Statuses worth retrying after waiting (rate limited / transient upstream)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_WAIT_S = 300.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens/s, bursts up to ``capacity``.
+
+    ``pause(seconds)`` blocks every caller until the pause has elapsed, used
+    for server-requested backoff.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    elapsed = now - self._updated
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    wait = (1.0 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold all callers for ``seconds`` (extends, never shortens, a pause)."""
+        with self._lock:
+            until = self._clock() + max(0.0, seconds)
+            if until > self._paused_until:
+                self._paused_until = until
+                self._tokens = 0.0
+                self._updated = until
+
+
+class HttpCache:
+    """On-disk cache of successful GET responses, keyed by URL and params.
+
+    Entries younger than ``ttl`` seconds are served without a request. Older
+    entries with an ETag or Last-Modified are revalidated with a conditional
+    request (a 304 refreshes them). Total size is kept under ``max_bytes`` by
+    evicting least recently used entries. Credentials (the StackExchange
+    ``key`` param, auth headers) are not part of the key.
+    """
+
+    IGNORED_PARAMS = frozenset({"key", "access_token"})
+
+    def __init__(self, directory: Path = HTTP_CACHE_DIR, ttl: float = 7 * 86400,
+                 max_bytes: int = 512 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self._lock = threading.Lock()
+        self._size: int | None = None
+
+    def key(self, url: str, params: dict | None) -> str:
+        items = sorted(
+            (k, str(v)) for k, v in (params or {}).items() if k not in self.IGNORED_PARAMS
+        )
+        return hashlib.sha256(json.dumps([url, items]).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def load(self, key: str) -> dict | None:
+        """Return the stored entry (fresh or stale), marking it recently used."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry["stored"] < self.ttl
+
+    def store(self, key: str, resp: requests.Response) -> None:
+        """Persist a 200 response, then evict down to max_bytes if needed."""
+        entry = {
+            "url": resp.url,
+            "stored": time.time(),
+            "headers": {
+                k: resp.headers[k]
+                for k in ("Content-Type", "ETag", "Last-Modified")
+                if k in resp.headers
+            },
+            "body": resp.text,
+        }
+        self._write(key, entry)
+
+    def touch(self, key: str, entry: dict) -> None:
+        """Mark a revalidated (304) entry fresh again."""
+        self._write(key, {**entry, "stored": time.time()})
+
+    def _write(self, key: str, entry: dict) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        with self._lock:
+            if self._size is None:
+                self._size = self._total_size()
+            old = path.stat().st_size if path.exists() else 0
+            os.replace(tmp, path)
+            self._size += len(data) - old
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _total_size(self) -> int:
+        return sum(p.stat().st_size for p in self.directory.glob("*/*.json"))
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under 90% of max_bytes."""
+        entries = sorted(
+            (p.stat().st_mtime, p.stat().st_size, p) for p in self.directory.glob("*/*.json")
+        )
+        size = sum(e[1] for e in entries)
+        target = self.max_bytes * 0.9
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+        self._size = size
+
+    @staticmethod
+    def response(entry: dict, url: str) -> requests.Response:
+        """Rebuild a requests.Response from a cache entry."""
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url = entry.get("url", url)
+        resp.headers = CaseInsensitiveDict(entry["headers"])
+        resp._content = entry["body"].encode("utf-8")
+        resp.encoding = "utf-8"
+        resp.from_cache = True
+        return resp
+
+
+def _retry_after(resp: requests.Response) -> float | None:
+    """Seconds to wait before retrying a rate-limited response, if stated."""
+    value = resp.headers.get("Retry-After")
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            try:
+                return parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+    if resp.headers.get("X-RateLimit-Remaining") == "0":
+        reset = resp.headers.get("X-RateLimit-Reset")
+        if reset and reset.isdigit():
+            return int(reset) - time.time()
+    return None
+
+
+class ApiClient:
+    """Rate-limited JSON GETs against one API base URL.
+
+    Safe to share between threads. ``params`` are merged over
+    ``default_params`` (e.g. the StackExchange key).
+    """
+
+    def __init__(self, base_url: str, rate: float, *, headers: dict | None = None,
+                 default_params: dict | None = None, pool_size: int = 16,
+                 timeout: float = 30, max_retries: int = 3,
+                 bucket: TokenBucket | None = None, cache: HttpCache | None = None):
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.bucket = bucket or TokenBucket(rate)
+        self.default_params = default_params or {}
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.requests_made = 0
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, path: str, params: dict | None = None) -> requests.Response:
+        """GET base_url + path, retrying rate-limited and 5xx responses.
+
+        With a cache, fresh entries are returned without a request (the
+        response has ``from_cache = True``) and stale ones are revalidated.
+        Raises requests.RequestException once retries are exhausted.
+        """
+        url = f"{self.base_url}{path}"
+        merged = {**self.default_params, **(params or {})}
+        if self.cache is None:
+            return self._fetch(url, merged)
+
+        key = self.cache.key(url, merged)
+        entry = self.cache.load(key)
+        if entry and self.cache.is_fresh(entry):
+            self.cache.hits += 1
+            return HttpCache.response(entry, url)
+        conditional = {}
+        if entry:
+            if "ETag" in entry["headers"]:
+                conditional["If-None-Match"] = entry["headers"]["ETag"]
+            if "Last-Modified" in entry["headers"]:
+                conditional["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        resp = self._fetch(url, merged, conditional)
+        if resp.status_code == 304 and entry:
+            self.cache.revalidated += 1
+            self.cache.touch(key, entry)
+            return HttpCache.response(entry, url)
+        if resp.status_code == 200:
+            self.cache.store(key, resp)
+        return resp
+
+    def _fetch(self, url: str, params: dict,
+               headers: dict | None = None) -> requests.Response:
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            resp = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            self.requests_made += 1
+            self._observe(resp)
+            wait = _retry_after(resp)
+            retryable = resp.status_code in RETRY_STATUSES or (
+                resp.status_code == 403 and wait is not None
+            )
+            if not retryable or attempt >= self.max_retries:
+                resp.raise_for_status()
+                return resp
+            self.bucket.pause(min(MAX_RETRY_WAIT_S, wait if wait else 2.0 ** attempt))
+            attempt += 1
+
+    def get_json(self, path: str, params: dict | None = None):
+        """GET and decode JSON; a live StackExchange "backoff" pauses the bucket."""
+        resp = self.get(path, params)
+        data = resp.json()
+        if isinstance(data, dict) and data.get("backoff") \
+                and not getattr(resp, "from_cache", False):
+            self.bucket.pause(float(data["backoff"]))
+        return data
+
+    def _observe(self, resp: requests.Response) -> None:
+        """Pause ahead of time when GitHub reports an exhausted quota."""
+        if resp.headers.get("X-RateLimit-Remaining") == "0" and resp.ok:
+            wait = _retry_after(resp)
+            if wait:
+                self.bucket.pause(min(MAX_RETRY_WAIT_S, wait))
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def make_clients(so_key: str | None = None, gh_token: str | None = None,
+                 so_base: str = SO_API_BASE, gh_base: str = GH_API_BASE,
+                 so_rate: float = 0.5, gh_rate: float = 1.0,
+                 cache: HttpCache | None = None) -> dict[str, ApiClient]:
+    """Build the StackOverflow ("so") and GitHub ("gh") clients.
+
+    Bases are overridable so tests can point them at a stub server; both
+    clients share ``cache`` when given.
+    """
+    gh_headers = {"Accept": "application/vnd.github+json"}
+    if gh_token:
+        gh_headers["Authorization"] = f"Bearer {gh_token}"
+    return {
+        "so": ApiClient(so_base, so_rate, cache=cache,
+                        default_params={"key": so_key} if so_key else {}),
+        "gh": ApiClient(gh_base, gh_rate, headers=gh_headers, cache=cache),
+    }
+
+
+def add_cache_arguments(parser) -> None:
+    """Add the shared --no-cache / --cache-ttl / --cache-dir CLI options."""
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always hit the APIs instead of the on-disk response cache")
+    parser.add_argument("--cache-ttl", type=float, default=168, metavar="HOURS",
+                        help="Serve cached responses younger than this without a request")
+    parser.add_argument("--cache-dir", type=Path, default=HTTP_CACHE_DIR,
+                        help="Response cache directory")
+
+
+def cache_from_args(args) -> HttpCache | None:
+    if args.no_cache:
+        return None
+    return HttpCache(args.cache_dir, ttl=args.cache_ttl * 3600)
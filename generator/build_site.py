@@ -1,8 +1,18 @@
 """Build static site from ErrorCanon JSON data files."""
 
+import argparse
+import gzip
+import hashlib
 import json
+import os
+import re
 import shutil
 import sys
+import time
+import urllib.request
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from xml.etree.ElementTree import Element, SubElement, tostring
@@ -10,6 +20,15 @@ from xml.etree.ElementTree import Element, SubElement, tostring
 from jinja2 import Environment, FileSystemLoader
 from markupsafe import Markup
 
+from generator.profiling import BuildProfiler
+
+try:  # Python 3.11+
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_constants
+    import sre_parse
+
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data" / "canons"
 SITE_DIR = PROJECT_ROOT / "site"
@@ -44,6 +63,21 @@ BING_VERIFICATION = ""  # e.g., "ABCDEF1234567890"
 # IndexNow key — generated deterministically for the site
 INDEXNOW_KEY = "deadend-dev-indexnow-key"
 
+# AI agent config files copied from the project root to the site root
+AI_CONFIG_FILES = [
+    "CLAUDE.md", ".cursorrules", ".windsurfrules",
+    "AGENTS.md", ".clinerules",
+]
+
+
+# Incremental build manifest, written into the site directory
+BUILD_MANIFEST_NAME = ".build-manifest.json"
+
+# Every file written during the build, in order (see _write_text)
+_OUTPUTS: list[Path] = []
+# Per-template render time: name -> [total seconds, render count]
+_TEMPLATE_TIMES: dict[str, list] = {}
+
 
 def load_canons(data_dir: Path) -> list[dict]:
     """Load all ErrorCanon JSON files from the data directory."""
@@ -55,6 +89,205 @@ def load_canons(data_dir: Path) -> list[dict]:
     return canons
 
 
+def _write_text(path: Path, content: str) -> None:
+    """Write a build output file, creating parent directories as needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    _OUTPUTS.append(path)
+
+
+def _write_bytes(path: Path, content: bytes) -> None:
+    """Write a binary build output file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    _OUTPUTS.append(path)
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy a source file into the site as a build output."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(src, dst)
+    _OUTPUTS.append(dst)
+
+
+# Write buffer for streamed outputs (llms-full.txt, errors.ndjson, index.json)
+_STREAM_BUFFER_SIZE = 1 << 16
+
+
+@contextmanager
+def _open_output(path: Path) -> Iterator:
+    """Open a build output for buffered, incremental text writes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", buffering=_STREAM_BUFFER_SIZE) as f:
+        yield f
+    _OUTPUTS.append(path)
+
+
+def _write_lines(path: Path, lines: Iterable[str]) -> int:
+    """Stream lines to path joined by newlines, as "\n".join() would.
+
+    Returns the number of lines written.
+    """
+    count = 0
+    with _open_output(path) as f:
+        for line in lines:
+            if count:
+                f.write("\n")
+            f.write(line)
+            count += 1
+    return count
+
+
+def _write_json_stream(f, head: dict, key: str, items: Iterable[dict]) -> int:
+    """Write {**head, key: [*items]} as indent=2 JSON, one item at a time.
+
+    The bytes match json.dumps(..., indent=2, ensure_ascii=False) of the fully
+    built object, but only one item is encoded in memory at once. Returns
+    the number of items written.
+    """
+    text = json.dumps({**head, key: []}, indent=2, ensure_ascii=False)
+    f.write(text[:-len("[]\n}")] + "[")
+    count = 0
+    for item in items:
+        f.write(",\n    " if count else "\n    ")
+        f.write(
+            json.dumps(item, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+        )
+        count += 1
+    f.write("\n  ]\n}" if count else "]\n}")
+    return count
+
+
+def _render_template(template, **context) -> str:
+    """Render a Jinja template, accumulating its render time."""
+    start = time.perf_counter()
+    html = template.render(**context)
+    stats = _TEMPLATE_TIMES.setdefault(template.name, [0.0, 0])
+    stats[0] += time.perf_counter() - start
+    stats[1] += 1
+    return html
+
+
+def _merge_template_times(times: dict[str, list]) -> None:
+    """Fold render times reported by a pool worker into this process."""
+    for name, (total, count) in times.items():
+        stats = _TEMPLATE_TIMES.setdefault(name, [0.0, 0])
+        stats[0] += total
+        stats[1] += count
+
+
+def _digest(*parts) -> str:
+    """Return a stable SHA-256 hex digest of JSON-serializable parts."""
+    payload = json.dumps(
+        parts, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's bytes ("" if missing)."""
+    if not path.is_file():
+        return ""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class BuildManifest:
+    """Input digests and output paths recorded between incremental builds.
+
+    Each entry maps a build unit (an error page, a summary page, a domain
+    page, an aggregate stage) to a digest of everything it was rendered from
+    and the files it wrote. A unit is re-rendered only when its digest
+    changes or one of its recorded outputs is missing.
+    """
+
+    def __init__(self, site_dir: Path, previous: dict | None = None):
+        self.site_dir = site_dir
+        self.previous: dict[str, dict] = previous or {}
+        self.entries: dict[str, dict] = {}
+        self.code_digest = _file_digest(Path(__file__))
+        self._canon_digests: dict[int, str] = {}
+        self._template_digests: dict[str, str] = {}
+
+    @classmethod
+    def load(cls, site_dir: Path) -> "BuildManifest":
+        """Load the manifest of the previous build (empty if none)."""
+        path = site_dir / BUILD_MANIFEST_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        return cls(site_dir, data.get("entries", {}))
+
+    def canon_digest(self, canon: dict) -> str:
+        """Content digest of a single canon (memoized per loaded object).
+
+        Keyed by object identity rather than canon id because the corpus
+        may contain two files declaring the same id.
+        """
+        key = id(canon)
+        if key not in self._canon_digests:
+            self._canon_digests[key] = _digest(canon)
+        return self._canon_digests[key]
+
+    def corpus_digest(self, canons: list[dict]) -> str:
+        """Digest of the full corpus, in load order."""
+        return _digest([self.canon_digest(c) for c in canons])
+
+    def template_digest(self, name: str) -> str:
+        """Digest of a Jinja template source file."""
+        if name not in self._template_digests:
+            self._template_digests[name] = _file_digest(TEMPLATE_DIR / name)
+        return self._template_digests[name]
+
+    def unit_digest(self, *inputs) -> str:
+        """Digest of a build unit's inputs plus the build code itself."""
+        return _digest(self.code_digest, *inputs)
+
+    def is_fresh(self, key: str, digest: str) -> bool:
+        """Return True (and carry the entry forward) if a unit is up to date."""
+        prev = self.previous.get(key)
+        if not prev or prev.get("digest") != digest:
+            return False
+        if not all((self.site_dir / p).exists() for p in prev["outputs"]):
+            return False
+        self.entries[key] = prev
+        return True
+
+    def record(self, key: str, digest: str, outputs: list[Path]) -> None:
+        """Record the digest and written outputs of a freshly built unit."""
+        self.entries[key] = {
+            "digest": digest,
+            "outputs": sorted(
+                {p.relative_to(self.site_dir).as_posix() for p in outputs}
+            ),
+        }
+
+    def remove_stale_outputs(self) -> list[str]:
+        """Delete outputs of the previous build that no unit produced now."""
+        current = {p for e in self.entries.values() for p in e["outputs"]}
+        previous = {p for e in self.previous.values() for p in e["outputs"]}
+        stale = sorted(previous - current)
+        for rel in stale:
+            path = self.site_dir / rel
+            if path.is_file():
+                path.unlink()
+            # Prune directories left empty by the removal
+            parent = path.parent
+            while parent != self.site_dir and parent.is_dir():
+                if any(parent.iterdir()):
+                    break
+                parent.rmdir()
+                parent = parent.parent
+        return stale
+
+    def save(self) -> None:
+        """Write the manifest for the next incremental build."""
+        data = {"version": 1, "entries": dict(sorted(self.entries.items()))}
+        (self.site_dir / BUILD_MANIFEST_NAME).write_text(
+            json.dumps(data, indent=1, ensure_ascii=False), encoding="utf-8"
+        )
+
+
 def build_env_summary(canon: dict) -> str:
     """Build a human-readable environment summary string."""
     env = canon["environment"]
@@ -97,161 +330,383 @@ def collect_sources(canon: dict) -> list[str]:
     return sorted(sources)
 
 
-def build_error_pages(canons: list[dict], jinja_env: Environment) -> None:
-    """Generate individual error pages."""
-    template = jinja_env.get_template("page.html")
-    known_ids = {c["id"] for c in canons}
+class CorpusModel:
+    """Groupings and aggregates of the loaded corpus, computed once per build.
+
+    Build stages read from this instead of re-grouping and re-sorting the
+    canon list themselves. Per-canon values (env summary, sources) are keyed
+    by object identity because two files may declare the same id.
+    """
+
+    def __init__(self, canons: list[dict]):
+        self.canons = canons
+        self.sorted = sorted(canons, key=lambda c: c["id"])
+        self.known_ids = {c["id"] for c in canons}
+        # When two files declare the same id the last one loaded owns the page
+        self.unique = list({c["id"]: c for c in canons}.values())
+
+        # Domains in first-seen (load) order; canons per domain in load order
+        self.by_domain: dict[str, list[dict]] = {}
+        for c in canons:
+            self.by_domain.setdefault(c["error"]["domain"], []).append(c)
+        self.domains = sorted(self.by_domain)
+        self.sorted_by_domain: dict[str, list[dict]] = {}
+        for c in self.sorted:
+            self.sorted_by_domain.setdefault(c["error"]["domain"], []).append(c)
+
+        # Environment-agnostic groups: "domain/slug" -> canons in load order
+        self.by_slug: dict[str, list[dict]] = {}
+        for c in canons:
+            parts = c["id"].rsplit("/", 1)
+            if len(parts) == 2:
+                self.by_slug.setdefault(parts[0], []).append(c)
+        self.slug_signatures = {
+            sk: sc[0]["error"]["signature"] for sk, sc in self.by_slug.items()
+        }
+        # Slug keys grouped by their id prefix, for summary cross-links
+        self.slugs_by_prefix: dict[str, list[str]] = {}
+        for sk in self.by_slug:
+            self.slugs_by_prefix.setdefault(sk.split("/", 1)[0], []).append(sk)
+        # Slug keys grouped by canon domain, for error page cross-links
+        self.domain_slugs: dict[str, list[dict]] = {}
+        seen_slugs: dict[str, set[str]] = {}
+        for c in canons:
+            domain = c["error"]["domain"]
+            slug_key = c["id"].rsplit("/", 1)[0]
+            seen = seen_slugs.setdefault(domain, set())
+            if slug_key not in seen:
+                seen.add(slug_key)
+                self.domain_slugs.setdefault(domain, []).append({
+                    "slug_key": slug_key,
+                    "signature": c["error"]["signature"],
+                })
+
+        self.env_summaries = {id(c): build_env_summary(c) for c in canons}
+        self.sources = {id(c): collect_sources(c) for c in canons}
+        self.domain_stats = {
+            domain: _domain_stats(dcanons)
+            for domain, dcanons in self.by_domain.items()
+        }
+        self.fix_rate_sum = sum(c["verdict"]["fix_success_rate"] for c in canons)
+
+    def __len__(self) -> int:
+        return len(self.canons)
+
+    def env_summary(self, canon: dict) -> str:
+        return self.env_summaries[id(canon)]
+
+    def canon_sources(self, canon: dict) -> list[str]:
+        return self.sources[id(canon)]
+
+
+def _domain_stats(dcanons: list[dict]) -> dict:
+    """Counts and rate totals for one domain's canons (in load order)."""
+    res = {"true": 0, "partial": 0, "false": 0}
+    conf = {"high": 0, "medium": 0, "low": 0}
+    cats: dict[str, int] = {}
+    rate_sum = 0.0
+    dead_ends = workarounds = 0
+    for c in dcanons:
+        rate_sum += c["verdict"]["fix_success_rate"]
+        res[c["verdict"]["resolvable"]] = res.get(c["verdict"]["resolvable"], 0) + 1
+        raw_conf = c["verdict"]["confidence"]
+        if isinstance(raw_conf, (int, float)):
+            conf_label = (
+                "high" if raw_conf >= 0.8
+                else "medium" if raw_conf >= 0.5
+                else "low"
+            )
+        else:
+            conf_label = str(raw_conf)
+        conf[conf_label] = conf.get(conf_label, 0) + 1
+        cat = c["error"]["category"]
+        cats[cat] = cats.get(cat, 0) + 1
+        dead_ends += len(c["dead_ends"])
+        workarounds += len(c.get("workarounds", []))
+    return {
+        "count": len(dcanons),
+        "fix_rate_sum": rate_sum,
+        "resolvability": res,
+        "confidence": conf,
+        "categories": cats,
+        "dead_ends": dead_ends,
+        "workarounds": workarounds,
+    }
+
 
-    # Build per-domain summary links for internal linking
-    # Key: domain, Value: list of {slug_key, signature}  (deduplicated)
-    domain_summaries: dict[str, list[dict]] = {}
+def _linked_ids(canons: list[dict], known_ids: set[str]) -> list[str]:
+    """Transition-graph targets that resolve to pages (rendered as links)."""
+    linked = set()
     for c in canons:
-        domain = c["error"]["domain"]
-        slug_key = c["id"].rsplit("/", 1)[0]
-        if domain not in domain_summaries:
-            domain_summaries[domain] = []
-        seen = {e["slug_key"] for e in domain_summaries[domain]}
-        if slug_key not in seen:
-            domain_summaries[domain].append({
-                "slug_key": slug_key,
-                "signature": c["error"]["signature"],
-            })
+        graph = c.get("transition_graph", {})
+        for edges in graph.values():
+            for edge in edges:
+                if edge["error_id"] in known_ids:
+                    linked.add(edge["error_id"])
+    return sorted(linked)
 
-    for canon in canons:
-        error_id = canon["id"]
-        env_summary = build_env_summary(canon)
-        all_sources = collect_sources(canon)
-
-        # Build JSON-LD with Schema.org TechArticle + custom ErrorCanon
-        page_url = canon["url"]
-        if not page_url.endswith("/"):
-            page_url += "/"
-        json_ld_data = {
-            "@context": [
-                "https://schema.org",
-                {"deadend": f"{BASE_URL}/schema/v1#"},
-            ],
-            "@type": "TechArticle",
-            "name": canon["error"]["signature"],
-            "headline": f"Fix {canon['error']['signature']}",
-            "description": canon["verdict"]["summary"],
-            "url": page_url,
-            "datePublished": canon["error"].get(
-                "first_seen", canon["metadata"].get("generation_date", "")
-            ),
-            "dateModified": canon["verdict"]["last_updated"],
-            "image": f"{BASE_URL}/og-image.png",
-            "publisher": {
-                "@type": "Organization",
-                "name": "deadends.dev",
-                "url": BASE_URL,
-            },
-            "about": {
-                "@type": "SoftwareSourceCode",
-                "programmingLanguage": canon["error"]["domain"],
+
+# Per-process state of render pool workers (see _init_render_worker)
+_worker_state: dict = {}
+
+
+def _init_render_worker(site_dir: Path, known_ids: set[str]) -> None:
+    """Pool initializer: point the worker at the site dir, build Jinja once."""
+    global SITE_DIR
+    SITE_DIR = site_dir
+    _worker_state["jinja_env"] = create_jinja_env()
+    _worker_state["known_ids"] = known_ids
+
+
+def _render_batch(
+    render_fn, template_name: str, batch: list[tuple]
+) -> tuple[list[list[Path]], dict[str, list]]:
+    """Render a batch of page units inside a pool worker.
+
+    Returns the output paths per unit and the batch's template render times.
+    """
+    template = _worker_state["jinja_env"].get_template(template_name)
+    known_ids = _worker_state["known_ids"]
+    _TEMPLATE_TIMES.clear()
+    paths = [render_fn(template, known_ids, *item) for item in batch]
+    return paths, dict(_TEMPLATE_TIMES)
+
+
+def _render_units(
+    render_fn,
+    template_name: str,
+    jinja_env: Environment,
+    known_ids: set[str],
+    items: list[tuple],
+    jobs: int = 1,
+) -> list[list[Path]]:
+    """Render page units serially or across a process pool.
+
+    render_fn(template, known_ids, *item) writes one unit and returns its
+    output paths. Results come back in item order, so pool and serial
+    builds write byte-identical files and log identically.
+    """
+    if jobs <= 1 or len(items) < 2:
+        template = jinja_env.get_template(template_name)
+        return [render_fn(template, known_ids, *item) for item in items]
+
+    # Contiguous batches, several per worker to even out slow pages
+    size = max(1, -(-len(items) // (jobs * 4)))
+    batches = [items[i:i + size] for i in range(0, len(items), size)]
+    results: list[list[Path]] = []
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_render_worker,
+        initargs=(SITE_DIR, known_ids),
+    ) as pool:
+        for batch_paths, times in pool.map(
+            _render_batch,
+            [render_fn] * len(batches),
+            [template_name] * len(batches),
+            batches,
+        ):
+            results.extend(batch_paths)
+            _merge_template_times(times)
+    for paths in results:
+        _OUTPUTS.extend(paths)
+    return results
+
+
+def _write_error_page(
+    template,
+    known_ids: set[str],
+    canon: dict,
+    same_domain: list[dict],
+    env_summary: str,
+    all_sources: list[str],
+) -> list[Path]:
+    """Render one error page plus its JSON API file; return the paths written."""
+    error_id = canon["id"]
+    page_file = SITE_DIR / error_id / "index.html"
+    api_file = SITE_DIR / "api" / "v1" / f"{error_id}.json"
+
+    # Build JSON-LD with Schema.org TechArticle + custom ErrorCanon
+    page_url = canon["url"]
+    if not page_url.endswith("/"):
+        page_url += "/"
+    json_ld_data = {
+        "@context": [
+            "https://schema.org",
+            {"deadend": f"{BASE_URL}/schema/v1#"},
+        ],
+        "@type": "TechArticle",
+        "name": canon["error"]["signature"],
+        "headline": f"Fix {canon['error']['signature']}",
+        "description": canon["verdict"]["summary"],
+        "url": page_url,
+        "datePublished": canon["error"].get(
+            "first_seen", canon["metadata"].get("generation_date", "")
+        ),
+        "dateModified": canon["verdict"]["last_updated"],
+        "image": f"{BASE_URL}/og-image.png",
+        "publisher": {
+            "@type": "Organization",
+            "name": "deadends.dev",
+            "url": BASE_URL,
+        },
+        "about": {
+            "@type": "SoftwareSourceCode",
+            "programmingLanguage": canon["error"]["domain"],
+        },
+        # Full ErrorCanon data embedded
+        "deadend:errorCanon": canon,
+    }
+    json_ld = json.dumps(json_ld_data, indent=2, ensure_ascii=False)
+
+    # FAQPage schema — dead ends as FAQ questions for Google rich snippets
+    faq_entities = []
+    sig = canon["error"]["signature"]
+    for de in canon["dead_ends"]:
+        faq_entities.append({
+            "@type": "Question",
+            "name": f"Why doesn't '{de['action']}' fix {sig}?",
+            "acceptedAnswer": {
+                "@type": "Answer",
+                "text": de["why_fails"],
             },
-            # Full ErrorCanon data embedded
-            "deadend:errorCanon": canon,
-        }
-        json_ld = json.dumps(json_ld_data, indent=2, ensure_ascii=False)
+        })
+    faq_json_ld_data = {
+        "@context": "https://schema.org",
+        "@type": "FAQPage",
+        "mainEntity": faq_entities,
+    }
+    faq_json_ld = json.dumps(
+        faq_json_ld_data, indent=2, ensure_ascii=False
+    )
 
-        # FAQPage schema — dead ends as FAQ questions for Google rich snippets
-        faq_entities = []
-        sig = canon["error"]["signature"]
-        for de in canon["dead_ends"]:
-            faq_entities.append({
-                "@type": "Question",
-                "name": f"Why doesn't '{de['action']}' fix {sig}?",
-                "acceptedAnswer": {
-                    "@type": "Answer",
-                    "text": de["why_fails"],
-                },
-            })
-        faq_json_ld_data = {
+    # HowTo schema — workarounds as step-by-step fix instructions
+    howto_json_ld = ""
+    workarounds = canon.get("workarounds", [])
+    if workarounds:
+        howto_steps = []
+        for i, wa in enumerate(workarounds, 1):
+            step = {
+                "@type": "HowToStep",
+                "position": i,
+                "name": wa["action"],
+                "text": wa.get("how", wa["action"]),
+            }
+            if wa.get("tradeoff"):
+                step["text"] += f" (Tradeoff: {wa['tradeoff']})"
+            howto_steps.append(step)
+        howto_data = {
             "@context": "https://schema.org",
-            "@type": "FAQPage",
-            "mainEntity": faq_entities,
+            "@type": "HowTo",
+            "name": f"How to fix {sig}",
+            "description": canon["verdict"]["summary"],
+            "step": howto_steps,
         }
-        faq_json_ld = json.dumps(
-            faq_json_ld_data, indent=2, ensure_ascii=False
+        howto_json_ld = json.dumps(
+            howto_data, indent=2, ensure_ascii=False
         )
 
-        # HowTo schema — workarounds as step-by-step fix instructions
-        howto_json_ld = ""
-        workarounds = canon.get("workarounds", [])
-        if workarounds:
-            howto_steps = []
-            for i, wa in enumerate(workarounds, 1):
-                step = {
-                    "@type": "HowToStep",
-                    "position": i,
-                    "name": wa["action"],
-                    "text": wa.get("how", wa["action"]),
-                }
-                if wa.get("tradeoff"):
-                    step["text"] += f" (Tradeoff: {wa['tradeoff']})"
-                howto_steps.append(step)
-            howto_data = {
-                "@context": "https://schema.org",
-                "@type": "HowTo",
-                "name": f"How to fix {sig}",
-                "description": canon["verdict"]["summary"],
-                "step": howto_steps,
-            }
-            howto_json_ld = json.dumps(
-                howto_data, indent=2, ensure_ascii=False
-            )
+    html = _render_template(
+        template,
+        env_summary=env_summary,
+        all_sources=all_sources,
+        json_ld=json_ld,
+        faq_json_ld=faq_json_ld,
+        howto_json_ld=howto_json_ld,
+        known_ids=known_ids,
+        domain_errors=same_domain,
+        **canon,
+    )
+
+    # Write HTML page
+    _write_text(page_file, html)
+
+    # Write JSON API endpoint (hierarchical path)
+    _write_text(api_file, json.dumps(canon, indent=2, ensure_ascii=False))
+
+    return [page_file, api_file]
+
+
+def build_error_pages(
+    corpus: CorpusModel,
+    jinja_env: Environment,
+    manifest: BuildManifest | None = None,
+    jobs: int = 1,
+) -> None:
+    """Generate individual error pages.
+
+    With a manifest, pages whose inputs are unchanged since the previous
+    build are skipped. With jobs > 1, pages render across a process pool.
+    """
+    known_ids = corpus.known_ids
+
+    pending = []
+    skipped = 0
+    for canon in corpus.unique:
+        error_id = canon["id"]
 
         # Same-domain errors for internal linking (exclude self)
         current_slug = error_id.rsplit("/", 1)[0]
         same_domain = [
-            e for e in domain_summaries.get(
+            e for e in corpus.domain_slugs.get(
                 canon["error"]["domain"], []
             )
             if e["slug_key"] != current_slug
         ][:10]
 
-        html = template.render(
-            env_summary=env_summary,
-            all_sources=all_sources,
-            json_ld=json_ld,
-            faq_json_ld=faq_json_ld,
-            howto_json_ld=howto_json_ld,
-            known_ids=known_ids,
-            domain_errors=same_domain,
-            **canon,
-        )
+        unit_key = digest = None
+        if manifest is not None:
+            unit_key = f"page:{error_id}"
+            digest = manifest.unit_digest(
+                manifest.template_digest("page.html"),
+                manifest.canon_digest(canon),
+                same_domain,
+                _linked_ids([canon], known_ids),
+            )
+            if manifest.is_fresh(unit_key, digest):
+                skipped += 1
+                continue
 
-        # Write HTML page
-        page_dir = SITE_DIR / error_id
-        page_dir.mkdir(parents=True, exist_ok=True)
-        (page_dir / "index.html").write_text(html, encoding="utf-8")
-
-        # Write JSON API endpoint (hierarchical path)
-        api_file = SITE_DIR / "api" / "v1" / f"{error_id}.json"
-        api_file.parent.mkdir(parents=True, exist_ok=True)
-        api_file.write_text(
-            json.dumps(canon, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        pending.append((canon, same_domain, unit_key, digest))
+
+    outputs = _render_units(
+        _write_error_page, "page.html", jinja_env, known_ids,
+        [
+            (canon, same_domain, corpus.env_summary(canon), corpus.canon_sources(canon))
+            for canon, same_domain, _, _ in pending
+        ],
+        jobs,
+    )
+    for (canon, _, unit_key, digest), paths in zip(pending, outputs):
+        if manifest is not None:
+            manifest.record(unit_key, digest, paths)
+        print(f"  Generated: {canon['id']}")
 
-        print(f"  Generated: {error_id}")
+    if skipped:
+        print(f"  Unchanged: {skipped} page(s) skipped")
 
 
-def build_domain_pages(canons: list[dict], jinja_env: Environment) -> None:
+def build_domain_pages(
+    corpus: CorpusModel,
+    jinja_env: Environment,
+    manifest: BuildManifest | None = None,
+) -> None:
     """Generate domain listing pages (e.g., /python/, /node/)."""
     template = jinja_env.get_template("domain.html")
 
-    # Group canons by domain
-    by_domain: dict[str, list[dict]] = {}
-    for canon in canons:
-        domain = canon["error"]["domain"]
-        by_domain.setdefault(domain, []).append(canon)
+    for domain, domain_canons in corpus.by_domain.items():
+        page_file = SITE_DIR / domain / "index.html"
+        if manifest is not None:
+            unit_key = f"domain:{domain}"
+            digest = manifest.unit_digest(
+                manifest.template_digest("domain.html"),
+                [manifest.canon_digest(c) for c in domain_canons],
+            )
+            if manifest.is_fresh(unit_key, digest):
+                continue
 
-    for domain, domain_canons in by_domain.items():
         # Group by slug for summary-level entries
         by_slug: dict[str, list[dict]] = {}
-        for c in sorted(domain_canons, key=lambda c: c["id"]):
+        for c in corpus.sorted_by_domain[domain]:
             slug_key = c["id"].rsplit("/", 1)[0]
             by_slug.setdefault(slug_key, []).append(c)
 
@@ -273,66 +728,57 @@ def build_domain_pages(canons: list[dict], jinja_env: Environment) -> None:
                 "workaround_count": slug_wa,
             })
 
-        # Domain-level stats
-        rates = [c["verdict"]["fix_success_rate"] for c in domain_canons]
-        resolvable_counts = {"true": 0, "partial": 0, "false": 0}
-        for c in domain_canons:
-            r = c["verdict"]["resolvable"]
-            resolvable_counts[r] = resolvable_counts.get(r, 0) + 1
-        total_de = sum(len(c["dead_ends"]) for c in domain_canons)
-        total_wa = sum(len(c.get("workarounds", [])) for c in domain_canons)
-
-        html = template.render(
+        stats = corpus.domain_stats[domain]
+        html = _render_template(
+            template,
             domain=domain,
             entries=entries,
             total=len(entries),
-            avg_fix_rate=int(sum(rates) / len(rates) * 100),
-            resolvable_counts=resolvable_counts,
-            total_dead_ends=total_de,
-            total_workarounds=total_wa,
+            avg_fix_rate=int(stats["fix_rate_sum"] / stats["count"] * 100),
+            resolvable_counts=stats["resolvability"],
+            total_dead_ends=stats["dead_ends"],
+            total_workarounds=stats["workarounds"],
         )
 
-        domain_dir = SITE_DIR / domain
-        domain_dir.mkdir(parents=True, exist_ok=True)
-        (domain_dir / "index.html").write_text(html, encoding="utf-8")
+        _write_text(page_file, html)
+        if manifest is not None:
+            manifest.record(unit_key, digest, [page_file])
         print(f"  Generated: /{domain}/")
 
 
-def build_index_page(canons: list[dict], jinja_env: Environment) -> None:
+def build_index_page(corpus: CorpusModel, jinja_env: Environment) -> None:
     """Generate the main index page."""
     template = jinja_env.get_template("index.html")
 
-    # Compute domain stats
-    domain_counts: dict[str, int] = {}
-    for canon in canons:
-        domain = canon["error"]["domain"]
-        domain_counts[domain] = domain_counts.get(domain, 0) + 1
-
     domain_stats = sorted(
-        [{"slug": slug, "count": count} for slug, count in domain_counts.items()],
+        [
+            {"slug": slug, "count": stats["count"]}
+            for slug, stats in corpus.domain_stats.items()
+        ],
         key=lambda x: x["count"],
         reverse=True,
     )
 
-    domains = sorted(domain_counts.keys())
-
     # Recent entries (sorted by generation_date descending)
     recent = sorted(
-        canons,
+        corpus.canons,
         key=lambda c: c["metadata"].get("generation_date", ""),
         reverse=True,
     )[:10]
     recent_entries = [
-        {"id": c["id"], "error": c["error"], "env_summary": build_env_summary(c)}
+        {"id": c["id"], "error": c["error"], "env_summary": corpus.env_summary(c)}
         for c in recent
     ]
 
     # Pick a representative example error for API/feature links
-    example_error_id = recent_entries[0]["id"] if recent_entries else canons[0]["id"]
+    example_error_id = (
+        recent_entries[0]["id"] if recent_entries else corpus.canons[0]["id"]
+    )
 
-    html = template.render(
-        total_errors=len(canons),
-        domains=domains,
+    html = _render_template(
+        template,
+        total_errors=len(corpus),
+        domains=corpus.domains,
         domain_stats=domain_stats,
         recent_entries=recent_entries,
         example_error_id=example_error_id,
@@ -340,7 +786,7 @@ def build_index_page(canons: list[dict], jinja_env: Environment) -> None:
         bing_verification=BING_VERIFICATION,
     )
 
-    (SITE_DIR / "index.html").write_text(html, encoding="utf-8")
+    _write_text(SITE_DIR / "index.html", html)
     print("  Generated: index.html")
 
 
@@ -348,11 +794,11 @@ def _write_urlset(urlset: Element, path: Path) -> None:
     """Write a urlset element to an XML file."""
     xml_declaration = '<?xml version="1.0" encoding="UTF-8"?>\n'
     xml_body = tostring(urlset, encoding="unicode")
-    path.write_text(xml_declaration + xml_body, encoding="utf-8")
+    _write_text(path, xml_declaration + xml_body)
 
 
 def build_sitemap(
-    canons: list[dict],
+    corpus: CorpusModel,
     summary_urls: list[dict] | None = None,
 ) -> None:
     """Generate sitemap index with per-domain sub-sitemaps.
@@ -379,16 +825,12 @@ def build_sitemap(
     SubElement(url_elem, "changefreq").text = "weekly"
     SubElement(url_elem, "priority").text = "0.9"
 
-    domains_seen = set()
-    for canon in canons:
-        domain = canon["error"]["domain"]
-        if domain not in domains_seen:
-            domains_seen.add(domain)
-            url_elem = SubElement(main_urlset, "url")
-            SubElement(url_elem, "loc").text = f"{BASE_URL}/{domain}/"
-            SubElement(url_elem, "lastmod").text = now
-            SubElement(url_elem, "changefreq").text = "weekly"
-            SubElement(url_elem, "priority").text = "0.9"
+    for domain in corpus.by_domain:
+        url_elem = SubElement(main_urlset, "url")
+        SubElement(url_elem, "loc").text = f"{BASE_URL}/{domain}/"
+        SubElement(url_elem, "lastmod").text = now
+        SubElement(url_elem, "changefreq").text = "weekly"
+        SubElement(url_elem, "priority").text = "0.9"
 
     _write_urlset(main_urlset, SITE_DIR / "sitemap-main.xml")
     print("  Generated: sitemap-main.xml")
@@ -424,12 +866,10 @@ def build_sitemap(
 
     xml_declaration = '<?xml version="1.0" encoding="UTF-8"?>\n'
     xml_body = tostring(sitemap_index, encoding="unicode")
-    (SITE_DIR / "sitemap.xml").write_text(
-        xml_declaration + xml_body, encoding="utf-8"
-    )
+    _write_text(SITE_DIR / "sitemap.xml", xml_declaration + xml_body)
     total = sum(
         len(v) for v in summaries_by_domain.values()
-    ) + 2 + len(domains_seen)
+    ) + 2 + len(corpus.by_domain)
     print(f"  Generated: sitemap.xml (index, {total} URLs)")
 
 
@@ -568,7 +1008,7 @@ Sitemap: {BASE_URL}/sitemap.xml
 # Security:        {BASE_URL}/.well-known/security.txt
 # Atom feed:       {BASE_URL}/feed.xml
 """
-    (SITE_DIR / "robots.txt").write_text(content, encoding="utf-8")
+    _write_text(SITE_DIR / "robots.txt", content)
     print("  Generated: robots.txt")
 
 
@@ -603,14 +1043,13 @@ def build_404_page() -> None:
         "</div>\n"
         "</body></html>"
     )
-    (SITE_DIR / "404.html").write_text(html, encoding="utf-8")
+    _write_text(SITE_DIR / "404.html", html)
     print("  Generated: 404.html")
 
 
-
 def build_cname() -> None:
     """Generate CNAME file for custom domain."""
-    (SITE_DIR / "CNAME").write_text("deadends.dev\n", encoding="utf-8")
+    _write_text(SITE_DIR / "CNAME", "deadends.dev\n")
     print("  Generated: CNAME")
 
 
@@ -715,7 +1154,7 @@ def build_stylesheet() -> None:
         "  border-bottom: 1px solid #161b22; }",
         "",
     ])
-    (SITE_DIR / "style.css").write_text(css, encoding="utf-8")
+    _write_text(SITE_DIR / "style.css", css)
     print("  Generated: style.css")
 
 
@@ -772,7 +1211,7 @@ def build_og_image() -> None:
     png += make_chunk(b"IDAT", compressed)
     png += make_chunk(b"IEND", b"")
 
-    (SITE_DIR / "og-image.png").write_bytes(png)
+    _write_bytes(SITE_DIR / "og-image.png", png)
     print("  Generated: og-image.png (1200x630)")
 
 
@@ -786,7 +1225,7 @@ def build_favicon() -> None:
         '<tspan fill="#f85149">&#x2718;</tspan>'
         '</text></svg>'
     )
-    (SITE_DIR / "favicon.svg").write_text(svg, encoding="utf-8")
+    _write_text(SITE_DIR / "favicon.svg", svg)
     print("  Generated: favicon.svg")
 
 
@@ -842,274 +1281,438 @@ def _generate_variations(signature: str, regex: str, domain: str) -> list[str]:
     return variations[:6]  # Limit to 6 variations
 
 
-def build_error_summary_pages(
-    canons: list[dict], jinja_env: Environment
-) -> list[dict]:
-    """Generate environment-agnostic error summary pages.
+def _write_summary_page(
+    template,
+    known_ids: set[str],
+    slug_key: str,
+    slug_canons: list[dict],
+    same_domain: list[dict],
+    env_summaries: list[str],
+) -> list[Path]:
+    """Render one environment-agnostic summary page; return the paths written.
 
-    For each unique error slug (domain/slug), creates a landing page
-    that aggregates all environments. Returns summary metadata for sitemap.
+    env_summaries holds the environment summary of each of slug_canons.
     """
-    template = jinja_env.get_template("error_summary.html")
-    known_ids = {c["id"] for c in canons}
-
-    # Group canons by domain/slug (strip the env part of the id)
-    by_slug: dict[str, list[dict]] = {}
-    for canon in canons:
-        parts = canon["id"].rsplit("/", 1)
-        if len(parts) == 2:
-            slug_key = parts[0]  # e.g., "python/modulenotfounderror"
-        else:
-            continue
-        by_slug.setdefault(slug_key, []).append(canon)
+    domain, slug = slug_key.split("/", 1)
+    page_file = SITE_DIR / domain / slug / "index.html"
+
+    first = slug_canons[0]
+    signature = first["error"]["signature"]
+    regex = first["error"]["regex"]
+
+    environments = []
+    all_dead_ends = []
+    all_workarounds = []
+    verdict_summary = first["verdict"]["summary"]
+
+    for c, env_summary in sorted(
+        zip(slug_canons, env_summaries), key=lambda x: x[0]["id"]
+    ):
+        environments.append({
+            "id": c["id"],
+            "env_summary": env_summary,
+            "resolvable": c["verdict"]["resolvable"],
+            "fix_rate": c["verdict"]["fix_success_rate"],
+            "dead_end_count": len(c["dead_ends"]),
+            "workaround_count": len(c.get("workarounds", [])),
+        })
+        all_dead_ends.extend(c["dead_ends"])
+        all_workarounds.extend(c.get("workarounds", []))
+
+    # Deduplicate dead ends by action (keep highest fail_rate)
+    seen_de: dict[str, dict] = {}
+    for de in all_dead_ends:
+        key = de["action"]
+        if key not in seen_de or de["fail_rate"] > seen_de[key]["fail_rate"]:
+            seen_de[key] = de
+    common_dead_ends = sorted(
+        seen_de.values(), key=lambda x: x["fail_rate"], reverse=True
+    )
 
-    # Build per-domain summary list for cross-linking
-    slug_signatures: dict[str, str] = {}
-    for sk, sc in by_slug.items():
-        slug_signatures[sk] = sc[0]["error"]["signature"]
+    # Deduplicate workarounds by action (keep highest success_rate)
+    seen_wa: dict[str, dict] = {}
+    for wa in all_workarounds:
+        key = wa["action"]
+        if (
+            key not in seen_wa
+            or wa["success_rate"] > seen_wa[key]["success_rate"]
+        ):
+            seen_wa[key] = wa
+    common_workarounds = sorted(
+        seen_wa.values(),
+        key=lambda x: x["success_rate"],
+        reverse=True,
+    )
 
-    summaries = []
-    for slug_key, slug_canons in by_slug.items():
-        domain, slug = slug_key.split("/", 1)
-        first = slug_canons[0]
-        signature = first["error"]["signature"]
-        regex = first["error"]["regex"]
-
-        environments = []
-        all_dead_ends = []
-        all_workarounds = []
-        verdict_summary = first["verdict"]["summary"]
-
-        for c in sorted(slug_canons, key=lambda x: x["id"]):
-            environments.append({
-                "id": c["id"],
-                "env_summary": build_env_summary(c),
-                "resolvable": c["verdict"]["resolvable"],
-                "fix_rate": c["verdict"]["fix_success_rate"],
-                "dead_end_count": len(c["dead_ends"]),
-                "workaround_count": len(c.get("workarounds", [])),
-            })
-            all_dead_ends.extend(c["dead_ends"])
-            all_workarounds.extend(c.get("workarounds", []))
-
-        # Deduplicate dead ends by action (keep highest fail_rate)
-        seen_de: dict[str, dict] = {}
-        for de in all_dead_ends:
-            key = de["action"]
-            if key not in seen_de or de["fail_rate"] > seen_de[key]["fail_rate"]:
-                seen_de[key] = de
-        common_dead_ends = sorted(
-            seen_de.values(), key=lambda x: x["fail_rate"], reverse=True
+    rates = [c["verdict"]["fix_success_rate"] for c in slug_canons]
+    min_rate = int(min(rates) * 100)
+    max_rate = int(max(rates) * 100)
+
+    # Aggregate transition_graph across all environments
+    all_leads_to: dict[str, dict] = {}
+    all_preceded_by: dict[str, dict] = {}
+    all_confused_with: dict[str, dict] = {}
+    for c in slug_canons:
+        graph = c.get("transition_graph", {})
+        for lt in graph.get("leads_to", []):
+            eid = lt["error_id"]
+            existing = all_leads_to.get(eid, {})
+            if lt.get("probability", 0) > existing.get("probability", 0):
+                all_leads_to[eid] = lt
+        for pb in graph.get("preceded_by", []):
+            eid = pb["error_id"]
+            existing = all_preceded_by.get(eid, {})
+            if pb.get("probability", 0) > existing.get("probability", 0):
+                all_preceded_by[eid] = pb
+        for fc in graph.get("frequently_confused_with", []):
+            eid = fc["error_id"]
+            if eid not in all_confused_with:
+                all_confused_with[eid] = fc
+
+    aggregated_graph = {}
+    if all_leads_to:
+        aggregated_graph["leads_to"] = sorted(
+            all_leads_to.values(),
+            key=lambda x: x.get("probability", 0),
+            reverse=True,
         )
-
-        # Deduplicate workarounds by action (keep highest success_rate)
-        seen_wa: dict[str, dict] = {}
-        for wa in all_workarounds:
-            key = wa["action"]
-            if (
-                key not in seen_wa
-                or wa["success_rate"] > seen_wa[key]["success_rate"]
-            ):
-                seen_wa[key] = wa
-        common_workarounds = sorted(
-            seen_wa.values(),
-            key=lambda x: x["success_rate"],
+    if all_preceded_by:
+        aggregated_graph["preceded_by"] = sorted(
+            all_preceded_by.values(),
+            key=lambda x: x.get("probability", 0),
             reverse=True,
         )
+    if all_confused_with:
+        aggregated_graph["frequently_confused_with"] = list(
+            all_confused_with.values()
+        )
 
-        rates = [c["verdict"]["fix_success_rate"] for c in slug_canons]
-        min_rate = int(min(rates) * 100)
-        max_rate = int(max(rates) * 100)
-
-        # Aggregate transition_graph across all environments
-        all_leads_to: dict[str, dict] = {}
-        all_preceded_by: dict[str, dict] = {}
-        all_confused_with: dict[str, dict] = {}
-        for c in slug_canons:
-            graph = c.get("transition_graph", {})
-            for lt in graph.get("leads_to", []):
-                eid = lt["error_id"]
-                existing = all_leads_to.get(eid, {})
-                if lt.get("probability", 0) > existing.get("probability", 0):
-                    all_leads_to[eid] = lt
-            for pb in graph.get("preceded_by", []):
-                eid = pb["error_id"]
-                existing = all_preceded_by.get(eid, {})
-                if pb.get("probability", 0) > existing.get("probability", 0):
-                    all_preceded_by[eid] = pb
-            for fc in graph.get("frequently_confused_with", []):
-                eid = fc["error_id"]
-                if eid not in all_confused_with:
-                    all_confused_with[eid] = fc
-
-        aggregated_graph = {}
-        if all_leads_to:
-            aggregated_graph["leads_to"] = sorted(
-                all_leads_to.values(),
-                key=lambda x: x.get("probability", 0),
-                reverse=True,
-            )
-        if all_preceded_by:
-            aggregated_graph["preceded_by"] = sorted(
-                all_preceded_by.values(),
-                key=lambda x: x.get("probability", 0),
-                reverse=True,
-            )
-        if all_confused_with:
-            aggregated_graph["frequently_confused_with"] = list(
-                all_confused_with.values()
-            )
-
-        # Generate common variations from the regex pattern
-        common_variations = _generate_variations(signature, regex, domain)
+    # Generate common variations from the regex pattern
+    common_variations = _generate_variations(signature, regex, domain)
 
-        # TechArticle JSON-LD for error summary pages
-        dates = [
-            c["verdict"].get("last_updated", "")
-            for c in slug_canons
-        ]
-        first_seen_dates = [
-            c["error"].get("first_seen", "")
-            for c in slug_canons
-            if c["error"].get("first_seen")
-        ]
-        summary_json_ld = json.dumps(
-            {
-                "@context": "https://schema.org",
-                "@type": "TechArticle",
-                "name": signature,
-                "headline": f"Fix {signature}",
-                "description": (
-                    f"{len(environments)} environments, "
-                    f"{len(common_dead_ends)} dead ends, "
-                    f"{len(common_workarounds)} workarounds. "
-                    f"Fix rates: {min_rate}%–{max_rate}%."
-                ),
-                "url": f"{BASE_URL}/{domain}/{slug}/",
-                "datePublished": min(first_seen_dates)
-                if first_seen_dates
-                else "",
-                "dateModified": max(dates) if dates else "",
-                "image": f"{BASE_URL}/og-image.png",
-                "publisher": {
-                    "@type": "Organization",
-                    "name": "deadends.dev",
-                    "url": BASE_URL,
-                },
-                "about": {
-                    "@type": "SoftwareSourceCode",
-                    "programmingLanguage": domain,
-                },
+    # TechArticle JSON-LD for error summary pages
+    dates = [
+        c["verdict"].get("last_updated", "")
+        for c in slug_canons
+    ]
+    first_seen_dates = [
+        c["error"].get("first_seen", "")
+        for c in slug_canons
+        if c["error"].get("first_seen")
+    ]
+    summary_json_ld = json.dumps(
+        {
+            "@context": "https://schema.org",
+            "@type": "TechArticle",
+            "name": signature,
+            "headline": f"Fix {signature}",
+            "description": (
+                f"{len(environments)} environments, "
+                f"{len(common_dead_ends)} dead ends, "
+                f"{len(common_workarounds)} workarounds. "
+                f"Fix rates: {min_rate}%–{max_rate}%."
+            ),
+            "url": f"{BASE_URL}/{domain}/{slug}/",
+            "datePublished": min(first_seen_dates)
+            if first_seen_dates
+            else "",
+            "dateModified": max(dates) if dates else "",
+            "image": f"{BASE_URL}/og-image.png",
+            "publisher": {
+                "@type": "Organization",
+                "name": "deadends.dev",
+                "url": BASE_URL,
             },
-            indent=2,
-            ensure_ascii=False,
-        )
+            "about": {
+                "@type": "SoftwareSourceCode",
+                "programmingLanguage": domain,
+            },
+        },
+        indent=2,
+        ensure_ascii=False,
+    )
 
-        # Same-domain errors for cross-linking (exclude self)
-        same_domain = [
-            {"slug_key": sk, "signature": sig}
-            for sk, sig in slug_signatures.items()
-            if sk.startswith(f"{domain}/") and sk != slug_key
-        ][:10]
+    html = _render_template(
+        template,
+        signature=signature,
+        regex=regex,
+        domain=domain,
+        slug=slug,
+        environments=environments,
+        common_dead_ends=common_dead_ends,
+        common_workarounds=common_workarounds,
+        common_variations=common_variations,
+        total_dead_ends=len(common_dead_ends),
+        total_workarounds=len(common_workarounds),
+        min_rate=min_rate,
+        max_rate=max_rate,
+        summary_json_ld=summary_json_ld,
+        transition_graph=aggregated_graph,
+        known_ids=known_ids,
+        domain_errors=same_domain,
+        verdict_summary=verdict_summary,
+    )
 
-        html = template.render(
-            signature=signature,
-            regex=regex,
-            domain=domain,
-            slug=slug,
-            environments=environments,
-            common_dead_ends=common_dead_ends,
-            common_workarounds=common_workarounds,
-            common_variations=common_variations,
-            total_dead_ends=len(common_dead_ends),
-            total_workarounds=len(common_workarounds),
-            min_rate=min_rate,
-            max_rate=max_rate,
-            summary_json_ld=summary_json_ld,
-            transition_graph=aggregated_graph,
-            known_ids=known_ids,
-            domain_errors=same_domain,
-            verdict_summary=verdict_summary,
-        )
+    # Write to /{domain}/{slug}/index.html
+    _write_text(page_file, html)
+    return [page_file]
 
-        # Write to /{domain}/{slug}/index.html
-        summary_dir = SITE_DIR / domain / slug
-        summary_dir.mkdir(parents=True, exist_ok=True)
-        (summary_dir / "index.html").write_text(html, encoding="utf-8")
-        print(f"  Generated: /{domain}/{slug}/")
 
+def build_error_summary_pages(
+    corpus: CorpusModel,
+    jinja_env: Environment,
+    manifest: BuildManifest | None = None,
+    jobs: int = 1,
+) -> list[dict]:
+    """Generate environment-agnostic error summary pages.
+
+    For each unique error slug (domain/slug), creates a landing page
+    that aggregates all environments. Returns summary metadata for sitemap.
+    With a manifest, pages whose inputs are unchanged are skipped; with
+    jobs > 1, pages render across a process pool.
+    """
+    known_ids = corpus.known_ids
+    slug_signatures = corpus.slug_signatures
+
+    summaries = []
+    pending = []
+    skipped = 0
+    for slug_key, slug_canons in corpus.by_slug.items():
+        domain, slug = slug_key.split("/", 1)
         summaries.append({
             "slug_key": slug_key,
             "url": f"{BASE_URL}/{domain}/{slug}/",
         })
 
+        # Same-domain errors for cross-linking (exclude self)
+        same_domain = [
+            {"slug_key": sk, "signature": slug_signatures[sk]}
+            for sk in corpus.slugs_by_prefix[domain]
+            if sk != slug_key
+        ][:10]
+
+        unit_key = digest = None
+        if manifest is not None:
+            unit_key = f"summary:{slug_key}"
+            digest = manifest.unit_digest(
+                manifest.template_digest("error_summary.html"),
+                [manifest.canon_digest(c) for c in slug_canons],
+                same_domain,
+                _linked_ids(slug_canons, known_ids),
+            )
+            if manifest.is_fresh(unit_key, digest):
+                skipped += 1
+                continue
+
+        pending.append((slug_key, slug_canons, same_domain, unit_key, digest))
+
+    outputs = _render_units(
+        _write_summary_page, "error_summary.html", jinja_env, known_ids,
+        [
+            (slug_key, slug_canons, same_domain,
+             [corpus.env_summary(c) for c in slug_canons])
+            for slug_key, slug_canons, same_domain, _, _ in pending
+        ],
+        jobs,
+    )
+    for (slug_key, _, _, unit_key, digest), paths in zip(pending, outputs):
+        if manifest is not None:
+            manifest.record(unit_key, digest, paths)
+        print(f"  Generated: /{slug_key}/")
+
+    if skipped:
+        print(f"  Unchanged: {skipped} summary page(s) skipped")
     return summaries
 
 
+def _literal_cover(regex: str, min_len: int = 3) -> list[str]:
+    """Literal substrings such that every match of regex contains one of them.
+
+    Runs of literal characters in a sequence are required; groups and
+    mandatory repeats are searched recursively; an alternation is covered
+    by one literal per branch. Of the available covers the one with the
+    longest shortest literal is returned. Returns [] when no cover with
+    literals of at least min_len exists or the pattern does not parse.
+    """
+    try:
+        parsed = sre_parse.parse(regex)
+    except (re.error, RecursionError, OverflowError):
+        return []
+
+    def best(covers: list[list[str]]) -> list[str] | None:
+        usable = [c for c in covers if c and min(map(len, c)) >= min_len]
+        if not usable:
+            return None
+        return max(usable, key=lambda c: (min(map(len, c)), -len(c)))
+
+    def seq_cover(seq) -> list[str] | None:
+        covers: list[list[str]] = []
+        run: list[str] = []
+        for op, arg in seq:
+            if op is sre_constants.LITERAL:
+                run.append(chr(arg))
+                continue
+            if run:
+                covers.append(["".join(run)])
+                run = []
+            sub = None
+            if op is sre_constants.SUBPATTERN:
+                sub = seq_cover(arg[-1])
+            elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+                if arg[0] >= 1:
+                    sub = seq_cover(arg[2])
+            elif op is sre_constants.BRANCH:
+                branch_covers = [seq_cover(b) for b in arg[1]]
+                if all(branch_covers):
+                    sub = sorted({lit for c in branch_covers for lit in c})
+            if sub:
+                covers.append(sub)
+        if run:
+            covers.append(["".join(run)])
+        return best(covers)
+
+    return seq_cover(parsed) or []
+
+
+def _signature_tokens(signature: str) -> set[str]:
+    """Lowercased signature words as the search page splits them (/\\W+/)."""
+    return {w for w in re.split(r"[^a-z0-9_]+", signature.lower()) if len(w) > 2}
+
+
+# Shortest regex literal worth indexing; shorter ones match almost any query
+_SEARCH_MIN_LITERAL = 3
+
+
+def _build_search_index(corpus: CorpusModel) -> tuple[dict, dict[str, list]]:
+    """Build the client search index and its per-domain regex shards.
+
+    Entries are in id order. "tokens" maps each signature word and each
+    literal of a regex's literal cover to the entries containing it, so the
+    page only evaluates regexes of entries whose literal occurs in the query.
+    Regexes without a usable cover are listed in "unfiltered".
+    """
+    domains = corpus.domains
+    domain_idx = {d: i for i, d in enumerate(domains)}
+    entries = []
+    postings: dict[str, list[int]] = {}
+    unfiltered = []
+    shards: dict[str, list] = {d: [] for d in domains}
+    for idx, canon in enumerate(corpus.sorted):
+        error = canon["error"]
+        entries.append([
+            canon["id"],
+            error["signature"],
+            domain_idx[error["domain"]],
+            canon["verdict"]["resolvable"],
+            canon["verdict"]["fix_success_rate"],
+            len(canon["dead_ends"]),
+            len(canon.get("workarounds", [])),
+        ])
+        shards[error["domain"]].append([idx, error["regex"]])
+
+        tokens = _signature_tokens(error["signature"])
+        cover = _literal_cover(error["regex"], _SEARCH_MIN_LITERAL)
+        if cover:
+            tokens.update(lit.lower() for lit in cover)
+        else:
+            unfiltered.append(idx)
+        for token in sorted(tokens):
+            postings.setdefault(token, []).append(idx)
+
+    index = {
+        "version": 1,
+        "fields": [
+            "id", "signature", "domain", "resolvable",
+            "fix_success_rate", "dead_end_count", "workaround_count",
+        ],
+        "domains": domains,
+        "entries": entries,
+        "tokens": dict(sorted(postings.items())),
+        "unfiltered": unfiltered,
+    }
+    return index, shards
+
+
+def _content_name(stem: str, content: str) -> str:
+    """Cache-busting file name: stem plus a 12-char content hash."""
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    return f"{stem}-{digest}.json"
+
+
 def build_search_page(
-    canons: list[dict], jinja_env: Environment
+    corpus: CorpusModel, jinja_env: Environment
 ) -> None:
-    """Generate client-side error matching search page."""
+    """Generate client-side error matching search page.
+
+    The matching data is not inlined: a token posting index and per-domain
+    regex shards are written under /search/ with content-hashed names so
+    they can be cached indefinitely; the page fetches shards on demand.
+    """
     template = jinja_env.get_template("search.html")
+    search_dir = SITE_DIR / "search"
 
-    # Build search data (subset of index for client-side use)
-    search_data = []
-    for canon in sorted(canons, key=lambda c: c["id"]):
-        search_data.append({
-            "id": canon["id"],
-            "signature": canon["error"]["signature"],
-            "regex": canon["error"]["regex"],
-            "domain": canon["error"]["domain"],
-            "resolvable": canon["verdict"]["resolvable"],
-            "fix_success_rate": canon["verdict"]["fix_success_rate"],
-            "dead_end_count": len(canon["dead_ends"]),
-            "workaround_count": len(canon.get("workarounds", [])),
-            "page_url": f"{BASE_PATH}/{canon['id']}",
-        })
+    index, shards = _build_search_index(corpus)
+    shard_names = {}
+    for domain, shard in shards.items():
+        content = json.dumps(shard, ensure_ascii=False, separators=(",", ":"))
+        name = _content_name(f"shard-{domain}", content)
+        _write_text(search_dir / name, content)
+        shard_names[domain] = name
+    index["shards"] = shard_names
+    index_content = json.dumps(index, ensure_ascii=False, separators=(",", ":"))
+    index_name = _content_name("index", index_content)
+    _write_text(search_dir / index_name, index_content)
 
     # Group by domain for the "all errors" section
-    by_domain: dict[str, list[dict]] = {}
-    for entry in search_data:
-        by_domain.setdefault(entry["domain"], []).append(entry)
-
-    domain_errors = [
-        {"name": domain, "errors": errors}
-        for domain, errors in sorted(by_domain.items())
-    ]
+    domain_errors = []
+    for domain in corpus.domains:
+        errors = [
+            {
+                "signature": canon["error"]["signature"],
+                "resolvable": canon["verdict"]["resolvable"],
+                "dead_end_count": len(canon["dead_ends"]),
+                "workaround_count": len(canon.get("workarounds", [])),
+                "page_url": f"{BASE_PATH}/{canon['id']}",
+            }
+            for canon in corpus.sorted_by_domain[domain]
+        ]
+        domain_errors.append({"name": domain, "errors": errors})
 
-    html = template.render(
-        total_errors=len(canons),
-        domain_count=len(by_domain),
+    html = _render_template(
+        template,
+        total_errors=len(corpus),
+        domain_count=len(corpus.domains),
         domain_errors=domain_errors,
-        search_data=json.dumps(search_data, ensure_ascii=False),
+        search_index_url=f"{BASE_PATH}/search/{index_name}",
     )
 
-    search_dir = SITE_DIR / "search"
-    search_dir.mkdir(parents=True, exist_ok=True)
-    (search_dir / "index.html").write_text(html, encoding="utf-8")
-    print("  Generated: /search/")
+    _write_text(search_dir / "index.html", html)
+    print(
+        f"  Generated: /search/ (+ {index_name}, {len(shard_names)} regex shards)"
+    )
 
 
-def build_llms_txt(canons: list[dict]) -> None:
-    """Generate llms.txt (llmstxt.org standard) and llms-full.txt."""
-    # Group by domain for organized listing
-    by_domain: dict[str, list[dict]] = {}
-    for c in canons:
-        by_domain.setdefault(c["error"]["domain"], []).append(c)
+def _llms_entries(corpus: CorpusModel) -> dict[str, list[dict]]:
+    """Canons listed in llms.txt: the first canon of each signature, per domain."""
+    entries = {}
+    for domain in corpus.domains:
+        domain_sigs = {}
+        for c in corpus.sorted_by_domain[domain]:
+            domain_sigs.setdefault(c["error"]["signature"], c)
+        entries[domain] = list(domain_sigs.values())
+    return entries
+
 
-    # Deduplicate signatures for llms.txt (environment-agnostic)
-    seen_signatures: dict[str, dict] = {}
-    for c in sorted(canons, key=lambda x: x["id"]):
-        sig = c["error"]["signature"]
-        if sig not in seen_signatures:
-            seen_signatures[sig] = c
+def build_llms_txt(corpus: CorpusModel) -> None:
+    """Generate llms.txt (llmstxt.org standard) and llms-full.txt."""
+    by_domain = corpus.sorted_by_domain
 
     # llmstxt.org standard format
     lines = [
         "# deadends.dev",
         "",
         "> Structured failure knowledge for AI coding agents. "
-        f"{len(canons)} error entries across {len(by_domain)} domains. "
+        f"{len(corpus)} error entries across {len(by_domain)} domains. "
         "Check dead ends before attempting a fix. "
         "Check workarounds for approaches that actually work.",
         "",
@@ -1152,16 +1755,10 @@ def build_llms_txt(canons: list[dict]) -> None:
         "",
     ]
 
-    for domain in sorted(by_domain.keys()):
-        domain_sigs = {}
-        for c in sorted(by_domain[domain], key=lambda x: x["id"]):
-            sig = c["error"]["signature"]
-            if sig not in domain_sigs:
-                domain_sigs[sig] = c
-
+    for domain, entries in _llms_entries(corpus).items():
         lines.append(f"## {domain}")
         lines.append("")
-        for sig, c in domain_sigs.items():
+        for c in entries:
             slug_key = c["id"].rsplit("/", 1)[0]
             lines.append(
                 f"- [{c['error']['signature']}]"
@@ -1170,14 +1767,20 @@ def build_llms_txt(canons: list[dict]) -> None:
             )
         lines.append("")
 
-    (SITE_DIR / "llms.txt").write_text("\n".join(lines), encoding="utf-8")
+    _write_text(SITE_DIR / "llms.txt", "\n".join(lines))
     print("  Generated: llms.txt")
 
     # llms-full.txt — complete data dump for AI context windows
-    full_lines = [
+    _write_lines(SITE_DIR / "llms-full.txt", _llms_full_lines(corpus))
+    print("  Generated: llms-full.txt")
+
+
+def _llms_full_lines(corpus: CorpusModel) -> Iterator[str]:
+    """Yield the lines of llms-full.txt, one canon section at a time."""
+    yield from [
         "# deadends.dev — Complete Error Database",
         "",
-        f"> {len(canons)} errors across {len(by_domain)} domains. "
+        f"> {len(corpus)} errors across {len(corpus.by_domain)} domains. "
         f"Generated {datetime.now(timezone.utc).strftime('%Y-%m-%d')}.",
         "",
         "## Quick Reference",
@@ -1186,52 +1789,46 @@ def build_llms_txt(canons: list[dict]) -> None:
         "- Full canon: `GET /api/v1/{domain}/{slug}/{env}.json`",
         "",
     ]
-    for canon in sorted(canons, key=lambda c: c["id"]):
-        full_lines.append(f"## {canon['id']}")
-        full_lines.append("")
-        full_lines.append(f"- ERROR: {canon['error']['signature']}")
-        full_lines.append(f"- REGEX: `{canon['error']['regex']}`")
-        full_lines.append(f"- RESOLVABLE: {canon['verdict']['resolvable']}")
-        full_lines.append(
-            f"- FIX_RATE: {canon['verdict']['fix_success_rate']}"
-        )
-        full_lines.append(f"- SUMMARY: {canon['verdict']['summary']}")
-        full_lines.append("")
-        full_lines.append("### Dead Ends")
-        full_lines.append("")
+    for canon in corpus.sorted:
+        yield f"## {canon['id']}"
+        yield ""
+        yield f"- ERROR: {canon['error']['signature']}"
+        yield f"- REGEX: `{canon['error']['regex']}`"
+        yield f"- RESOLVABLE: {canon['verdict']['resolvable']}"
+        yield f"- FIX_RATE: {canon['verdict']['fix_success_rate']}"
+        yield f"- SUMMARY: {canon['verdict']['summary']}"
+        yield ""
+        yield "### Dead Ends"
+        yield ""
         for de in canon["dead_ends"]:
-            full_lines.append(
+            yield (
                 f"- {de['action']} (fail_rate={de['fail_rate']}): "
                 f"{de['why_fails']}"
             )
-        full_lines.append("")
-        full_lines.append("### Workarounds")
-        full_lines.append("")
+        yield ""
+        yield "### Workarounds"
+        yield ""
         for wa in canon.get("workarounds", []):
             how_text = f" — `{wa['how']}`" if wa.get("how") else ""
-            full_lines.append(
+            yield (
                 f"- {wa['action']} "
                 f"(success_rate={wa['success_rate']}){how_text}"
             )
-        full_lines.append("")
+        yield ""
 
-    (SITE_DIR / "llms-full.txt").write_text(
-        "\n".join(full_lines), encoding="utf-8"
-    )
-    print("  Generated: llms-full.txt")
 
+def build_api_index(corpus: CorpusModel) -> None:
+    """Generate /api/v1/index.json — master error index for AI agents.
 
-def build_api_index(canons: list[dict]) -> None:
-    """Generate /api/v1/index.json — master error index for AI agents."""
-    index = {
+    The errors array is encoded and written one entry at a time.
+    """
+    head = {
         "schema_version": "1.0.0",
-        "total": len(canons),
+        "total": len(corpus),
         "generated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "errors": [],
     }
-
-    for canon in sorted(canons, key=lambda c: c["id"]):
-        index["errors"].append({
+    entries = (
+        {
             "id": canon["id"],
             "signature": canon["error"]["signature"],
             "regex": canon["error"]["regex"],
@@ -1244,19 +1841,18 @@ def build_api_index(canons: list[dict]) -> None:
             "workaround_count": len(canon.get("workarounds", [])),
             "api_url": f"{BASE_URL}/api/v1/{canon['id']}.json",
             "page_url": canon["url"],
-        })
-
-    api_dir = SITE_DIR / "api" / "v1"
-    api_dir.mkdir(parents=True, exist_ok=True)
-    (api_dir / "index.json").write_text(
-        json.dumps(index, indent=2, ensure_ascii=False), encoding="utf-8"
+        }
+        for canon in corpus.sorted
     )
+
+    with _open_output(SITE_DIR / "api" / "v1" / "index.json") as f:
+        _write_json_stream(f, head, "errors", entries)
     print("  Generated: /api/v1/index.json")
 
 
-def build_openapi_spec(canons: list[dict]) -> None:
+def build_openapi_spec(corpus: CorpusModel) -> None:
     """Generate OpenAPI 3.1 spec for the JSON API."""
-    domains = sorted({c["error"]["domain"] for c in canons})
+    domains = corpus.domains
     spec = {
         "openapi": "3.1.0",
         "info": {
@@ -1298,7 +1894,7 @@ def build_openapi_spec(canons: list[dict]) -> None:
                                     },
                                     "example": {
                                         "schema_version": "1.0.0",
-                                        "total": len(canons),
+                                        "total": len(corpus),
                                         "errors": [{
                                             "id": "python/modulenotfounderror/py311-linux",
                                             "signature": "ModuleNotFoundError: No module named 'X'",
@@ -1421,6 +2017,43 @@ def build_openapi_spec(canons: list[dict]) -> None:
                     },
                 }
             },
+            "/match-v2.json": {
+                "get": {
+                    "summary": "Columnar error matching with literal prefilters",
+                    "description": (
+                        "Same patterns as /match.json as parallel arrays under "
+                        "'columns' (id, sig, re, domain, ok, rate, conf, de, wa, "
+                        "lit). lit[i] lists lowercased literals one of which every "
+                        "match of re[i] contains; skip re[i] when none occurs in "
+                        "the lowercased message. Also served as .gz (and .br)."
+                    ),
+                    "operationId": "matchErrorsV2",
+                    "responses": {
+                        "200": {
+                            "description": "Columnar matching patterns",
+                            "content": {"application/json": {}},
+                        }
+                    },
+                }
+            },
+            "/manifest.json": {
+                "get": {
+                    "summary": "Content hashes of the bulk API artifacts",
+                    "description": (
+                        "sha256, size and record count per artifact (match.json, "
+                        "match-v2.json, index.json, errors.ndjson, stats.json, "
+                        "llms.txt, llms-full.txt). Hashes exclude build "
+                        "timestamps: skip a download when its hash is unchanged."
+                    ),
+                    "operationId": "getContentManifest",
+                    "responses": {
+                        "200": {
+                            "description": "Artifact content manifest",
+                            "content": {"application/json": {}},
+                        }
+                    },
+                }
+            },
             "/stats.json": {
                 "get": {
                     "summary": "Dataset statistics by domain",
@@ -1587,20 +2220,18 @@ def build_openapi_spec(canons: list[dict]) -> None:
         },
     }
 
-    api_dir = SITE_DIR / "api" / "v1"
-    api_dir.mkdir(parents=True, exist_ok=True)
-    (api_dir / "openapi.json").write_text(
-        json.dumps(spec, indent=2, ensure_ascii=False), encoding="utf-8"
+    _write_text(
+        SITE_DIR / "api" / "v1" / "openapi.json",
+        json.dumps(spec, indent=2, ensure_ascii=False),
     )
     print("  Generated: /api/v1/openapi.json")
 
 
-def build_well_known(canons: list[dict]) -> None:
+def build_well_known(corpus: CorpusModel) -> None:
     """Generate .well-known/ discovery files for AI agents."""
     well_known_dir = SITE_DIR / ".well-known"
-    well_known_dir.mkdir(parents=True, exist_ok=True)
 
-    domains = sorted({c["error"]["domain"] for c in canons})
+    domains = corpus.domains
 
     # ai-plugin.json (OpenAI legacy format)
     plugin = {
@@ -1613,10 +2244,11 @@ def build_well_known(canons: list[dict]) -> None:
         ),
         "description_for_model": (
             "Error knowledge database with "
-            f"{len(canons)} patterns across {len(domains)} domains "
+            f"{len(corpus)} patterns across {len(domains)} domains "
             f"({', '.join(domains)}). "
             "Query flow: (1) GET /api/v1/match.json (350KB, "
-            "load once, regex-match locally). "
+            "load once, regex-match locally; or /api/v1/match-v2.json, "
+            "columnar with per-pattern literal prefilters). "
             "(2) On match, GET /api/v1/{id}.json for full details. "
             "Each error returns: dead_ends[] (what fails, with "
             "fail_rate), workarounds[] (what works, with "
@@ -1636,8 +2268,9 @@ def build_well_known(canons: list[dict]) -> None:
         "legal_info_url": f"{BASE_URL}/",
     }
 
-    (well_known_dir / "ai-plugin.json").write_text(
-        json.dumps(plugin, indent=2, ensure_ascii=False), encoding="utf-8"
+    _write_text(
+        well_known_dir / "ai-plugin.json",
+        json.dumps(plugin, indent=2, ensure_ascii=False),
     )
     print("  Generated: .well-known/ai-plugin.json")
 
@@ -1646,7 +2279,7 @@ def build_well_known(canons: list[dict]) -> None:
         "name": "deadends.dev",
         "description": (
             f"Structured error knowledge database for AI coding agents. "
-            f"{len(canons)} error patterns across {len(domains)} domains "
+            f"{len(corpus)} error patterns across {len(domains)} domains "
             f"({', '.join(domains)}). Query error messages to get dead ends "
             f"(what NOT to try), workarounds (what works with success rates), "
             f"and error transition graphs (what error comes next)."
@@ -1668,7 +2301,7 @@ def build_well_known(canons: list[dict]) -> None:
                 "id": "match-error",
                 "name": "Match Error Message",
                 "description": (
-                    f"Match an error message against {len(canons)} known "
+                    f"Match an error message against {len(corpus)} known "
                     f"patterns across {len(domains)} domains. Returns dead "
                     f"ends, workarounds with success rates, and error chains."
                 ),
@@ -1771,8 +2404,9 @@ def build_well_known(canons: list[dict]) -> None:
         "feedUrl": f"{BASE_URL}/feed.xml",
     }
 
-    (well_known_dir / "agent-card.json").write_text(
-        json.dumps(agent_card, indent=2, ensure_ascii=False), encoding="utf-8"
+    _write_text(
+        well_known_dir / "agent-card.json",
+        json.dumps(agent_card, indent=2, ensure_ascii=False),
     )
     print("  Generated: .well-known/agent-card.json")
 
@@ -1783,90 +2417,245 @@ def build_well_known(canons: list[dict]) -> None:
         "Preferred-Languages: en, ko\n"
         f"Canonical: {BASE_URL}/.well-known/security.txt\n"
     )
-    (well_known_dir / "security.txt").write_text(security_txt, encoding="utf-8")
+    _write_text(well_known_dir / "security.txt", security_txt)
     print("  Generated: .well-known/security.txt")
 
     # Copy MCP Registry domain verification file if it exists
     mcp_auth_src = PROJECT_ROOT / ".well-known" / "mcp-registry-auth"
     if mcp_auth_src.exists():
-        shutil.copy2(mcp_auth_src, well_known_dir / "mcp-registry-auth")
+        _copy_file(mcp_auth_src, well_known_dir / "mcp-registry-auth")
         print("  Generated: .well-known/mcp-registry-auth")
 
 
-def build_stats_json(canons: list[dict]) -> None:
+def build_stats_json(corpus: CorpusModel) -> None:
     """Generate /api/v1/stats.json — dataset statistics for AI coding agents."""
-    domains: dict[str, list[dict]] = {}
-    for c in canons:
-        domains.setdefault(c["error"]["domain"], []).append(c)
-
     domain_stats = {}
-    for domain, dcanons in sorted(domains.items()):
-        rates = [c["verdict"]["fix_success_rate"] for c in dcanons]
-        res = {"true": 0, "partial": 0, "false": 0}
-        conf = {"high": 0, "medium": 0, "low": 0}
-        cats: dict[str, int] = {}
-        for c in dcanons:
-            res[c["verdict"]["resolvable"]] = res.get(c["verdict"]["resolvable"], 0) + 1
-            raw_conf = c["verdict"]["confidence"]
-            if isinstance(raw_conf, (int, float)):
-                conf_label = (
-                    "high" if raw_conf >= 0.8
-                    else "medium" if raw_conf >= 0.5
-                    else "low"
-                )
-            else:
-                conf_label = str(raw_conf)
-            conf[conf_label] = conf.get(conf_label, 0) + 1
-            cat = c["error"]["category"]
-            cats[cat] = cats.get(cat, 0) + 1
-
+    for domain in corpus.domains:
+        ds = corpus.domain_stats[domain]
         domain_stats[domain] = {
-            "count": len(dcanons),
-            "avg_fix_rate": round(sum(rates) / len(rates), 3),
-            "resolvability": res,
-            "confidence": conf,
+            "count": ds["count"],
+            "avg_fix_rate": round(ds["fix_rate_sum"] / ds["count"], 3),
+            "resolvability": ds["resolvability"],
+            "confidence": ds["confidence"],
             "top_categories": dict(
-                sorted(cats.items(), key=lambda x: x[1], reverse=True)[:5]
+                sorted(ds["categories"].items(), key=lambda x: x[1], reverse=True)[:5]
             ),
         }
 
-    all_rates = [c["verdict"]["fix_success_rate"] for c in canons]
     stats = {
         "generated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "total_errors": len(canons),
-        "total_domains": len(domains),
-        "avg_fix_rate": round(sum(all_rates) / len(all_rates), 3),
+        "total_errors": len(corpus),
+        "total_domains": len(corpus.domains),
+        "avg_fix_rate": round(corpus.fix_rate_sum / len(corpus), 3),
         "domains": domain_stats,
     }
 
-    api_dir = SITE_DIR / "api" / "v1"
-    api_dir.mkdir(parents=True, exist_ok=True)
-    (api_dir / "stats.json").write_text(
-        json.dumps(stats, indent=2, ensure_ascii=False), encoding="utf-8"
+    _write_text(
+        SITE_DIR / "api" / "v1" / "stats.json",
+        json.dumps(stats, indent=2, ensure_ascii=False),
     )
     print("  Generated: /api/v1/stats.json")
 
 
-def build_ndjson(canons: list[dict]) -> None:
+def build_ndjson(corpus: CorpusModel) -> None:
     """Generate /api/v1/errors.ndjson — newline-delimited JSON for streaming.
 
     Each line is a complete error canon JSON object. AI agents can stream-process
     this file without buffering the entire dataset into memory.
     """
-    api_dir = SITE_DIR / "api" / "v1"
-    api_dir.mkdir(parents=True, exist_ok=True)
-    lines = []
-    for canon in sorted(canons, key=lambda c: c["id"]):
-        lines.append(json.dumps(canon, ensure_ascii=False, separators=(",", ":")))
-    (api_dir / "errors.ndjson").write_text(
-        "\n".join(lines) + "\n", encoding="utf-8"
+    count = 0
+    with _open_output(SITE_DIR / "api" / "v1" / "errors.ndjson") as f:
+        for canon in corpus.sorted:
+            f.write(json.dumps(canon, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+    print(f"  Generated: /api/v1/errors.ndjson ({count} records)")
+
+
+# Build timestamps embedded in artifacts; masked (first occurrence only) when
+# hashing so an unchanged corpus yields unchanged content hashes.
+_VOLATILE_JSON = re.compile(rb'"generated": ?"[^"]*"')
+_VOLATILE_TEXT = re.compile(rb"Generated \d{4}-\d{2}-\d{2}\.")
+
+
+def _stable_digest(path: Path, volatile: re.Pattern | None = None) -> str:
+    """SHA-256 of a build artifact with its build timestamp masked out."""
+    content = path.read_bytes()
+    if volatile is not None:
+        content = volatile.sub(b"", content, count=1)
+    return hashlib.sha256(content).hexdigest()
+
+
+def build_content_manifest(corpus: CorpusModel) -> None:
+    """Generate /api/v1/manifest.json — stable content hashes of API artifacts.
+
+    Hashes ignore the "generated" timestamps, so agents polling large
+    artifacts can fetch this small file and skip downloads whose sha256 is
+    unchanged. The manifest itself carries no timestamp.
+    """
+    # url path -> (record count, embedded timestamp pattern)
+    artifacts = {
+        "/api/v1/match.json": (len(corpus), _VOLATILE_JSON),
+        "/api/v1/match-v2.json": (len(corpus), _VOLATILE_JSON),
+        "/api/v1/index.json": (len(corpus), _VOLATILE_JSON),
+        "/api/v1/errors.ndjson": (len(corpus), None),
+        "/api/v1/stats.json": (len(corpus.domains), _VOLATILE_JSON),
+        "/llms.txt": (sum(map(len, _llms_entries(corpus).values())), None),
+        "/llms-full.txt": (len(corpus), _VOLATILE_TEXT),
+    }
+    entries = {}
+    for url_path, (records, volatile) in artifacts.items():
+        path = SITE_DIR / url_path.lstrip("/")
+        entries[url_path] = {
+            "url": f"{BASE_URL}{url_path}",
+            "sha256": _stable_digest(path, volatile),
+            "bytes": path.stat().st_size,
+            "records": records,
+        }
+
+    manifest = {
+        "version": "1.0.0",
+        "usage": (
+            "sha256 covers each artifact's content excluding its build timestamp. "
+            "Re-download an artifact only when its sha256 differs from the copy "
+            "you hold; content_hash changes whenever any artifact does."
+        ),
+        "content_hash": _digest({k: e["sha256"] for k, e in entries.items()}),
+        "artifacts": entries,
+    }
+    _write_text(
+        SITE_DIR / "api" / "v1" / "manifest.json",
+        json.dumps(manifest, indent=2, ensure_ascii=False),
     )
-    print(f"  Generated: /api/v1/errors.ndjson ({len(lines)} records)")
+    print(f"  Generated: /api/v1/manifest.json ({len(entries)} artifacts)")
+
+
+# Number of recent delta files kept in the published /api/v1/changes/
+DELTA_HISTORY = 30
+
+
+def _read_published(base: str | Path, name: str) -> bytes | None:
+    """Read /api/v1/changes/<name> of a published site (URL or directory)."""
+    location = str(base)
+    try:
+        if location.startswith(("http://", "https://")):
+            url = f"{location.rstrip('/')}/api/v1/changes/{name}"
+            req = urllib.request.Request(url, headers={"User-Agent": "deadends-dev-build"})
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                return resp.read()
+        return (Path(base) / "api" / "v1" / "changes" / name).read_bytes()
+    except (OSError, ValueError):
+        return None
+
+
+def _delta_records(
+    previous: dict[str, str], current: dict[str, str], canons: dict[str, dict]
+) -> Iterator[dict]:
+    """Yield added/modified/removed records between two canon hash maps, by id."""
+    for cid in sorted(previous.keys() | current.keys()):
+        if cid not in current:
+            yield {"op": "removed", "id": cid}
+        elif cid not in previous:
+            yield {"op": "added", "id": cid, "canon": canons[cid]}
+        elif previous[cid] != current[cid]:
+            yield {"op": "modified", "id": cid, "canon": canons[cid]}
+
+
+def build_changes_feed(
+    corpus: CorpusModel, manifest: BuildManifest, previous_site: str | Path | None = None
+) -> None:
+    """Publish /api/v1/changes/: per-canon hashes and rolling delta files.
+
+    The previous state is read from the last published site (``previous_site``,
+    a URL or directory; default: the existing site/ output), never from the
+    source tree, so a build does not modify tracked data. changes/state.json
+    holds the canon hashes of the published corpus. When the corpus hash
+    differs, <from>-<to>.ndjson is written with one added/modified/removed
+    record per changed canon and prepended to the rolling index.json (last
+    DELTA_HISTORY deltas, carried over from the previous site). Without a
+    previous state only ``latest`` is published; clients then reload the
+    full snapshot.
+    """
+    source = previous_site if previous_site is not None else SITE_DIR
+    changes_dir = SITE_DIR / "api" / "v1" / "changes"
+
+    canons = {c["id"]: c for c in corpus.unique}
+    hashes = {cid: manifest.canon_digest(c) for cid, c in sorted(canons.items())}
+    corpus_hash = _digest(hashes)[:12]
+
+    try:
+        state = json.loads(_read_published(source, "state.json") or b"{}")
+        deltas = json.loads(_read_published(source, "index.json") or b"{}").get("deltas", [])
+    except json.JSONDecodeError:
+        state, deltas = {}, []
+    if not state:
+        print(f"  No previous state at {source}; publishing without a new delta")
+        deltas = []
+
+    # Carry over the previous site's delta files (read before anything is rewritten)
+    bodies: dict[str, bytes] = {}
+    for delta in deltas[:DELTA_HISTORY]:
+        body = _read_published(source, delta["file"])
+        if body is None:
+            print(f"  WARNING: previous delta {delta['file']} unavailable; history truncated")
+            break
+        bodies[delta["file"]] = body
+    deltas = [
+        {k: v for k, v in d.items() if k != "url"}
+        for d in deltas if d["file"] in bodies
+    ]
+
+    previous_hash = state.get("corpus")
+    if previous_hash and previous_hash != corpus_hash:
+        name = f"{previous_hash}-{corpus_hash}.ndjson"
+        counts = {"added": 0, "modified": 0, "removed": 0}
+        lines = []
+        for record in _delta_records(state["canons"], hashes, canons):
+            counts[record["op"]] += 1
+            lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        bodies[name] = "".join(lines).encode("utf-8")
+        deltas = [d for d in deltas if d["file"] != name]
+        deltas.insert(0, {
+            "from": previous_hash,
+            "to": corpus_hash,
+            "file": name,
+            **counts,
+            "created": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        })
+        print(f"  Recorded delta {name}: {counts['added']} added, "
+              f"{counts['modified']} modified, {counts['removed']} removed")
+    deltas = deltas[:DELTA_HISTORY]
+
+    # Files beyond the history are not recorded and go as stale outputs
+    for delta in deltas:
+        _write_bytes(changes_dir / delta["file"], bodies[delta["file"]])
+    _write_text(
+        changes_dir / "state.json",
+        json.dumps({"corpus": corpus_hash, "canons": hashes}, indent=1),
+    )
+    published = {
+        "latest": corpus_hash,
+        "usage": (
+            "Hold a snapshot tagged with a corpus hash. Apply each delta whose "
+            "'from' is your hash (records: added/modified carry the full canon, "
+            "removed only the id) until you reach 'latest'. If no delta starts "
+            "at your hash, reload /api/v1/errors.ndjson. See generator.lookup."
+            "sync_snapshot."
+        ),
+        "full_snapshot": f"{BASE_URL}/api/v1/errors.ndjson",
+        "deltas": [
+            {**d, "url": f"{BASE_URL}/api/v1/changes/{d['file']}"}
+            for d in deltas
+        ],
+    }
+    _write_text(changes_dir / "index.json", json.dumps(published, indent=2))
+    print(f"  Generated: /api/v1/changes/ (latest {corpus_hash}, "
+          f"{len(deltas)} delta(s))")
 
 
-def build_version_json(canons: list[dict]) -> None:
+def build_version_json(corpus: CorpusModel) -> None:
     """Generate /api/v1/version.json — service metadata for AI coding agents."""
-    domains = sorted({c["error"]["domain"] for c in canons})
+    domains = corpus.domains
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     version_data = {
@@ -1878,12 +2667,13 @@ def build_version_json(canons: list[dict]) -> None:
         ),
         "last_updated": now,
         "stats": {
-            "total_errors": len(canons),
+            "total_errors": len(corpus),
             "domains": len(domains),
             "domain_list": domains,
         },
         "endpoints": {
             "match": f"{BASE_URL}/api/v1/match.json",
+            "match_v2": f"{BASE_URL}/api/v1/match-v2.json",
             "index": f"{BASE_URL}/api/v1/index.json",
             "openapi": f"{BASE_URL}/api/v1/openapi.json",
             "version": f"{BASE_URL}/api/v1/version.json",
@@ -1892,6 +2682,8 @@ def build_version_json(canons: list[dict]) -> None:
             "llms_full": f"{BASE_URL}/llms-full.txt",
             "stats": f"{BASE_URL}/api/v1/stats.json",
             "ndjson_stream": f"{BASE_URL}/api/v1/errors.ndjson",
+            "manifest": f"{BASE_URL}/api/v1/manifest.json",
+            "changes": f"{BASE_URL}/api/v1/changes/index.json",
         },
         "discovery": {
             "ai_plugin": f"{BASE_URL}/.well-known/ai-plugin.json",
@@ -1900,15 +2692,14 @@ def build_version_json(canons: list[dict]) -> None:
         },
     }
 
-    api_dir = SITE_DIR / "api" / "v1"
-    api_dir.mkdir(parents=True, exist_ok=True)
-    (api_dir / "version.json").write_text(
-        json.dumps(version_data, indent=2, ensure_ascii=False), encoding="utf-8"
+    _write_text(
+        SITE_DIR / "api" / "v1" / "version.json",
+        json.dumps(version_data, indent=2, ensure_ascii=False),
     )
     print("  Generated: /api/v1/version.json")
 
 
-def build_match_json(canons: list[dict]) -> None:
+def build_match_json(corpus: CorpusModel) -> None:
     """Generate /api/v1/match.json — ultra-lightweight matching file.
 
     Contains only signatures and regexes so AI agents can load the entire
@@ -1917,7 +2708,7 @@ def build_match_json(canons: list[dict]) -> None:
     """
     match_data = {
         "version": "1.0.0",
-        "total": len(canons),
+        "total": len(corpus),
         "generated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         "usage": (
             "Match your error message against the regex patterns below. "
@@ -1926,7 +2717,7 @@ def build_match_json(canons: list[dict]) -> None:
         "patterns": [],
     }
 
-    for canon in sorted(canons, key=lambda c: c["id"]):
+    for canon in corpus.sorted:
         match_data["patterns"].append({
             "id": canon["id"],
             "sig": canon["error"]["signature"],
@@ -1940,16 +2731,89 @@ def build_match_json(canons: list[dict]) -> None:
             "url": f"{BASE_URL}/api/v1/{canon['id']}.json",
         })
 
-    api_dir = SITE_DIR / "api" / "v1"
-    api_dir.mkdir(parents=True, exist_ok=True)
     # Compact JSON to minimize token usage for AI agents
-    (api_dir / "match.json").write_text(
+    _write_text(
+        SITE_DIR / "api" / "v1" / "match.json",
         json.dumps(match_data, separators=(",", ":"), ensure_ascii=False),
-        encoding="utf-8",
     )
     print("  Generated: /api/v1/match.json")
 
 
+# Brotli is optional; without it only the .gz variant is written
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _write_precompressed(path: Path, content: bytes) -> list[str]:
+    """Write .gz (and .br when available) siblings of a build output.
+
+    Compression is deterministic (no gzip timestamp) so unchanged content
+    yields unchanged files. Returns the suffixes written.
+    """
+    written = [".gz"]
+    _write_bytes(
+        path.with_name(path.name + ".gz"),
+        gzip.compress(content, compresslevel=9, mtime=0),
+    )
+    if brotli is not None:
+        _write_bytes(path.with_name(path.name + ".br"), brotli.compress(content))
+        written.append(".br")
+    return written
+
+
+def build_match_v2_json(corpus: CorpusModel) -> None:
+    """Generate /api/v1/match-v2.json — columnar matching file with prefilters.
+
+    Parallel arrays instead of one object per pattern, plus a literal cover
+    per regex ("lit"): lowercased literals of which every match contains at
+    least one. Matchers test a regex only when one of its literals occurs in
+    the lowercased message (or "lit" is empty). See lookup.MatchIndex.
+    """
+    domains = corpus.domains
+    domain_idx = {d: i for i, d in enumerate(domains)}
+    columns: dict[str, list] = {
+        "id": [], "sig": [], "re": [], "domain": [], "ok": [],
+        "rate": [], "conf": [], "de": [], "wa": [], "lit": [],
+    }
+    for canon in corpus.sorted:
+        error = canon["error"]
+        columns["id"].append(canon["id"])
+        columns["sig"].append(error["signature"])
+        columns["re"].append(error["regex"])
+        columns["domain"].append(domain_idx[error["domain"]])
+        columns["ok"].append(canon["verdict"]["resolvable"])
+        columns["rate"].append(canon["verdict"]["fix_success_rate"])
+        columns["conf"].append(canon["verdict"]["confidence"])
+        columns["de"].append(len(canon["dead_ends"]))
+        columns["wa"].append(len(canon.get("workarounds", [])))
+        columns["lit"].append(
+            sorted({lit.lower() for lit in _literal_cover(error["regex"])})
+        )
+
+    match_data = {
+        "version": "2.0.0",
+        "total": len(corpus),
+        "generated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "usage": (
+            "Columnar: row i is id[i], re[i], ... Lowercase your error message; "
+            "test re[i] (case-insensitive) only if lit[i] is empty or one of its "
+            "strings occurs in the message. On match, fetch url_template with "
+            "{id} replaced."
+        ),
+        "url_template": f"{BASE_URL}/api/v1/{{id}}.json",
+        "domains": domains,
+        "columns": columns,
+    }
+
+    path = SITE_DIR / "api" / "v1" / "match-v2.json"
+    content = json.dumps(match_data, separators=(",", ":"), ensure_ascii=False)
+    _write_text(path, content)
+    variants = _write_precompressed(path, content.encode("utf-8"))
+    print(f"  Generated: /api/v1/match-v2.json (+ {', '.join(variants)})")
+
+
 def build_ai_config_files() -> None:
     """Copy AI agent config files to site root.
 
@@ -1957,15 +2821,11 @@ def build_ai_config_files() -> None:
     CLAUDE.md (Claude Code), .cursorrules (Cursor), .windsurfrules (Windsurf),
     AGENTS.md (OpenAI Codex CLI), .clinerules (Cline).
     """
-    config_files = [
-        "CLAUDE.md", ".cursorrules", ".windsurfrules",
-        "AGENTS.md", ".clinerules",
-    ]
     copied = 0
-    for fname in config_files:
+    for fname in AI_CONFIG_FILES:
         src = PROJECT_ROOT / fname
         if src.exists():
-            shutil.copy2(src, SITE_DIR / fname)
+            _copy_file(src, SITE_DIR / fname)
             copied += 1
 
     # Copy .well-known files from project root (MCP Registry domain verification, etc.)
@@ -1973,52 +2833,43 @@ def build_ai_config_files() -> None:
     wellknown_src = PROJECT_ROOT / ".well-known"
     if wellknown_src.is_dir():
         wellknown_dst = SITE_DIR / ".well-known"
-        wellknown_dst.mkdir(parents=True, exist_ok=True)
         for src_file in wellknown_src.iterdir():
             if src_file.is_file():
-                shutil.copy2(src_file, wellknown_dst / src_file.name)
+                _copy_file(src_file, wellknown_dst / src_file.name)
                 copied += 1
 
     print(f"  Copied {copied} AI config files to site/")
 
 
-def build_indexnow(canons: list[dict]) -> None:
+def build_indexnow(corpus: CorpusModel) -> None:
     """Generate IndexNow key file and URL list for search engine notification."""
     # IndexNow key verification file
-    (SITE_DIR / f"{INDEXNOW_KEY}.txt").write_text(
-        INDEXNOW_KEY, encoding="utf-8"
-    )
+    _write_text(SITE_DIR / f"{INDEXNOW_KEY}.txt", INDEXNOW_KEY)
 
     # URL list for IndexNow submission
     urls = [BASE_URL]
     urls.append(f"{BASE_URL}/search/")
 
-    domains_seen = set()
-    for canon in canons:
-        domain = canon["error"]["domain"]
-        if domain not in domains_seen:
-            domains_seen.add(domain)
-            urls.append(f"{BASE_URL}/{domain}/")
+    for domain in corpus.by_domain:
+        urls.append(f"{BASE_URL}/{domain}/")
 
-    for canon in sorted(canons, key=lambda c: c["id"]):
+    for canon in corpus.sorted:
         urls.append(canon["url"])
 
     urls.append(f"{BASE_URL}/api/v1/index.json")
     urls.append(f"{BASE_URL}/llms.txt")
 
-    (SITE_DIR / "indexnow-urls.txt").write_text(
-        "\n".join(urls), encoding="utf-8"
-    )
+    _write_text(SITE_DIR / "indexnow-urls.txt", "\n".join(urls))
     print(f"  Generated: {INDEXNOW_KEY}.txt + indexnow-urls.txt ({len(urls)} URLs)")
 
 
-def build_feed(canons: list[dict]) -> None:
+def build_feed(corpus: CorpusModel) -> None:
     """Generate Atom feed (feed.xml) for AI agent subscriptions."""
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     # Sort by generation date (newest first), take top 50
     dated = sorted(
-        canons,
+        corpus.canons,
         key=lambda c: c["metadata"].get("generation_date", "2020-01-01"),
         reverse=True,
     )[:50]
@@ -2081,27 +2932,21 @@ def build_feed(canons: list[dict]) -> None:
     xml_bytes = tostring(feed, encoding="unicode", xml_declaration=False)
     xml_out = '<?xml version="1.0" encoding="utf-8"?>\n' + xml_bytes
 
-    (SITE_DIR / "feed.xml").write_text(xml_out, encoding="utf-8")
+    _write_text(SITE_DIR / "feed.xml", xml_out)
     print(f"  Generated: feed.xml ({len(dated)} entries)")
 
 
-def main():
-    print("Building deadends.dev static site...\n")
-
-    # Clean and recreate site directory
-    if SITE_DIR.exists():
-        shutil.rmtree(SITE_DIR)
-    SITE_DIR.mkdir(parents=True)
+def _json_escape(s: str) -> Markup:
+    """JSON-safe string for use inside JSON-LD <script> blocks.
+    Returns Markup to bypass Jinja2 autoescape (the value is already
+    properly escaped by json.dumps). Also escapes </ to prevent XSS."""
+    escaped = json.dumps(s)[1:-1]  # strip outer quotes
+    escaped = escaped.replace("</", r"<\/")  # prevent </script> breakout
+    return Markup(escaped)
 
-    # Load canons
-    print("Loading ErrorCanon data...")
-    canons = load_canons(DATA_DIR)
-    if not canons:
-        print("ERROR: No canon data found in data/canons/")
-        sys.exit(1)
-    print(f"  Found {len(canons)} canon(s)\n")
 
-    # Set up Jinja2
+def create_jinja_env() -> Environment:
+    """Create the Jinja2 environment shared by all page templates."""
     jinja_env = Environment(
         loader=FileSystemLoader(str(TEMPLATE_DIR)),
         autoescape=True,
@@ -2109,110 +2954,298 @@ def main():
     jinja_env.globals["base_path"] = BASE_PATH
     jinja_env.globals["base_url"] = BASE_URL
     jinja_env.filters["display_name"] = domain_display_name
-    def _json_escape(s: str) -> Markup:
-        """JSON-safe string for use inside JSON-LD <script> blocks.
-        Returns Markup to bypass Jinja2 autoescape (the value is already
-        properly escaped by json.dumps). Also escapes </ to prevent XSS."""
-        escaped = json.dumps(s)[1:-1]  # strip outer quotes
-        escaped = escaped.replace("</", r"<\/")  # prevent </script> breakout
-        return Markup(escaped)
-
     jinja_env.filters["json_escape"] = _json_escape
+    return jinja_env
 
-    # Build pages
-    print("Generating error pages...")
-    build_error_pages(canons, jinja_env)
-    print()
 
-    print("Generating domain pages...")
-    build_domain_pages(canons, jinja_env)
-    print()
+def _run_stage(manifest: BuildManifest, key: str, inputs: list, fn, *args) -> bool:
+    """Run an aggregate build stage unless its inputs are unchanged.
 
-    print("Generating error summary pages...")
-    summary_urls = build_error_summary_pages(canons, jinja_env)
-    print()
+    Returns True if the stage ran, False if it was skipped.
+    """
+    digest = manifest.unit_digest(*inputs)
+    if manifest.is_fresh(key, digest):
+        print("  Unchanged, skipped")
+        return False
+    start = len(_OUTPUTS)
+    fn(*args)
+    manifest.record(key, digest, _OUTPUTS[start:])
+    return True
+
+
+# Text outputs worth precompressing; smaller files gain little over the
+# per-request overhead of a separate encoding.
+PRECOMPRESS_SUFFIXES = frozenset({
+    ".html", ".json", ".ndjson", ".txt", ".xml", ".css", ".js", ".svg", ".md",
+})
+PRECOMPRESS_MIN_BYTES = 1024
+
+
+def _compress_file(path: Path) -> tuple[int, int, int | None]:
+    """Write .gz/.br siblings of one file; return the (raw, gz, br) sizes."""
+    content = path.read_bytes()
+    suffixes = _write_precompressed(path, content)
+    sizes = {
+        suffix: path.with_name(path.name + suffix).stat().st_size
+        for suffix in suffixes
+    }
+    return len(content), sizes[".gz"], sizes.get(".br")
 
-    print("Generating search page...")
-    build_search_page(canons, jinja_env)
-    print()
 
-    print("Generating index page...")
-    build_index_page(canons, jinja_env)
-    print()
+def precompress_outputs(manifest: BuildManifest, jobs: int = 1) -> dict:
+    """Write .gz (and .br) siblings for every tracked text output.
 
-    print("Generating sitemap.xml...")
-    build_sitemap(canons, summary_urls)
-    print()
+    Runs after all other stages. Each file is a unit keyed on its content
+    hash, so only files whose bytes changed since the last build are
+    recompressed; siblings of removed outputs are deleted as stale outputs.
+    Outputs that ship their own siblings (match-v2.json) are left alone.
+    """
+    outputs = {p for e in manifest.entries.values() for p in e["outputs"]}
+    sources = sorted(
+        rel for rel in outputs
+        if Path(rel).suffix in PRECOMPRESS_SUFFIXES and f"{rel}.gz" not in outputs
+    )
+    pending: list[tuple[str, str]] = []
+    fresh = 0
+    for rel in sources:
+        path = SITE_DIR / rel
+        if path.stat().st_size < PRECOMPRESS_MIN_BYTES:
+            continue
+        digest = _digest("precompress", _file_digest(path), brotli is not None)
+        if manifest.is_fresh(f"gz:{rel}", digest):
+            fresh += 1
+        else:
+            pending.append((rel, digest))
+
+    paths = [SITE_DIR / rel for rel, _ in pending]
+    pooled = jobs > 1 and len(paths) > 1
+    if pooled:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(
+                _compress_file, paths, chunksize=max(1, len(paths) // (jobs * 4))
+            ))
+    else:
+        results = [_compress_file(path) for path in paths]
+
+    files = []
+    for (rel, digest), (raw, gz, br) in zip(pending, results):
+        written = [SITE_DIR / f"{rel}.gz"]
+        if br is not None:
+            written.append(SITE_DIR / f"{rel}.br")
+        if pooled:  # serial writes were already tracked by _write_bytes
+            _OUTPUTS.extend(written)
+        manifest.record(f"gz:{rel}", digest, written)
+        files.append({
+            "path": rel,
+            "bytes": raw,
+            "gz_bytes": gz,
+            "br_bytes": br,
+            "gz_ratio": round(gz / raw, 4),
+            "br_ratio": round(br / raw, 4) if br is not None else None,
+        })
 
-    print("Generating robots.txt...")
-    build_robots_txt()
-    print()
+    raw_total = sum(f["bytes"] for f in files)
+    if files:
+        print(f"  Compressed {len(files)} file(s), {fresh} unchanged"
+              + ("" if brotli is not None else " (brotli not installed: .gz only)"))
+        for f in sorted(files, key=lambda f: f["bytes"], reverse=True)[:10]:
+            br_part = f"  br {f['br_ratio']:.1%}" if f["br_ratio"] is not None else ""
+            print(f"    {f['path']:<48} {f['bytes']:>10,d} B  gz {f['gz_ratio']:.1%}{br_part}")
+    else:
+        print(f"  Unchanged, skipped ({fresh} file(s))")
+    return {
+        "compressed": len(files),
+        "unchanged": fresh,
+        "bytes": raw_total,
+        "gz_bytes": sum(f["gz_bytes"] for f in files),
+        "br_bytes": sum(f["br_bytes"] or 0 for f in files),
+        "files": files,
+    }
 
-    print("Generating 404.html...")
-    build_404_page()
-    print()
 
-    print("Generating CNAME...")
-    build_cname()
-    print()
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Build deadends.dev static site")
+    parser.add_argument(
+        "--clean", action="store_true",
+        help="Delete site/ and rebuild everything (default: incremental)",
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, metavar="N",
+        help="Render pages across N processes (0 = all CPU cores)",
+    )
+    parser.add_argument(
+        "--report", type=Path, metavar="PATH",
+        help="Write a JSON timing/memory/output report per build stage",
+    )
+    parser.add_argument(
+        "--profile", type=Path, metavar="PATH",
+        help="Write a cProfile dump of the whole build (view with pstats/snakeviz)",
+    )
+    parser.add_argument(
+        "--precompress", action="store_true",
+        help="Write max-level .gz/.br siblings of text outputs (changed files only)",
+    )
+    parser.add_argument(
+        "--previous-site", metavar="URL_OR_DIR",
+        help="Published site to diff the changes feed against (default: site/)",
+    )
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
-    print("Generating llms.txt + llms-full.txt...")
-    build_llms_txt(canons)
-    print()
+    profiler = BuildProfiler(_OUTPUTS)
+    _TEMPLATE_TIMES.clear()
+    if args.profile:
+        import cProfile
 
-    print("Generating API index...")
-    build_api_index(canons)
-    print()
+        prof = cProfile.Profile()
+        canons = prof.runcall(
+            _build, args.clean, jobs, profiler, args.precompress, args.previous_site
+        )
+        args.profile.parent.mkdir(parents=True, exist_ok=True)
+        prof.dump_stats(str(args.profile))
+        print(f"cProfile stats written to {args.profile}")
+    else:
+        canons = _build(args.clean, jobs, profiler, args.precompress, args.previous_site)
+
+    if args.report:
+        profiler.write_report(
+            args.report,
+            templates=_TEMPLATE_TIMES,
+            canons=len(canons),
+            jobs=jobs,
+        )
+        profiler.print_summary()
+        print(f"Build report written to {args.report}")
 
-    print("Generating OpenAPI spec...")
-    build_openapi_spec(canons)
-    print()
 
-    print("Generating .well-known/ai-plugin.json...")
-    build_well_known(canons)
-    print()
+def _build(
+    clean: bool,
+    jobs: int,
+    profiler: BuildProfiler,
+    precompress: bool = False,
+    previous_site: str | None = None,
+) -> list[dict]:
+    """Run every build stage; returns the loaded canons."""
+    print("Building deadends.dev static site...\n")
 
-    print("Generating match.json (lightweight AI matching)...")
-    build_match_json(canons)
-    print()
+    if clean and SITE_DIR.exists():
+        shutil.rmtree(SITE_DIR)
+    SITE_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = BuildManifest.load(SITE_DIR)
+    if manifest.previous:
+        print(f"Incremental build ({len(manifest.previous)} units in manifest)\n")
+    else:
+        print("Full build (no previous build manifest)\n")
 
-    print("Generating version.json...")
-    build_version_json(canons)
-    print()
+    # Load canons
+    print("Loading ErrorCanon data...")
+    with profiler.stage("load"):
+        canons = load_canons(DATA_DIR)
+    if not canons:
+        print("ERROR: No canon data found in data/canons/")
+        sys.exit(1)
+    print(f"  Found {len(canons)} canon(s)\n")
 
-    print("Generating stats.json...")
-    build_stats_json(canons)
-    print()
+    # Groupings and aggregates shared by every stage below
+    with profiler.stage("corpus-model"):
+        corpus = CorpusModel(canons)
 
-    print("Generating errors.ndjson (streaming)...")
-    build_ndjson(canons)
-    print()
+    jinja_env = create_jinja_env()
 
-    print("Generating Atom feed...")
-    build_feed(canons)
+    # Build pages (skipped per page when unchanged)
+    print("Generating error pages...")
+    with profiler.stage("error-pages"):
+        build_error_pages(corpus, jinja_env, manifest, jobs)
     print()
 
-    print("Generating IndexNow support...")
-    build_indexnow(canons)
+    print("Generating domain pages...")
+    with profiler.stage("domain-pages"):
+        build_domain_pages(corpus, jinja_env, manifest)
     print()
 
-    print("Generating shared stylesheet...")
-    build_stylesheet()
+    print("Generating error summary pages...")
+    with profiler.stage("summary-pages"):
+        summary_urls = build_error_summary_pages(corpus, jinja_env, manifest, jobs)
     print()
 
-    print("Generating OG image for social sharing...")
-    build_og_image()
-    print()
+    # Aggregate stages (skipped as a whole when their inputs are unchanged)
+    corpus_digest = manifest.corpus_digest(canons)
+    well_known_src = PROJECT_ROOT / ".well-known"
+    config_inputs = [
+        _file_digest(PROJECT_ROOT / fname) for fname in AI_CONFIG_FILES
+    ] + [
+        [f.name, _file_digest(f)]
+        for f in sorted(well_known_src.glob("*"))
+        if f.is_file()
+    ]
+    stages = [
+        ("Generating search page...", "search",
+         [manifest.template_digest("search.html"), corpus_digest],
+         build_search_page, (corpus, jinja_env)),
+        ("Generating index page...", "index",
+         [manifest.template_digest("index.html"), corpus_digest],
+         build_index_page, (corpus, jinja_env)),
+        ("Generating sitemap.xml...", "sitemap",
+         [corpus_digest], build_sitemap, (corpus, summary_urls)),
+        ("Generating robots.txt...", "robots", [], build_robots_txt, ()),
+        ("Generating 404.html...", "404", [], build_404_page, ()),
+        ("Generating CNAME...", "cname", [], build_cname, ()),
+        ("Generating llms.txt + llms-full.txt...", "llms",
+         [corpus_digest], build_llms_txt, (corpus,)),
+        ("Generating API index...", "api-index",
+         [corpus_digest], build_api_index, (corpus,)),
+        ("Generating OpenAPI spec...", "openapi",
+         [corpus_digest], build_openapi_spec, (corpus,)),
+        ("Generating .well-known/ai-plugin.json...", "well-known",
+         [corpus_digest, config_inputs], build_well_known, (corpus,)),
+        ("Generating match.json (lightweight AI matching)...", "match",
+         [corpus_digest], build_match_json, (corpus,)),
+        ("Generating match-v2.json (columnar, literal prefilters)...", "match-v2",
+         [corpus_digest, brotli is not None], build_match_v2_json, (corpus,)),
+        ("Generating version.json...", "version",
+         [corpus_digest], build_version_json, (corpus,)),
+        ("Generating stats.json...", "stats",
+         [corpus_digest], build_stats_json, (corpus,)),
+        ("Generating errors.ndjson (streaming)...", "ndjson",
+         [corpus_digest], build_ndjson, (corpus,)),
+        ("Generating API content manifest...", "content-manifest",
+         [corpus_digest], build_content_manifest, (corpus,)),
+        ("Generating delta feed of changed canons...", "changes",
+         [corpus_digest, previous_site], build_changes_feed,
+         (corpus, manifest, previous_site)),
+        ("Generating Atom feed...", "feed", [corpus_digest], build_feed, (corpus,)),
+        ("Generating IndexNow support...", "indexnow",
+         [corpus_digest], build_indexnow, (corpus,)),
+        ("Generating shared stylesheet...", "stylesheet",
+         [], build_stylesheet, ()),
+        ("Generating OG image for social sharing...", "og-image",
+         [], build_og_image, ()),
+        ("Generating favicon...", "favicon", [], build_favicon, ()),
+        ("Copying AI agent config files...", "ai-config",
+         [config_inputs], build_ai_config_files, ()),
+    ]
+    for title, key, inputs, fn, fn_args in stages:
+        print(title)
+        with profiler.stage(key) as record:
+            record["skipped"] = not _run_stage(
+                manifest, f"stage:{key}", inputs, fn, *fn_args
+            )
+        print()
 
-    print("Generating favicon...")
-    build_favicon()
-    print()
+    if precompress:
+        print("Precompressing text outputs (.gz/.br)...")
+        with profiler.stage("precompress") as record:
+            record.update(precompress_outputs(manifest, jobs))
+        print()
 
-    print("Copying AI agent config files...")
-    build_ai_config_files()
-    print()
+    # Outputs whose inputs are gone (deleted canons, renamed slugs, ...)
+    stale = manifest.remove_stale_outputs()
+    if stale:
+        print(f"Removed {len(stale)} stale output file(s)")
+    manifest.save()
 
     print(f"Build complete! {len(canons)} error pages generated in site/")
+    return canons
 
 
 if __name__ == "__main__":
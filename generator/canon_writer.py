@@ -0,0 +1,239 @@
+"""Crash-safe, batched writes of canon files into data/canons.
+
+CanonWriter stages each canon as a hidden temp file next to its target and
+commits staged files in batches: fsync the batch, rename every file into
+place, fsync the directories, then atomically replace the manifest. An
+interrupted run leaves whole old or whole new files (never half-written
+JSON), and readers only ever see a manifest whose hashes match the files on
+disk. Files whose bytes would not change are not rewritten.
+
+The manifest lives next to the canon directory (data/.canons-manifest.json),
+so loaders that glob ``data/canons/**/*.json`` never pick it up:
+
+    {"generation": 12, "updated": "2026-01-01T00:00:00+00:00",
+     "files": {"python/keyerror/py311-linux.json": "<sha256[:16]>", ...}}
+
+``generation`` increases with every commit; long-running readers can poll it
+to notice new data. One writer per canon directory at a time.
+
+Usage:
+    python -m generator.canon_writer        # rebuild the manifest from disk
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CANONS_DIR = PROJECT_ROOT / "data" / "canons"
+
+DEFAULT_BATCH_SIZE = 100
+# Temp files older than this were left by a crashed writer
+STALE_TEMP_S = 3600.0
+
+
+def manifest_path(root: Path = CANONS_DIR) -> Path:
+    root = Path(root)
+    return root.parent / f".{root.name}-manifest.json"
+
+
+def file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def serialize(canon: dict) -> bytes:
+    """Canonical on-disk form of a canon (2-space JSON, trailing newline)."""
+    return (json.dumps(canon, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def build_manifest(root: Path = CANONS_DIR) -> dict:
+    """Hash every canon file under ``root`` (used when no manifest exists yet)."""
+    root = Path(root)
+    files = {
+        path.relative_to(root).as_posix(): file_hash(path.read_bytes())
+        for path in sorted(root.rglob("*.json"))
+    }
+    return {"generation": 0, "updated": None, "files": files}
+
+
+def load_manifest(root: Path = CANONS_DIR) -> dict | None:
+    try:
+        return json.loads(manifest_path(root).read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def write_manifest(manifest: dict, root: Path = CANONS_DIR) -> None:
+    """Atomically replace the manifest of ``root`` (temp file, fsync, rename)."""
+    path = manifest_path(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write("\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(path.parent)
+
+
+def _fsync_path(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(path: Path) -> None:
+    # Directories cannot be opened for fsync on Windows; renames are durable there
+    if os.name != "nt":
+        _fsync_path(path)
+
+
+class CanonWriter:
+    """Stage canon files and commit them atomically every ``batch_size`` files.
+
+    Use as a context manager; whatever is staged is committed on exit.
+    ``on_commit`` callbacks passed to ``write`` run once that file is durably
+    in place, so callers can record completion (e.g. in the pipeline state
+    store) only for output that survives a crash. Thread-safe.
+    """
+
+    def __init__(self, root: Path = CANONS_DIR, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.root = Path(root)
+        self.manifest_path = manifest_path(self.root)
+        self.batch_size = max(1, batch_size)
+        self.written = 0
+        self.unchanged = 0
+        self._manifest: dict | None = None
+        self._rehash = False
+        self._pending: list[tuple[Path, Path, str, Callable[[], None] | None]] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            self.commit()
+        finally:
+            self._discard()
+
+    def write(self, path: Path, canon: dict,
+              on_commit: Callable[[], None] | None = None) -> bool:
+        """Stage ``canon`` for ``path`` (under root). False if already identical."""
+        path = Path(path)
+        data = serialize(canon)
+        try:
+            current = path.read_bytes()
+        except FileNotFoundError:
+            current = None
+        if current == data:
+            with self._lock:
+                self.unchanged += 1
+            if on_commit is not None:
+                on_commit()
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}-{next(self._seq)}.tmp")
+        tmp.write_bytes(data)
+        with self._lock:
+            self._pending.append((path, tmp, file_hash(data), on_commit))
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self.commit()
+        return True
+
+    def commit(self) -> int:
+        """Make every staged file durable and visible; returns how many."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            manifest = self._load()
+            try:
+                for _, tmp, _, _ in batch:
+                    _fsync_path(tmp)
+                for path, tmp, digest, _ in batch:
+                    os.replace(tmp, path)
+                    manifest["files"][path.relative_to(self.root).as_posix()] = digest
+                for directory in {path.parent for path, _, _, _ in batch}:
+                    _fsync_dir(directory)
+                manifest["generation"] += 1
+                manifest["updated"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+                write_manifest(manifest, self.root)
+            except BaseException:
+                # Files renamed so far are whole; the rest of the batch is dropped
+                # and the manifest is rebuilt from disk (now, or on the next commit)
+                for _, tmp, _, _ in batch:
+                    tmp.unlink(missing_ok=True)
+                self._manifest = None
+                self._rehash = True
+                try:
+                    self._load()["generation"] = manifest["generation"] + 1
+                    write_manifest(self._manifest, self.root)
+                except OSError:
+                    self._manifest = None
+                    self._rehash = True
+                raise
+            self.written += len(batch)
+        for _, _, _, on_commit in batch:
+            if on_commit is not None:
+                on_commit()
+        return len(batch)
+
+    def _load(self) -> dict:
+        if self._manifest is None:
+            self._clean_stale_temps()
+            manifest = load_manifest(self.root)
+            if manifest is None or self._rehash:
+                rebuilt = build_manifest(self.root)
+                rebuilt["generation"] = (manifest or rebuilt)["generation"]
+                manifest = rebuilt
+                self._rehash = False
+            self._manifest = manifest
+        return self._manifest
+
+    def _discard(self) -> None:
+        """Drop staged files that were never committed (after a failed commit)."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        for _, tmp, _, _ in batch:
+            tmp.unlink(missing_ok=True)
+
+    def _clean_stale_temps(self) -> None:
+        cutoff = time.time() - STALE_TEMP_S
+        for tmp in self.root.rglob(".*.tmp"):
+            try:
+                if tmp.stat().st_mtime < cutoff:
+                    tmp.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the canon manifest from disk")
+    parser.add_argument("--root", type=Path, default=CANONS_DIR, help="Canon directory")
+    args = parser.parse_args()
+
+    previous = load_manifest(args.root)
+    manifest = build_manifest(args.root)
+    manifest["generation"] = (previous or {}).get("generation", 0) + 1
+    manifest["updated"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    write_manifest(manifest, args.root)
+    print(f"Wrote {manifest_path(args.root)} ({len(manifest['files'])} files, "
+          f"generation {manifest['generation']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,51 @@
 """Step 3: Collect evidence for error-environment pairs.
 
 Uses StackOverflow API and GitHub API to collect related questions, answers,
-and issues for each error-environment pair.
+and issues for each error-environment pair. Pairs are collected concurrently
+(--workers in flight) behind one rate limiter per API, and answers are
+fetched for up to 100 questions per request across pairs; evidence files
+are written as batches complete. Pairs are streamed from the input (a file
+or ``-`` for stdin) and claimed lazily, so --limit and --resume never load
+the whole pairs file. Responses go through the shared on-disk HTTP
+cache, so re-runs only revalidate (see generator.api_client.HttpCache).
 
 Output: data/pipeline/evidence/{pair_id}.json
 
 Usage:
-    python -m generator.collect_evidence [--input pairs.jsonl] [--resume]
+    python -m generator.collect_evidence [--input pairs.jsonl] [--resume] [--workers 8]
 """
 
 import argparse
+import itertools
 import json
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 import requests
 
+from generator.api_client import (
+    GH_API_BASE,
+    SO_API_BASE,
+    ApiClient,
+    add_cache_arguments,
+    cache_from_args,
+    make_clients,
+)
+from generator.jsonl import iter_jsonl
+from generator.pipeline_state import PipelineState, add_state_arguments
+
 PROJECT_ROOT = Path(__file__).parent.parent
 PIPELINE_DIR = PROJECT_ROOT / "data" / "pipeline"
 PAIRS_FILE = PIPELINE_DIR / "pairs.jsonl"
 EVIDENCE_DIR = PIPELINE_DIR / "evidence"
 
-SO_API_BASE = "https://api.stackexchange.com/2.3"
-GH_API_BASE = "https://api.github.com"
-
-# Rate limiting config
+# Rate limiting config (per API, shared by all workers)
 SO_REQUESTS_PER_SECOND = 0.5  # Conservative
 GH_REQUESTS_PER_SECOND = 1.0
+DEFAULT_WORKERS = 8
+SO_IDS_PER_REQUEST = 100  # StackExchange limit for semicolon-separated id lists
 
 # Domain → search terms for finding related content
 DOMAIN_SEARCH_CONFIG = {
@@ -57,9 +76,12 @@ DOMAIN_SEARCH_CONFIG = {
 }
 
 
-def search_so(query: str, tags: list[str], so_key: str | None = None,
-              pagesize: int = 10) -> list[dict]:
-    """Search StackOverflow for questions matching the query."""
+def search_so(client: ApiClient, query: str, tags: list[str],
+              pagesize: int = 10, errors: list[str] | None = None) -> list[dict]:
+    """Search StackOverflow for questions matching the query.
+
+    Request failures are printed (and appended to ``errors`` if given).
+    """
     params = {
         "order": "desc",
         "sort": "relevance",
@@ -69,59 +91,62 @@ def search_so(query: str, tags: list[str], so_key: str | None = None,
         "site": "stackoverflow",
         "pagesize": pagesize,
     }
-    if so_key:
-        params["key"] = so_key
 
     try:
-        resp = requests.get(f"{SO_API_BASE}/search/advanced", params=params, timeout=30)
-        resp.raise_for_status()
-        data = resp.json()
-
-        if data.get("backoff"):
-            time.sleep(data["backoff"])
-
-        return data.get("items", [])
+        return client.get_json("/search/advanced", params).get("items", [])
     except requests.RequestException as e:
         print(f"    SO search failed: {e}")
+        if errors is not None:
+            errors.append(f"SO search failed: {e}")
         return []
 
 
-def fetch_so_answers(question_id: int, so_key: str | None = None) -> list[dict]:
-    """Fetch answers for a StackOverflow question."""
-    params = {
-        "order": "desc",
-        "sort": "votes",
-        "filter": "withbody",
-        "site": "stackoverflow",
-    }
-    if so_key:
-        params["key"] = so_key
-
-    try:
-        resp = requests.get(
-            f"{SO_API_BASE}/questions/{question_id}/answers",
-            params=params,
-            timeout=30,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-
-        if data.get("backoff"):
-            time.sleep(data["backoff"])
-
-        return data.get("items", [])
-    except requests.RequestException as e:
-        print(f"    SO answers fetch failed: {e}")
-        return []
-
-
-def search_gh_issues(query: str, repo: str, gh_token: str | None = None,
-                     per_page: int = 10) -> list[dict]:
-    """Search GitHub issues for a query within a specific repo."""
-    headers = {"Accept": "application/vnd.github+json"}
-    if gh_token:
-        headers["Authorization"] = f"Bearer {gh_token}"
-
+def fetch_so_answers(client: ApiClient, question_ids: Iterable[int],
+                     errors: dict[int, str] | None = None) -> dict[int, list[dict]]:
+    """Fetch answers for many StackOverflow questions, grouped by question id.
+
+    Ids are sorted and go out SO_IDS_PER_REQUEST at a time as
+    ``/questions/{id;id;...}/answers`` (following ``has_more`` pages), so the
+    same questions always make the same, cacheable requests. Answers keep the
+    API's vote order. A failed batch is printed, its questions get no
+    answers, and each of its ids is mapped to the error in ``errors`` if given.
+    """
+    ids = sorted(set(question_ids))
+    answers: dict[int, list[dict]] = {qid: [] for qid in ids}
+    for start in range(0, len(ids), SO_IDS_PER_REQUEST):
+        chunk = ids[start:start + SO_IDS_PER_REQUEST]
+        batch = ";".join(map(str, chunk))
+        params = {
+            "order": "desc",
+            "sort": "votes",
+            "filter": "withbody",
+            "site": "stackoverflow",
+            "pagesize": 100,
+        }
+        page = 1
+        try:
+            while True:
+                data = client.get_json(f"/questions/{batch}/answers", {**params, "page": page})
+                for a in data.get("items", []):
+                    answers.setdefault(a["question_id"], []).append(a)
+                if not data.get("has_more"):
+                    break
+                page += 1
+        except requests.RequestException as e:
+            print(f"    SO answers fetch failed: {e}")
+            for qid in chunk:
+                answers[qid] = []
+                if errors is not None:
+                    errors[qid] = f"SO answers fetch failed: {e}"
+    return answers
+
+
+def search_gh_issues(client: ApiClient, query: str, repo: str,
+                     per_page: int = 10, errors: list[str] | None = None) -> list[dict]:
+    """Search GitHub issues for a query within a specific repo.
+
+    Request failures are printed (and appended to ``errors`` if given).
+    """
     params = {
         "q": f"{query} repo:{repo} is:issue",
         "sort": "reactions",
@@ -130,22 +155,23 @@ def search_gh_issues(query: str, repo: str, gh_token: str | None = None,
     }
 
     try:
-        resp = requests.get(
-            f"{GH_API_BASE}/search/issues",
-            headers=headers,
-            params=params,
-            timeout=30,
-        )
-        resp.raise_for_status()
-        return resp.json().get("items", [])
+        return client.get_json("/search/issues", params).get("items", [])
     except requests.RequestException as e:
         print(f"    GH search failed: {e}")
+        if errors is not None:
+            errors.append(f"GH search failed ({repo}): {e}")
         return []
 
 
-def collect_evidence_for_pair(pair: dict, so_key: str | None = None,
-                              gh_token: str | None = None) -> dict:
-    """Collect all available evidence for a single error-environment pair."""
+def collect_evidence_for_pair(pair: dict, clients: dict[str, ApiClient],
+                              answers: bool = True) -> dict:
+    """Collect all available evidence for a single error-environment pair.
+
+    Request pacing is left to the clients' rate limiters. With
+    ``answers=False`` answered questions are left for attach_answers, so
+    callers can fetch answers for many pairs in one batch. Failed searches
+    are listed under "errors" (absent when every search succeeded).
+    """
     domain = pair["signature"]["domain"]
     signature = pair["signature"]["signature"]
     config = DOMAIN_SEARCH_CONFIG.get(domain, {"so_tags": [], "gh_repos": []})
@@ -159,17 +185,17 @@ def collect_evidence_for_pair(pair: dict, so_key: str | None = None,
         "github_issues": [],
         "collection_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
     }
+    errors: list[str] = []
 
     # Search StackOverflow
     so_tags = config.get("so_tags", [])
     if so_tags:
         # Extract key words from signature for search
         search_query = signature[:200]  # SO query length limit
-        questions = search_so(search_query, so_tags, so_key=so_key, pagesize=5)
-        time.sleep(1 / SO_REQUESTS_PER_SECOND)
+        questions = search_so(clients["so"], search_query, so_tags, pagesize=5, errors=errors)
 
         for q in questions:
-            q_data = {
+            evidence["stackoverflow"].append({
                 "question_id": q["question_id"],
                 "title": q.get("title", ""),
                 "body": q.get("body", "")[:2000],  # Truncate for storage
@@ -180,28 +206,13 @@ def collect_evidence_for_pair(pair: dict, so_key: str | None = None,
                 "link": q.get("link", ""),
                 "tags": q.get("tags", []),
                 "answers": [],
-            }
-
-            # Fetch top answers if the question has them
-            if q.get("answer_count", 0) > 0:
-                answers = fetch_so_answers(q["question_id"], so_key=so_key)
-                time.sleep(1 / SO_REQUESTS_PER_SECOND)
-
-                for a in answers[:3]:  # Top 3 answers
-                    q_data["answers"].append({
-                        "answer_id": a.get("answer_id"),
-                        "body": a.get("body", "")[:2000],
-                        "score": a.get("score", 0),
-                        "is_accepted": a.get("is_accepted", False),
-                    })
-
-            evidence["stackoverflow"].append(q_data)
+            })
 
     # Search GitHub Issues
     for repo in config.get("gh_repos", []):
         search_query = signature[:256]
-        issues = search_gh_issues(search_query, repo, gh_token=gh_token, per_page=5)
-        time.sleep(1 / GH_REQUESTS_PER_SECOND)
+        issues = search_gh_issues(clients["gh"], search_query, repo, per_page=5,
+                                  errors=errors)
 
         for issue in issues:
             evidence["github_issues"].append({
@@ -217,69 +228,213 @@ def collect_evidence_for_pair(pair: dict, so_key: str | None = None,
 
     total = len(evidence["stackoverflow"]) + len(evidence["github_issues"])
     evidence["total_sources"] = total
+    if errors:
+        evidence["errors"] = errors
 
+    if answers:
+        failed: dict[int, str] = {}
+        fetched = fetch_so_answers(clients["so"], answered_ids(evidence), failed)
+        attach_answers([evidence], fetched, failed)
     return evidence
 
 
-def main():
+def answered_ids(evidence: dict) -> list[int]:
+    """Question ids in an evidence record that have answers to fetch."""
+    return [q["question_id"] for q in evidence["stackoverflow"] if q["answer_count"] > 0]
+
+
+def attach_answers(records: list[dict], answers: dict[int, list[dict]],
+                   errors: dict[int, str] | None = None) -> None:
+    """Fill each question's top 3 answers in from fetch_so_answers output.
+
+    Questions whose answers failed to fetch (keys of ``errors``) add the
+    failure to their record's "errors", so the pair is not marked done.
+    """
+    for evidence in records:
+        failures = []
+        for q in evidence["stackoverflow"]:
+            q["answers"] = [
+                {
+                    "answer_id": a.get("answer_id"),
+                    "body": a.get("body", "")[:2000],
+                    "score": a.get("score", 0),
+                    "is_accepted": a.get("is_accepted", False),
+                }
+                for a in answers.get(q["question_id"], [])[:3]
+            ]
+            if errors and q["question_id"] in errors:
+                failures.append(errors[q["question_id"]])
+        if failures:
+            evidence.setdefault("errors", []).extend(dict.fromkeys(failures))
+
+
+def evidence_path(output_dir: Path, pair_id: str) -> Path:
+    return output_dir / f"{pair_id.replace('/', '_')}.json"
+
+
+def _search_all(pairs: Iterable[dict], clients: dict[str, ApiClient],
+                workers: int) -> Iterator[dict]:
+    pending_pairs = iter(pairs)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight: dict = {}
+
+        def submit(pair: dict) -> None:
+            future = pool.submit(collect_evidence_for_pair, pair, clients, False)
+            in_flight[future] = pair
+
+        for pair in pending_pairs:
+            submit(pair)
+            if len(in_flight) >= workers:
+                break
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                pair = in_flight.pop(future)
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield {"pair_id": pair["id"], "failed": f"{type(e).__name__}: {e}"}
+                pair = next(pending_pairs, None)
+                if pair is not None:
+                    submit(pair)
+
+
+def _in_input_order(pairs: Iterable[dict], clients: dict[str, ApiClient],
+                    workers: int) -> Iterator[dict]:
+    """_search_all results, reordered to the order the pairs were read in."""
+    order: dict[str, int] = {}
+
+    def numbered() -> Iterator[dict]:
+        for n, pair in enumerate(pairs):
+            order[pair["id"]] = n
+            yield pair
+
+    done: dict[int, dict] = {}
+    next_n = 0
+    for evidence in _search_all(numbered(), clients, workers):
+        done[order.pop(evidence["pair_id"])] = evidence
+        while next_n in done:
+            yield done.pop(next_n)
+            next_n += 1
+
+
+def collect_all(pairs: Iterable[dict], clients: dict[str, ApiClient],
+                workers: int = DEFAULT_WORKERS,
+                answer_batch: int = SO_IDS_PER_REQUEST) -> Iterator[dict]:
+    """Collect evidence for pairs with at most ``workers`` pairs in flight.
+
+    Searches run per pair; answers are fetched for the questions of several
+    consecutive pairs at once, once ``answer_batch`` answered question ids
+    are waiting. Batches follow input order, not completion order, so a
+    rerun over the same pairs repeats the same answer requests (and hits the
+    HTTP cache). Yields evidence records in input order; a pair whose
+    collection raised yields ``{"pair_id", "failed"}`` instead, and a pair
+    whose answers could not be fetched lists that under "errors". Pairs are
+    pulled from the iterable lazily, so memory stays bounded by the pairs in
+    flight, those finished behind a slower earlier pair, and one batch.
+    """
+    waiting: list[dict] = []
+    waiting_ids: set[int] = set()
+
+    def flush() -> list[dict]:
+        failed: dict[int, str] = {}
+        attach_answers(waiting, fetch_so_answers(clients["so"], waiting_ids, failed), failed)
+        return waiting
+
+    for evidence in _in_input_order(pairs, clients, workers):
+        if "failed" in evidence:
+            yield evidence
+            continue
+        waiting.append(evidence)
+        waiting_ids.update(answered_ids(evidence))
+        if len(waiting_ids) >= answer_batch:
+            yield from flush()
+            waiting, waiting_ids = [], set()
+    if waiting:
+        yield from flush()
+
+
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(description="Collect evidence for error-env pairs")
-    parser.add_argument("--input", type=Path, default=PAIRS_FILE, help="Input pairs file")
+    parser.add_argument("--input", type=Path, default=PAIRS_FILE,
+                        help="Input pairs file ('-' for stdin, e.g. piped from generate_pairs)")
     parser.add_argument("--output-dir", type=Path, default=EVIDENCE_DIR, help="Output directory")
     parser.add_argument("--so-key", default=None, help="StackOverflow API key")
     parser.add_argument("--gh-token", default=None, help="GitHub API token")
     parser.add_argument("--resume", action="store_true",
-                        help="Skip pairs that already have evidence files")
+                        help="Only collect pairs the state store has not finished")
     parser.add_argument("--limit", type=int, default=0, help="Max pairs to process (0=all)")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be collected")
-    args = parser.parse_args()
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Pairs collected concurrently (requests stay rate-limited)")
+    parser.add_argument("--so-rate", type=float, default=SO_REQUESTS_PER_SECOND,
+                        help="StackOverflow requests per second")
+    parser.add_argument("--gh-rate", type=float, default=GH_REQUESTS_PER_SECOND,
+                        help="GitHub requests per second")
+    parser.add_argument("--so-api-base", default=SO_API_BASE,
+                        help="StackExchange API base URL (e.g. a local stub server)")
+    parser.add_argument("--gh-api-base", default=GH_API_BASE,
+                        help="GitHub API base URL (e.g. a local stub server)")
+    add_cache_arguments(parser)
+    add_state_arguments(parser)
+    args = parser.parse_args(argv)
 
     args.output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load pairs
-    pairs = []
-    with open(args.input, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                pairs.append(json.loads(line))
-
-    print(f"Loaded {len(pairs)} pairs")
-
-    # Filter already-processed if resuming
-    if args.resume:
-        remaining = []
-        for pair in pairs:
-            evidence_file = args.output_dir / f"{pair['id'].replace('/', '_')}.json"
-            if not evidence_file.exists():
-                remaining.append(pair)
-        print(f"  Resuming: {len(pairs) - len(remaining)} already done, {len(remaining)} remaining")
-        pairs = remaining
-
+    # Stream pairs and claim them lazily from the state store: only the
+    # pairs in flight are in memory, parallel runs never collect the same
+    # pair, and evidence files from before the store count as done.
+    pairs = iter_jsonl(args.input)
+    state = PipelineState(args.state)
+    todo = state.claimed(
+        "evidence", pairs,
+        force=not args.resume, retry_failed=args.retry_failed, stale_days=args.stale_days,
+        done=lambda pair_id: evidence_path(args.output_dir, pair_id).exists(),
+        peek=args.dry_run,
+    )
     if args.limit > 0:
-        pairs = pairs[:args.limit]
-        print(f"  Limited to {len(pairs)} pairs")
+        todo = itertools.islice(todo, args.limit)
 
     if args.dry_run:
-        for pair in pairs:
+        for pair in todo:
             print(f"  Would collect: {pair['id']}")
         return
 
-    # Collect evidence
-    for i, pair in enumerate(pairs):
-        pair_id = pair["id"]
-        print(f"[{i + 1}/{len(pairs)}] Collecting evidence for {pair_id}...")
-
-        evidence = collect_evidence_for_pair(pair, so_key=args.so_key, gh_token=args.gh_token)
-
-        # Save evidence
-        evidence_file = args.output_dir / f"{pair_id.replace('/', '_')}.json"
+    # Collect evidence, writing each file as its pair completes
+    cache = cache_from_args(args)
+    clients = make_clients(
+        args.so_key, args.gh_token, args.so_api_base, args.gh_api_base,
+        args.so_rate, args.gh_rate, cache,
+    )
+    start = time.monotonic()
+    collected = failed = 0
+    for evidence in collect_all(todo, clients, args.workers):
+        pair_id = evidence["pair_id"]
+        if "failed" in evidence:
+            failed += 1
+            state.fail("evidence", pair_id, evidence["failed"])
+            print(f"[{collected + failed}] {pair_id}: FAILED {evidence['failed']}")
+            continue
+        evidence_file = evidence_path(args.output_dir, pair_id)
         evidence_file.parent.mkdir(parents=True, exist_ok=True)
         with open(evidence_file, "w", encoding="utf-8") as f:
             json.dump(evidence, f, indent=2, ensure_ascii=False)
-
-        print(f"  Collected {evidence['total_sources']} sources")
-
-    print(f"\nDone! Evidence collected for {len(pairs)} pairs in {args.output_dir}")
+        if evidence.get("errors"):
+            failed += 1
+            state.fail("evidence", pair_id, "; ".join(evidence["errors"]))
+        else:
+            collected += 1
+            state.complete("evidence", pair_id)
+        print(f"[{collected + failed}] {pair_id}: {evidence['total_sources']} sources")
+
+    elapsed = time.monotonic() - start
+    print(f"  {clients['so'].requests_made} SO + {clients['gh'].requests_made} GH "
+          f"requests in {elapsed:.1f}s")
+    if cache is not None:
+        print(f"  HTTP cache: {cache.hits} fresh hits, {cache.revalidated} revalidated")
+    state.close()
+    print(f"\nDone! Evidence collected for {collected} pairs ({failed} failed, "
+          f"retry with --resume --retry-failed) in {args.output_dir}")
 
 
 if __name__ == "__main__":
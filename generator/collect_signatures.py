@@ -1,6 +1,9 @@
 """Step 1: Collect error signatures from public sources.
 
 Sources: StackOverflow API, GitHub Issues API, manual seed signatures.
+API responses go through the shared on-disk HTTP cache (generator.api_client).
+Near-duplicates (same error, different names/ports/versions) are clustered
+with MinHash/LSH; each cluster keeps one representative.
 Output: data/pipeline/signatures.jsonl
 
 Usage:
@@ -11,18 +14,26 @@ import argparse
 import hashlib
 import json
 import re
-import time
+import struct
+from functools import lru_cache
 from pathlib import Path
 
 import requests
 
+from generator.api_client import (
+    GH_API_BASE,
+    SO_API_BASE,
+    ApiClient,
+    add_cache_arguments,
+    cache_from_args,
+    make_clients,
+)
+from generator.pipeline_state import STATE_DB, PipelineState
+
 PROJECT_ROOT = Path(__file__).parent.parent
 PIPELINE_DIR = PROJECT_ROOT / "data" / "pipeline"
 SIGNATURES_FILE = PIPELINE_DIR / "signatures.jsonl"
 
-SO_API_BASE = "https://api.stackexchange.com/2.3"
-GH_API_BASE = "https://api.github.com"
-
 # Manual seed signatures for bootstrapping
 SEED_SIGNATURES = [
     {
@@ -154,6 +165,13 @@ SEED_SIGNATURES = [
     },
 ]
 
+# Near-duplicate clustering: MinHash over signature shingles, LSH in bands
+# (16 bands x 4 rows: pairs above ~0.5 similarity usually share a band)
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+CLUSTER_THRESHOLD = 0.6
+_ROWS_PER_BAND = MINHASH_PERMUTATIONS // MINHASH_BANDS
+
 # StackOverflow tag → domain mapping
 TAG_DOMAIN_MAP = {
     "python": "python",
@@ -196,8 +214,8 @@ def signature_hash(signature: str, domain: str) -> str:
     return hashlib.sha256(key.encode()).hexdigest()[:16]
 
 
-def fetch_so_questions(tag: str, page: int = 1, pagesize: int = 100,
-                       so_key: str | None = None) -> list[dict]:
+def fetch_so_questions(client: ApiClient, tag: str, page: int = 1,
+                       pagesize: int = 100) -> list[dict]:
     """Fetch questions from StackOverflow by tag, sorted by votes."""
     params = {
         "order": "desc",
@@ -208,17 +226,7 @@ def fetch_so_questions(tag: str, page: int = 1, pagesize: int = 100,
         "page": page,
         "pagesize": pagesize,
     }
-    if so_key:
-        params["key"] = so_key
-
-    resp = requests.get(f"{SO_API_BASE}/questions", params=params, timeout=30)
-    resp.raise_for_status()
-    data = resp.json()
-
-    if data.get("backoff"):
-        time.sleep(data["backoff"])
-
-    return data.get("items", [])
+    return client.get_json("/questions", params).get("items", [])
 
 
 def extract_signatures_from_so(questions: list[dict], domain: str) -> list[dict]:
@@ -276,13 +284,9 @@ def extract_signatures_from_so(questions: list[dict], domain: str) -> list[dict]
     return signatures
 
 
-def fetch_gh_issues(repo: str, label: str = "bug", per_page: int = 100,
-                    gh_token: str | None = None) -> list[dict]:
+def fetch_gh_issues(client: ApiClient, repo: str, label: str = "bug",
+                    per_page: int = 100) -> list[dict]:
     """Fetch issues from a GitHub repository."""
-    headers = {"Accept": "application/vnd.github+json"}
-    if gh_token:
-        headers["Authorization"] = f"Bearer {gh_token}"
-
     params = {
         "labels": label,
         "state": "all",
@@ -290,15 +294,7 @@ def fetch_gh_issues(repo: str, label: str = "bug", per_page: int = 100,
         "direction": "desc",
         "per_page": per_page,
     }
-
-    resp = requests.get(
-        f"{GH_API_BASE}/repos/{repo}/issues",
-        headers=headers,
-        params=params,
-        timeout=30,
-    )
-    resp.raise_for_status()
-    return resp.json()
+    return client.get_json(f"/repos/{repo}/issues", params)
 
 
 def extract_signatures_from_gh(issues: list[dict], domain: str) -> list[dict]:
@@ -345,6 +341,140 @@ def deduplicate_signatures(signatures: list[dict]) -> list[dict]:
     return list(by_hash.values())
 
 
+def _evidence_rank(sig: dict) -> tuple:
+    """Sort key for cluster representatives: manual seeds, then most evidence."""
+    return (
+        sig.get("source") == "manual_seed",
+        sig.get("score", 0) + sig.get("view_count", 0) + sig.get("comments", 0),
+    )
+
+
+# Placeholders for masked quoted names and numbers
+_MASKS = frozenset({"Q", "0"})
+
+
+def _masked_tokens(signature: str) -> list[str]:
+    """Lowercased tokens of a signature with quoted names and numbers masked.
+
+    Only standalone numbers and hex addresses are masked; numbers inside
+    identifiers and codes (E0412, TS2339, CUDNN_STATUS_...) are kept.
+    """
+    sig = normalize_signature(signature).lower()
+    sig = re.sub(r"(['\"`]).*?\1", " Q ", sig)
+    sig = re.sub(r"\b(?:0x[0-9a-f]+|\d+(?:\.\d+)*)\b", "0", sig)
+    return re.findall(r"\w+|[^\w\s]", sig)
+
+
+def signature_shingles(signature: str) -> set[str]:
+    """Word unigrams + bigrams of a signature, with quoted names and numbers masked.
+
+    Masking makes messages that differ only in a module name, port or
+    version identical; the shingles catch the remaining small differences.
+    """
+    tokens = _masked_tokens(signature)
+    return set(tokens) | {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+
+def content_words(signature: str) -> frozenset[str]:
+    """Unmasked word tokens: the error type, codes and message words."""
+    return frozenset(t for t in _masked_tokens(signature) if t[0].isalnum()) - _MASKS
+
+
+def same_error(a: frozenset[str], b: frozenset[str]) -> bool:
+    """Whether two signatures' content words allow them to be one error.
+
+    One message may only add words to the other (extra context such as a
+    trailing hint); a substituted word means a different error, e.g.
+    ``callable``/``subscriptable`` or ``E0412``/``E0425``.
+    """
+    return a <= b or b <= a
+
+
+@lru_cache(maxsize=1 << 16)
+def _shingle_hashes(shingle: str) -> tuple[int, ...]:
+    """MINHASH_PERMUTATIONS independent 32-bit hashes of one shingle."""
+    digest = hashlib.shake_128(shingle.encode("utf-8")).digest(4 * MINHASH_PERMUTATIONS)
+    return struct.unpack(f"<{MINHASH_PERMUTATIONS}I", digest)
+
+
+def minhash(shingles: set[str]) -> tuple[int, ...]:
+    """MinHash signature: the per-position minimum over all shingle hashes.
+
+    Masked shingles repeat across signatures, so their hashes are cached.
+    """
+    if not shingles:
+        return (0,) * MINHASH_PERMUTATIONS
+    return tuple(map(min, zip(*map(_shingle_hashes, shingles))))
+
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def cluster_signatures(signatures: list[dict],
+                       threshold: float = CLUSTER_THRESHOLD) -> list[dict]:
+    """Merge near-duplicate signatures (same domain) with MinHash/LSH.
+
+    Signatures whose MinHash bands collide are candidates; a candidate joins
+    a cluster when the Jaccard similarity of its shingles to the bucket's
+    first member reaches ``threshold`` and every member of both clusters is
+    compatible with every other (see ``same_error``), so chains of pairwise
+    matches cannot join two different errors. Each bucket is compared against one
+    anchor, so the work stays linear in the number of signatures. Two manual
+    seeds are never merged.
+
+    Returns one representative per cluster (a manual seed, else the member
+    with the most evidence) with ``cluster_size`` and ``cluster_members``
+    (signature and source of every member).
+    """
+    shingles = [signature_shingles(sig["signature"]) for sig in signatures]
+    # Distinct content-word sets of each cluster, kept at its root
+    words = [{content_words(sig["signature"])} for sig in signatures]
+    parent = list(range(len(signatures)))
+    has_seed = [sig.get("source") == "manual_seed" for sig in signatures]
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    anchors: dict[tuple, int] = {}
+    for i, sig in enumerate(signatures):
+        band_values = minhash(shingles[i])
+        for band in range(MINHASH_BANDS):
+            key = (sig["domain"], band,
+                   band_values[band * _ROWS_PER_BAND:(band + 1) * _ROWS_PER_BAND])
+            anchor = anchors.setdefault(key, i)
+            if anchor == i:
+                continue
+            a, b = find(anchor), find(i)
+            if a == b or (has_seed[a] and has_seed[b]):
+                continue
+            if (jaccard(shingles[anchor], shingles[i]) >= threshold
+                    and all(same_error(x, y) for x in words[a] for y in words[b])):
+                parent[b] = a
+                has_seed[a] = has_seed[a] or has_seed[b]
+                words[a] |= words[b]
+
+    clusters: dict[int, list[int]] = {}
+    for i in range(len(signatures)):
+        clusters.setdefault(find(i), []).append(i)
+
+    representatives = []
+    for members in clusters.values():
+        rep = max((signatures[i] for i in members), key=_evidence_rank)
+        representatives.append({
+            **rep,
+            "cluster_size": len(members),
+            "cluster_members": [
+                {"signature": signatures[i]["signature"], "source": signatures[i].get("source")}
+                for i in members
+            ],
+        })
+    return representatives
+
+
 def build_regex_from_signature(signature: str) -> str:
     """Generate a basic regex from a signature by escaping and wildcarding variable parts."""
     escaped = re.escape(signature)
@@ -353,7 +483,7 @@ def build_regex_from_signature(signature: str) -> str:
     return regex
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(description="Collect error signatures from public sources")
     parser.add_argument("--so-tags", nargs="*", default=[], help="StackOverflow tags to search")
     parser.add_argument("--gh-repos", nargs="*", default=[], help="GitHub repos (owner/repo)")
@@ -361,9 +491,20 @@ def main():
     parser.add_argument("--gh-token", default=None, help="GitHub API token")
     parser.add_argument("--seeds-only", action="store_true", help="Only output manual seeds")
     parser.add_argument("--output", type=Path, default=SIGNATURES_FILE, help="Output file")
-    args = parser.parse_args()
-
-    PIPELINE_DIR.mkdir(parents=True, exist_ok=True)
+    parser.add_argument("--so-api-base", default=SO_API_BASE,
+                        help="StackExchange API base URL (e.g. a local stub server)")
+    parser.add_argument("--gh-api-base", default=GH_API_BASE,
+                        help="GitHub API base URL (e.g. a local stub server)")
+    parser.add_argument("--no-cluster", action="store_true",
+                        help="Skip near-duplicate (MinHash/LSH) clustering")
+    parser.add_argument("--cluster-threshold", type=float, default=CLUSTER_THRESHOLD,
+                        help="Shingle Jaccard similarity at which signatures merge")
+    parser.add_argument("--state", type=Path, default=STATE_DB,
+                        help="Pipeline state database (SQLite)")
+    add_cache_arguments(parser)
+    args = parser.parse_args(argv)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
 
     all_signatures: list[dict] = []
 
@@ -375,17 +516,19 @@ def main():
             "dedup_hash": signature_hash(seed["signature"], seed["domain"]),
         })
 
+    cache = cache_from_args(args)
     if not args.seeds_only:
+        clients = make_clients(args.so_key, args.gh_token, args.so_api_base,
+                               args.gh_api_base, cache=cache)
         # Collect from StackOverflow
         for tag in args.so_tags:
             domain = TAG_DOMAIN_MAP.get(tag, tag)
             print(f"Fetching StackOverflow questions for tag '{tag}' (domain: {domain})...")
             try:
-                questions = fetch_so_questions(tag, so_key=args.so_key)
+                questions = fetch_so_questions(clients["so"], tag)
                 sigs = extract_signatures_from_so(questions, domain)
                 print(f"  Found {len(sigs)} raw signatures")
                 all_signatures.extend(sigs)
-                time.sleep(1)  # Rate limiting
             except requests.RequestException as e:
                 print(f"  WARNING: Failed to fetch SO data for '{tag}': {e}")
 
@@ -394,17 +537,23 @@ def main():
             domain = TAG_DOMAIN_MAP.get(repo.split("/")[-1], "python")
             print(f"Fetching GitHub issues for '{repo}' (domain: {domain})...")
             try:
-                issues = fetch_gh_issues(repo, gh_token=args.gh_token)
+                issues = fetch_gh_issues(clients["gh"], repo)
                 sigs = extract_signatures_from_gh(issues, domain)
                 print(f"  Found {len(sigs)} raw signatures")
                 all_signatures.extend(sigs)
-                time.sleep(1)  # Rate limiting
             except requests.RequestException as e:
                 print(f"  WARNING: Failed to fetch GH data for '{repo}': {e}")
 
+        if cache is not None:
+            print(f"HTTP cache: {cache.hits} fresh hits, {cache.revalidated} revalidated")
+
     # Deduplicate
     deduped = deduplicate_signatures(all_signatures)
     print(f"\nDeduplicated: {len(all_signatures)} → {len(deduped)} unique signatures")
+    if not args.no_cluster:
+        clustered = cluster_signatures(deduped, args.cluster_threshold)
+        print(f"Clustered: {len(deduped)} → {len(clustered)} near-duplicate clusters")
+        deduped = clustered
 
     # Write output
     with open(args.output, "w", encoding="utf-8") as f:
@@ -413,6 +562,9 @@ def main():
 
     print(f"Wrote {len(deduped)} signatures to {args.output}")
 
+    with PipelineState(args.state) as state:
+        state.mark_done("signature", (sig["dedup_hash"] for sig in deduped))
+
 
 if __name__ == "__main__":
     main()
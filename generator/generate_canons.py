@@ -3,28 +3,61 @@
 Uses Claude API to analyze evidence and generate structured ErrorCanon JSON
 with dead_ends, workarounds, verdicts, and transition_graph edges.
 
-Output: data/canons/{domain}/{slug}/{env}.json
+Output: data/canons/{domain}/{slug}/{env}.json, written atomically in batches
+(generator.canon_writer).
+
+Progress and failures are tracked in the pipeline state store
+(generator.pipeline_state); rerun with --resume [--retry-failed].
+
+Canons are generated --workers at a time behind an adaptive rate limiter,
+or offline through the Message Batches API (--batch-prepare, then
+--batch-ingest). Replies are cached by prompt hash in
+data/pipeline/prompt-cache; the prompt includes the pair's environment, so
+the cache serves reruns of the same pair, not other environments. Use
+--per-signature to generate one base canon per signature and derive the
+other environments from it.
 
 Usage:
-    python -m generator.generate_canons [--input-dir evidence/] [--validate]
+    python -m generator.generate_canons [--input-dir evidence/] [--validate] [--resume]
+    python -m generator.generate_canons --batch-prepare batch.jsonl
+    python -m generator.generate_canons --batch-ingest results.jsonl \\
+        --batch-requests batch.jsonl
 """
 
 import argparse
+import copy
+import hashlib
+import itertools
 import json
+import threading
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 import anthropic
-from jsonschema import ValidationError, validate
 
-from generator.schema import ERRORCANON_SCHEMA
+from generator.api_client import TokenBucket
+from generator.canon_writer import CanonWriter
+from generator.pipeline_state import PipelineState, add_state_arguments
 from generator.validate import validate_canon_json
 
 PROJECT_ROOT = Path(__file__).parent.parent
 PIPELINE_DIR = PROJECT_ROOT / "data" / "pipeline"
 EVIDENCE_DIR = PIPELINE_DIR / "evidence"
+PROMPT_CACHE_DIR = PIPELINE_DIR / "prompt-cache"
 CANONS_DIR = PROJECT_ROOT / "data" / "canons"
 
+DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
+MAX_TOKENS = 4096
+DEFAULT_WORKERS = 4
+REQUESTS_PER_SECOND = 1.0
+# Statuses that mean "slow down": rate limited, overloaded
+BACKOFF_STATUSES = frozenset({429, 529})
+# Transient server errors: retried, without slowing down the other workers
+RETRY_STATUSES = frozenset({408, 500, 502, 503, 504})
+MAX_BACKOFF_S = 120.0
+
 CANON_GENERATION_PROMPT = """\
 You are an expert at analyzing software errors. Given evidence about an error \
 in a specific environment, generate a structured ErrorCanon JSON entry.
@@ -156,48 +189,371 @@ def format_gh_evidence(evidence: dict) -> str:
     return "\n---\n".join(parts)
 
 
-def generate_canon_from_evidence(evidence: dict, client: anthropic.Anthropic,
-                                 model: str = "claude-sonnet-4-5-20250929") -> dict | None:
-    """Use Claude API to generate an ErrorCanon from evidence."""
-    today = time.strftime("%Y-%m-%d")
-
-    prompt = CANON_GENERATION_PROMPT.format(
+def build_prompt(evidence: dict, today: str | None = None) -> str:
+    """Fill CANON_GENERATION_PROMPT for one evidence record."""
+    environment = json.dumps(evidence["environment"], indent=2)
+    return CANON_GENERATION_PROMPT.format(
         signature=evidence["signature"],
-        environment=json.dumps(evidence["environment"], indent=2),
-        environment_json=json.dumps(evidence["environment"], indent=2),
+        environment=environment,
+        environment_json=environment,
         so_evidence=format_so_evidence(evidence),
         gh_evidence=format_gh_evidence(evidence),
         pair_id=evidence["pair_id"],
         domain=evidence["domain"],
-        today=today,
+        today=today or time.strftime("%Y-%m-%d"),
         evidence_count=evidence.get("total_sources", 0),
     )
 
-    try:
-        response = client.messages.create(
-            model=model,
-            max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        text = response.content[0].text.strip()
-
-        # Strip markdown fences if present
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-
-        canon = json.loads(text)
+
+def prompt_key(model: str, evidence: dict) -> str:
+    """Content address of the request for ``evidence``: model plus prompt.
+
+    The date is left as a placeholder so keys stay valid across days. The
+    prompt names the pair and its environment, and the reply is written for
+    that environment, so keys (deliberately) never match across environments:
+    a hit needs the same pair with unchanged evidence, e.g. a rerun or a
+    retry. Reusing one reply for several environments is --per-signature's
+    job (derive_variant), which needs no cache lookup for the variants.
+    """
+    prompt = build_prompt(evidence, today="{today}")
+    return hashlib.sha256(f"{model}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+class PromptCache:
+    """Parsed canon replies on disk, keyed by prompt_key (thread-safe)."""
+
+    def __init__(self, directory: Path = PROMPT_CACHE_DIR):
+        self.directory = Path(directory)
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        try:
+            canon = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        with self._lock:
+            self.hits += 1
         return canon
 
+    def put(self, key: str, canon: dict) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(canon, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+
+    def discard(self, key: str) -> None:
+        """Forget a reply that turned out unusable, so a retry asks again."""
+        self._path(key).unlink(missing_ok=True)
+
+
+def parse_canon_text(text: str) -> dict:
+    """Decode a model reply into a canon dict, tolerating markdown fences.
+
+    Raises json.JSONDecodeError if the reply is not JSON.
+    """
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1]
+        if text.endswith("```"):
+            text = text[:-3]
+        text = text.strip()
+    return json.loads(text)
+
+
+class AdaptiveLimiter:
+    """Request pacing shared by concurrent generation workers.
+
+    Starts at ``rate`` requests/s. A rate-limit or overload error halves the
+    rate (down to ``min_rate``) and pauses every worker; each success raises
+    it again by 10% of the starting rate, up to the starting rate.
+    """
+
+    def __init__(self, rate: float = REQUESTS_PER_SECOND, min_rate: float = 0.05,
+                 bucket: TokenBucket | None = None):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.bucket = bucket or TokenBucket(rate)
+        self.throttles = 0
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self.bucket.rate
+
+    def acquire(self) -> None:
+        self.bucket.acquire()
+
+    def throttled(self, wait: float) -> None:
+        with self._lock:
+            self.throttles += 1
+            self.bucket.rate = max(self.min_rate, self.bucket.rate / 2)
+        self.bucket.pause(wait)
+
+    def succeeded(self) -> None:
+        with self._lock:
+            self.bucket.rate = min(self.max_rate, self.bucket.rate + self.max_rate / 10)
+
+
+def _backoff_seconds(error: anthropic.APIError, attempt: int) -> float:
+    """Server-requested wait (retry-after) or exponential backoff, capped."""
+    response = getattr(error, "response", None)
+    try:
+        wait = float(response.headers.get("retry-after", "") if response is not None else "")
+    except ValueError:
+        wait = 2.0 ** attempt
+    return min(MAX_BACKOFF_S, max(0.0, wait))
+
+
+def generate_canon_from_evidence(evidence: dict, client: anthropic.Anthropic,
+                                 model: str = DEFAULT_MODEL,
+                                 limiter: AdaptiveLimiter | None = None,
+                                 max_retries: int = 5,
+                                 errors: list[str] | None = None,
+                                 cache: PromptCache | None = None) -> dict | None:
+    """Use Claude API to generate an ErrorCanon from evidence.
+
+    With a ``cache``, an identical earlier request is answered from disk.
+    Rate-limit and overload errors are retried up to ``max_retries`` times,
+    backing off through ``limiter`` so all workers slow down together;
+    connection errors and transient 5xx responses are retried with backoff
+    by the failing worker alone. Failures are printed (and appended to
+    ``errors`` if given).
+    """
+    key = prompt_key(model, evidence) if cache is not None else None
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    prompt = build_prompt(evidence)
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            response = client.messages.create(
+                model=model,
+                max_tokens=MAX_TOKENS,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            break
+        except anthropic.APIStatusError as e:
+            throttle = e.status_code in BACKOFF_STATUSES
+            if not (throttle or e.status_code in RETRY_STATUSES) or attempt >= max_retries:
+                return _failed(f"Claude API error: {e}", errors)
+            wait = _backoff_seconds(e, attempt)
+            if throttle and limiter is not None:
+                limiter.throttled(wait)
+            else:
+                time.sleep(wait)
+            attempt += 1
+        except anthropic.APIConnectionError as e:
+            if attempt >= max_retries:
+                return _failed(f"Claude API connection error: {e}", errors)
+            time.sleep(_backoff_seconds(e, attempt))
+            attempt += 1
+        except anthropic.APIError as e:
+            return _failed(f"Claude API error: {e}", errors)
+
+    if limiter is not None:
+        limiter.succeeded()
+    try:
+        canon = parse_canon_text(response.content[0].text)
+    except json.JSONDecodeError as e:
+        return _failed(f"Failed to parse Claude response as JSON: {e}", errors)
+    if cache is not None:
+        cache.put(key, canon)
+    return canon
+
+
+def _failed(message: str, errors: list[str] | None) -> None:
+    print(f"    {message}")
+    if errors is not None:
+        errors.append(message)
+    return None
+
+
+def generate_all(evidence_records: Iterable[dict], client: anthropic.Anthropic,
+                 model: str = DEFAULT_MODEL, workers: int = DEFAULT_WORKERS,
+                 limiter: AdaptiveLimiter | None = None, cache: PromptCache | None = None,
+                 ) -> Iterator[tuple[dict, dict | None, list[str]]]:
+    """Generate canons with at most ``workers`` requests in flight.
+
+    Yields ``(evidence, canon or None, errors)`` in completion order. Records
+    are pulled lazily, so claiming and memory stay bounded by ``workers``.
+    """
+    limiter = limiter or AdaptiveLimiter()
+    pending = iter(evidence_records)
+
+    def run(evidence: dict):
+        errors: list[str] = []
+        canon = generate_canon_from_evidence(evidence, client, model, limiter,
+                                             errors=errors, cache=cache)
+        return evidence, canon, errors
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight = {pool.submit(run, e) for e in itertools.islice(pending, workers)}
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+                evidence = next(pending, None)
+                if evidence is not None:
+                    in_flight.add(pool.submit(run, evidence))
+
+
+def signature_key(evidence: dict) -> tuple[str, str]:
+    return evidence["domain"], evidence["signature"]
+
+
+def group_by_signature(evidence_records: Iterable[dict]) -> Iterator[list[dict]]:
+    """Runs of consecutive records that share a signature.
+
+    Evidence files sorted by pair id keep a signature's environments
+    together; a signature split across runs just gets one base per run.
+    """
+    for _, group in itertools.groupby(evidence_records, key=signature_key):
+        yield list(group)
+
+
+def base_evidence(group: list[dict]) -> dict:
+    """The record a signature's base canon is generated from: most sources."""
+    return max(group, key=lambda e: e.get("total_sources", 0))
+
+
+def derive_variant(base: dict, evidence: dict) -> dict:
+    """Copy a base canon onto another environment of the same signature.
+
+    Evidence searches are per signature, so the base's evidence (and its
+    evidence_count) stands for every environment; only identity and
+    environment fields change.
+    """
+    canon = copy.deepcopy(base)
+    pair_id = evidence["pair_id"]
+    canon["id"] = pair_id
+    canon["url"] = f"https://deadends.dev/{pair_id}"
+    canon["environment"] = copy.deepcopy(evidence["environment"])
+    canon.setdefault("metadata", {})["derived_from"] = base.get("id")
+    return canon
+
+
+def generate_per_signature(evidence_records: Iterable[dict], client: anthropic.Anthropic,
+                           model: str = DEFAULT_MODEL, workers: int = DEFAULT_WORKERS,
+                           limiter: AdaptiveLimiter | None = None,
+                           cache: PromptCache | None = None,
+                           ) -> Iterator[tuple[dict, dict | None, list[str]]]:
+    """Like generate_all, but one request per signature.
+
+    The base environment's canon is generated; every other environment of
+    the signature gets derive_variant of it. A failed base fails the group.
+    """
+    groups: dict[str, list[dict]] = {}
+
+    def bases() -> Iterator[dict]:
+        for group in group_by_signature(evidence_records):
+            base = base_evidence(group)
+            groups[base["pair_id"]] = group
+            yield base
+
+    for base, canon, errors in generate_all(bases(), client, model, workers, limiter, cache):
+        for evidence in groups.pop(base["pair_id"]):
+            if canon is None or evidence is base:
+                yield evidence, canon, errors
+            else:
+                yield evidence, derive_variant(canon, evidence), []
+
+
+def batch_custom_id(pair_id: str) -> str:
+    """Batch API custom_id for a pair (ids allow only [A-Za-z0-9_-], <= 64 chars)."""
+    return hashlib.sha256(pair_id.encode("utf-8")).hexdigest()[:32]
+
+
+def write_batch_requests(evidence_records: Iterable[dict], path: Path,
+                         model: str = DEFAULT_MODEL, per_signature: bool = False) -> int:
+    """Write Message Batches API requests (JSONL) plus a ``.ids.json`` map.
+
+    The map (custom_id -> pair id, plus any environments to derive from
+    that reply with ``per_signature``) is what ingest_batch_results reads
+    back. Returns the number of requests written.
+    """
+    if per_signature:
+        groups = group_by_signature(evidence_records)
+    else:
+        groups = ([evidence] for evidence in evidence_records)
+    ids: dict[str, dict] = {}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for group in groups:
+            evidence = base_evidence(group)
+            custom_id = batch_custom_id(evidence["pair_id"])
+            ids[custom_id] = {
+                "pair_id": evidence["pair_id"],
+                "variants": [
+                    {"pair_id": e["pair_id"], "environment": e["environment"]}
+                    for e in group if e is not evidence
+                ],
+            }
+            f.write(json.dumps({
+                "custom_id": custom_id,
+                "params": {
+                    "model": model,
+                    "max_tokens": MAX_TOKENS,
+                    "messages": [{"role": "user", "content": build_prompt(evidence)}],
+                },
+            }, ensure_ascii=False) + "\n")
+    _batch_ids_path(path).write_text(json.dumps(ids, indent=2) + "\n", encoding="utf-8")
+    return len(ids)
+
+
+def _batch_ids_path(requests_path: Path) -> Path:
+    return requests_path.with_name(requests_path.name + ".ids.json")
+
+
+def ingest_batch_results(results_path: Path,
+                         requests_path: Path) -> Iterator[tuple[str, dict | None, list[str]]]:
+    """Yield ``(pair_id, canon or None, errors)`` for each request in a results file.
+
+    Results use the Message Batches format (``custom_id`` plus a ``result``
+    of type succeeded / errored / canceled / expired); custom ids are mapped
+    back through the ``.ids.json`` written next to the requests file, and
+    derived environments follow their base.
+    """
+    ids = json.loads(_batch_ids_path(requests_path).read_text(encoding="utf-8"))
+    with open(results_path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            request = ids.get(entry["custom_id"])
+            if request is None:
+                print(f"  WARNING: unknown custom_id {entry['custom_id']} in results")
+                continue
+            canon, errors = _batch_result_canon(entry.get("result", {}))
+            yield request["pair_id"], canon, errors
+            for variant in request["variants"]:
+                if canon is None:
+                    yield variant["pair_id"], None, errors
+                else:
+                    yield variant["pair_id"], derive_variant(canon, variant), []
+
+
+def _batch_result_canon(result: dict) -> tuple[dict | None, list[str]]:
+    if result.get("type") != "succeeded":
+        detail = result.get("error", {}).get("error", {}).get("message", "")
+        return None, [f"batch request {result.get('type')}: {detail}".strip()]
+    text = "".join(
+        block.get("text", "") for block in result["message"]["content"]
+        if block.get("type") == "text"
+    )
+    try:
+        return parse_canon_text(text), []
     except json.JSONDecodeError as e:
-        print(f"    Failed to parse Claude response as JSON: {e}")
-        return None
-    except anthropic.APIError as e:
-        print(f"    Claude API error: {e}")
-        return None
+        return None, [f"Failed to parse Claude response as JSON: {e}"]
 
 
 def validate_and_fix(canon: dict) -> tuple[dict, list[str]]:
@@ -244,103 +600,173 @@ def validate_and_fix(canon: dict) -> tuple[dict, list[str]]:
         if "success_rate" in wa:
             wa["success_rate"] = max(0.0, min(1.0, wa["success_rate"]))
 
-    # Validate against schema
-    try:
-        validate(instance=canon, schema=ERRORCANON_SCHEMA)
-    except ValidationError as e:
-        issues.append(f"Schema validation: {e.message}")
-
-    # Run business rule validation
+    # Schema + business rule validation (one pass with the shared validator)
     errors, warnings = validate_canon_json(canon)
     issues.extend(errors)
 
     return canon, issues
 
 
-def main():
+def canon_path_for(output_dir: Path, pair_id: str) -> Path:
+    """data/canons/{domain}/{slug}/{env}.json for a "domain/slug/env" pair id."""
+    parts = pair_id.split("/")
+    if len(parts) == 3:
+        return output_dir / parts[0] / parts[1] / f"{parts[2]}.json"
+    return output_dir / f"{pair_id.replace('/', '_')}.json"
+
+
+def _claimed_evidence(args, state: PipelineState, peek: bool) -> Iterator[dict]:
+    """Evidence records this run should generate, claimed lazily in order."""
+    for evidence_file in sorted(args.input_dir.glob("*.json")):
+        with open(evidence_file, encoding="utf-8") as f:
+            evidence = json.load(f)
+        canon_path = canon_path_for(args.output_dir, evidence["pair_id"])
+        # Canons written before the state store count as done
+        if state.claim(
+            "canon", evidence["pair_id"],
+            force=not args.resume, retry_failed=args.retry_failed,
+            stale_days=args.stale_days, done=lambda _: canon_path.exists(),
+            peek=peek,
+        ):
+            yield evidence
+
+
+def _store_canon(pair_id: str, canon: dict | None, errors: list[str], args,
+                 state: PipelineState, writer: CanonWriter) -> bool:
+    """Validate (with --validate), write and record one generated canon.
+
+    The canon only counts as done in the state store once the writer has
+    committed it to disk.
+    """
+    if canon is None:
+        state.fail("canon", pair_id, "; ".join(errors) or "no usable canon in model response")
+        return False
+
+    if args.validate:
+        canon, issues = validate_and_fix(canon)
+        if issues:
+            print(f"  {pair_id}: validation issues after auto-fix:")
+            for issue in issues:
+                print(f"    - {issue}")
+            state.fail("canon", pair_id, "; ".join(issues))
+            return False
+
+    def committed():
+        state.complete("canon", pair_id)
+        if args.validate:
+            state.complete("validated", pair_id)
+
+    canon_path = canon_path_for(args.output_dir, pair_id)
+    writer.write(canon_path, canon, on_commit=committed)
+    print(f"  Generated: {canon_path}")
+    return True
+
+
+def main(argv: list[str] | None = None, client=None):
     parser = argparse.ArgumentParser(description="Generate ErrorCanon entries from evidence")
     parser.add_argument("--input-dir", type=Path, default=EVIDENCE_DIR,
                         help="Directory with evidence JSON files")
     parser.add_argument("--output-dir", type=Path, default=CANONS_DIR,
                         help="Output directory for canon files")
-    parser.add_argument("--model", default="claude-sonnet-4-5-20250929",
+    parser.add_argument("--model", default=DEFAULT_MODEL,
                         help="Claude model to use")
     parser.add_argument("--validate", action="store_true",
                         help="Validate generated canons against schema")
     parser.add_argument("--resume", action="store_true",
-                        help="Skip canons that already exist")
+                        help="Only generate canons the state store has not finished")
     parser.add_argument("--limit", type=int, default=0, help="Max canons to generate (0=all)")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be generated")
-    args = parser.parse_args()
-
-    # Find evidence files
-    evidence_files = sorted(args.input_dir.glob("*.json"))
-    if not evidence_files:
-        print(f"No evidence files found in {args.input_dir}")
-        return
-
-    print(f"Found {len(evidence_files)} evidence files")
-
-    # Initialize Claude client
-    if not args.dry_run:
-        client = anthropic.Anthropic()
-
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Concurrent generation requests")
+    parser.add_argument("--rate", type=float, default=REQUESTS_PER_SECOND,
+                        help="Starting requests per second (halved on rate-limit errors)")
+    parser.add_argument("--per-signature", action="store_true",
+                        help="Generate one base canon per signature and derive the other "
+                             "environments from it")
+    parser.add_argument("--no-prompt-cache", action="store_true",
+                        help="Ignore replies cached for identical prompts")
+    parser.add_argument("--prompt-cache-dir", type=Path, default=PROMPT_CACHE_DIR,
+                        help="Prompt -> canon reply cache directory")
+    batch = parser.add_mutually_exclusive_group()
+    batch.add_argument("--batch-prepare", type=Path, metavar="REQUESTS_JSONL",
+                       help="Write Message Batches API requests instead of calling the API")
+    batch.add_argument("--batch-ingest", type=Path, metavar="RESULTS_JSONL",
+                       help="Write canons from a batch results file "
+                            "(with --batch-requests naming the prepared file)")
+    parser.add_argument("--batch-requests", type=Path, metavar="REQUESTS_JSONL",
+                        help="Requests file prepared for the results being ingested")
+    add_state_arguments(parser)
+    args = parser.parse_args(argv)
+
+    state = PipelineState(args.state)
     generated = 0
     failed = 0
 
-    for i, evidence_file in enumerate(evidence_files):
-        with open(evidence_file, encoding="utf-8") as f:
-            evidence = json.load(f)
-
-        pair_id = evidence["pair_id"]
-
-        # Build proper path: data/canons/{domain}/{slug}/{env}.json
-        parts = pair_id.split("/")
-        if len(parts) == 3:
-            canon_path = args.output_dir / parts[0] / parts[1] / f"{parts[2]}.json"
-        else:
-            canon_path = args.output_dir / f"{pair_id.replace('/', '_')}.json"
-
-        if args.resume and canon_path.exists():
-            continue
+    if args.batch_ingest:
+        if not args.batch_requests:
+            parser.error("--batch-ingest needs --batch-requests")
+        with CanonWriter(args.output_dir) as writer:
+            for pair_id, canon, errors in ingest_batch_results(args.batch_ingest,
+                                                               args.batch_requests):
+                if _store_canon(pair_id, canon, errors, args, state, writer):
+                    generated += 1
+                else:
+                    failed += 1
+        state.close()
+        print(f"\nDone! Ingested {generated} canons, {failed} failed")
+        return
 
-        if args.limit > 0 and generated >= args.limit:
-            break
+    evidence_count = sum(1 for _ in args.input_dir.glob("*.json"))
+    if not evidence_count:
+        print(f"No evidence files found in {args.input_dir}")
+        state.close()
+        return
+    print(f"Found {evidence_count} evidence files")
 
-        print(f"[{i + 1}/{len(evidence_files)}] Generating canon for {pair_id}...")
+    # Batch preparation and dry runs only peek: nothing is marked running
+    todo = _claimed_evidence(args, state, peek=args.dry_run or bool(args.batch_prepare))
+    if args.limit > 0:
+        todo = itertools.islice(todo, args.limit)
 
-        if args.dry_run:
-            print(f"  Would generate: {canon_path}")
-            generated += 1
-            continue
+    if args.dry_run:
+        for evidence in todo:
+            print(f"  Would generate: {canon_path_for(args.output_dir, evidence['pair_id'])}")
+        state.close()
+        return
 
-        canon = generate_canon_from_evidence(evidence, client, model=args.model)
-        if canon is None:
-            failed += 1
-            continue
+    if args.batch_prepare:
+        written = write_batch_requests(todo, args.batch_prepare, args.model,
+                                       per_signature=args.per_signature)
+        state.close()
+        print(f"Wrote {written} batch requests to {args.batch_prepare}")
+        print(f"Submit them to the Message Batches API, then run --batch-ingest RESULTS "
+              f"--batch-requests {args.batch_prepare}")
+        return
 
-        if args.validate:
-            canon, issues = validate_and_fix(canon)
-            if issues:
-                print("  Validation issues after auto-fix:")
-                for issue in issues:
-                    print(f"    - {issue}")
+    if client is None:
+        # Retries (rate limits, overload, connection errors, 5xx) are handled
+        # in generate_canon_from_evidence, with backoff shared across workers
+        client = anthropic.Anthropic(max_retries=0)
+    limiter = AdaptiveLimiter(args.rate)
+    cache = None if args.no_prompt_cache else PromptCache(args.prompt_cache_dir)
+    generate = generate_per_signature if args.per_signature else generate_all
+    start = time.monotonic()
+    with CanonWriter(args.output_dir) as writer:
+        for evidence, canon, errors in generate(todo, client, args.model,
+                                                args.workers, limiter, cache):
+            if _store_canon(evidence["pair_id"], canon, errors, args, state, writer):
+                generated += 1
+            else:
                 failed += 1
-                continue
-
-        # Write canon
-        canon_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(canon_path, "w", encoding="utf-8") as f:
-            json.dump(canon, f, indent=2, ensure_ascii=False)
-            f.write("\n")
-
-        generated += 1
-        print(f"  Generated: {canon_path}")
-
-        # Rate limiting for API calls
-        time.sleep(1)
-
-    print(f"\nDone! Generated {generated} canons, {failed} failed")
+                if cache is not None and canon is not None and "derived_from" not in \
+                        canon.get("metadata", {}):
+                    cache.discard(prompt_key(args.model, evidence))
+
+    state.close()
+    hits = cache.hits if cache is not None else 0
+    print(f"\nDone! Generated {generated} canons, {failed} failed "
+          f"in {time.monotonic() - start:.1f}s ({limiter.throttles} rate-limit backoffs, "
+          f"{hits} cached replies)")
 
 
 if __name__ == "__main__":
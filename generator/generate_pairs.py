@@ -3,21 +3,34 @@
 Takes signatures.jsonl + environment matrix, produces error-env pairs.
 Output: data/pipeline/pairs.jsonl
 
+Pairs are streamed: each signature is read, expanded and written before
+the next, so memory stays flat and ``--output -`` can feed collect_evidence
+through a pipe.
+
 Usage:
     python -m generator.generate_pairs [--input signatures.jsonl] [--output pairs.jsonl]
+    python -m generator.generate_pairs --output - | python -m generator.collect_evidence --input -
 """
 
 import argparse
 import hashlib
-import json
 import re
+import sys
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
+from generator.jsonl import is_stdio, iter_jsonl, jsonl_writer
+from generator.pipeline_state import STATE_DB, PipelineState
+
 PROJECT_ROOT = Path(__file__).parent.parent
 PIPELINE_DIR = PROJECT_ROOT / "data" / "pipeline"
 SIGNATURES_FILE = PIPELINE_DIR / "signatures.jsonl"
 PAIRS_FILE = PIPELINE_DIR / "pairs.jsonl"
 
+# Pairs recorded in the state store per transaction while streaming
+STATE_BATCH = 500
+
 # Environment matrix per domain
 ENVIRONMENT_MATRIX = {
     "python": [
@@ -148,67 +161,85 @@ def slugify_signature(signature: str) -> str:
     return slug[:60]  # Max length
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Generate error-environment pairs")
-    parser.add_argument("--input", type=Path, default=SIGNATURES_FILE, help="Input signatures file")
-    parser.add_argument("--output", type=Path, default=PAIRS_FILE, help="Output pairs file")
-    parser.add_argument("--max-per-sig", type=int, default=5, help="Max envs per signature")
-    args = parser.parse_args()
+def pairs_for_signature(sig: dict, max_per_sig: int = 5,
+                        stats: Counter | None = None) -> Iterator[dict]:
+    """Yield the error-environment pairs of one signature."""
+    stats = stats if stats is not None else Counter()
+    domain = sig["domain"]
+    envs = ENVIRONMENT_MATRIX.get(domain, [])
+
+    if not envs:
+        print(f"  WARNING: No environment matrix for domain '{domain}'", file=sys.stderr)
+        return
 
-    # Load signatures
-    signatures = []
-    with open(args.input, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                signatures.append(json.loads(line))
+    count = 0
+    for env in envs:
+        if count >= max_per_sig:
+            break
 
-    print(f"Loaded {len(signatures)} signatures")
+        if not is_valid_combo(sig, env):
+            stats["skipped"] += 1
+            continue
 
-    # Generate pairs
-    pairs = []
-    skipped = 0
+        env_slug = generate_env_slug(env)
+        sig_slug = slugify_signature(sig["signature"])
+        pair_id = f"{domain}/{sig_slug}/{env_slug}"
 
+        yield {
+            "id": pair_id,
+            "url": f"https://deadends.dev/{pair_id}",
+            "signature": sig,
+            "environment": env,
+            "env_hash": generate_env_hash(env),
+        }
+        count += 1
+
+
+def generate_pairs(signatures: Iterable[dict], max_per_sig: int = 5,
+                   stats: Counter | None = None) -> Iterator[dict]:
+    """Lazily expand signatures into pairs, one signature at a time.
+
+    ``stats`` (if given) counts signatures, pairs and skipped combos.
+    """
+    stats = stats if stats is not None else Counter()
     for sig in signatures:
-        domain = sig["domain"]
-        envs = ENVIRONMENT_MATRIX.get(domain, [])
+        stats["signatures"] += 1
+        for pair in pairs_for_signature(sig, max_per_sig, stats):
+            stats["pairs"] += 1
+            yield pair
 
-        if not envs:
-            print(f"  WARNING: No environment matrix for domain '{domain}'")
-            continue
 
-        count = 0
-        for env in envs:
-            if count >= args.max_per_sig:
-                break
-
-            if not is_valid_combo(sig, env):
-                skipped += 1
-                continue
-
-            env_slug = generate_env_slug(env)
-            sig_slug = slugify_signature(sig["signature"])
-            pair_id = f"{domain}/{sig_slug}/{env_slug}"
-
-            pair = {
-                "id": pair_id,
-                "url": f"https://deadends.dev/{pair_id}",
-                "signature": sig,
-                "environment": env,
-                "env_hash": generate_env_hash(env),
-            }
-            pairs.append(pair)
-            count += 1
-
-    print(f"Generated {len(pairs)} pairs ({skipped} invalid combos skipped)")
-
-    # Write output
-    PIPELINE_DIR.mkdir(parents=True, exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        for pair in pairs:
-            f.write(json.dumps(pair, ensure_ascii=False) + "\n")
-
-    print(f"Wrote {len(pairs)} pairs to {args.output}")
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Generate error-environment pairs")
+    parser.add_argument("--input", type=Path, default=SIGNATURES_FILE,
+                        help="Input signatures file ('-' for stdin)")
+    parser.add_argument("--output", type=Path, default=PAIRS_FILE,
+                        help="Output pairs file ('-' for stdout)")
+    parser.add_argument("--max-per-sig", type=int, default=5, help="Max envs per signature")
+    parser.add_argument("--state", type=Path, default=STATE_DB,
+                        help="Pipeline state database (SQLite)")
+    args = parser.parse_args(argv)
+
+    # Progress goes to stderr when pairs stream to stdout
+    log = sys.stderr if is_stdio(args.output) else sys.stdout
+
+    # Read, expand and write one signature at a time (flushed per pair on
+    # stdout, so a piped downstream stage can start on it).
+    stats: Counter = Counter()
+    done: list[str] = []
+    with PipelineState(args.state) as state, jsonl_writer(args.output) as write:
+        for pair in generate_pairs(iter_jsonl(args.input), args.max_per_sig, stats):
+            write(pair)
+            done.append(pair["id"])
+            if len(done) >= STATE_BATCH:
+                state.mark_done("pair", done)
+                done = []
+        state.mark_done("pair", done)
+
+    print(f"Read {stats['signatures']} signatures", file=log)
+    print(f"Generated {stats['pairs']} pairs ({stats['skipped']} invalid combos skipped)",
+          file=log)
+    print(f"Wrote {stats['pairs']} pairs to {args.output}", file=log)
 
 
 if __name__ == "__main__":
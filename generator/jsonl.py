@@ -0,0 +1,60 @@
+"""JSON Lines I/O for the pipeline stages, one record at a time.
+
+A path of ``-`` means stdin/stdout, so stages can be chained with pipes and
+the next stage starts on the first record instead of waiting for a file:
+
+    python -m generator.generate_pairs --output - | \
+        python -m generator.collect_evidence --input - --resume
+"""
+
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def is_stdio(path: Path | str) -> bool:
+    return str(path) == "-"
+
+
+def _records(lines: Iterable[str]) -> Iterator[dict]:
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def iter_jsonl(path: Path | str) -> Iterator[dict]:
+    """Yield the records of a JSONL file (or stdin for ``-``) lazily."""
+    if is_stdio(path):
+        yield from _records(sys.stdin)
+        return
+    with open(path, encoding="utf-8") as f:
+        yield from _records(f)
+
+
+@contextmanager
+def jsonl_writer(path: Path | str):
+    """Yield a ``write(record)`` function appending one line per record.
+
+    On stdout (``-``) every record is flushed as it is written, so the next
+    stage in a pipe sees it immediately; files keep normal buffering.
+    """
+    stdio = is_stdio(path)
+    if stdio:
+        f = sys.stdout
+    else:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        f = open(path, "w", encoding="utf-8")
+
+    def write(record: dict) -> None:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        if stdio:
+            f.flush()
+
+    try:
+        yield write
+    finally:
+        if f is not sys.stdout:
+            f.close()
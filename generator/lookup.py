@@ -14,16 +14,28 @@ Usage:
     # All matches
     results = lookup_all("CUDA error: out of memory")
 
+    # Regex-only matching against the columnar match-v2.json artifact
+    index = MatchIndex.load("https://deadends.dev/api/v1/match-v2.json.gz")
+    hits = index.match("CUDA error: out of memory")
+
+    # Keep a local mirror current by applying /api/v1/changes/ deltas
+    sync_snapshot("deadends-snapshot.json")
+
 CLI Usage:
     python -m generator.lookup "ModuleNotFoundError: No module named 'torch'"
+    python -m generator.lookup --sync deadends-snapshot.json
 """
 
+import gzip
 import json
+import os
 import re
 import sys
+import urllib.request
 from pathlib import Path
 
 DATA_DIR = Path(__file__).parent.parent / "data" / "canons"
+SITE_URL = "https://deadends.dev"
 
 _CANONS_CACHE: list[dict] | None = None
 
@@ -204,13 +216,166 @@ def search(query: str, domain: str | None = None, limit: int = 10) -> list[dict]
     return scored[:limit]
 
 
+def _read(location: str | Path) -> bytes:
+    """Read bytes from a local path or an http(s) URL."""
+    name = str(location)
+    if name.startswith(("http://", "https://")):
+        req = urllib.request.Request(name, headers={"User-Agent": "deadends-dev-lookup"})
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.read()
+    return Path(location).read_bytes()
+
+
+class MatchIndex:
+    """Reference matcher for the columnar /api/v1/match-v2.json artifact.
+
+    Each pattern carries a literal prefilter ("lit"): every match of the
+    regex contains one of those lowercased strings, so a regex is compiled
+    and run only when one occurs in the lowercased message. Results are the
+    regex matches ordered like the MCP server's match_error (fix rate desc).
+    """
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.domains: list[str] = data["domains"]
+        self.columns: dict[str, list] = data["columns"]
+        self.url_template: str = data["url_template"]
+        self._compiled: dict[int, re.Pattern | None] = {}
+
+    @classmethod
+    def load(cls, source: str | Path) -> "MatchIndex":
+        """Load from a local path or URL; .gz and .br variants are decoded."""
+        name = str(source)
+        raw = _read(source)
+        if name.endswith(".gz"):
+            raw = gzip.decompress(raw)
+        elif name.endswith(".br"):
+            import brotli  # optional; only needed for .br sources
+            raw = brotli.decompress(raw)
+        return cls(json.loads(raw))
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def _regex(self, i: int) -> re.Pattern | None:
+        if i not in self._compiled:
+            try:
+                self._compiled[i] = re.compile(self.columns["re"][i], re.IGNORECASE)
+            except re.error:
+                self._compiled[i] = None
+        return self._compiled[i]
+
+    def candidates(self, error_message: str) -> list[int]:
+        """Row indexes whose literal prefilter admits the message."""
+        lowered = error_message.lower()
+        return [
+            i for i, lits in enumerate(self.columns["lit"])
+            if not lits or any(lit in lowered for lit in lits)
+        ]
+
+    def match(self, error_message: str, limit: int | None = None) -> list[dict]:
+        """Return the patterns whose regex matches, highest fix rate first."""
+        cols = self.columns
+        hits = []
+        for i in self.candidates(error_message):
+            pattern = self._regex(i)
+            if pattern is None or not pattern.search(error_message):
+                continue
+            hits.append({
+                "id": cols["id"][i],
+                "signature": cols["sig"][i],
+                "domain": self.domains[cols["domain"][i]],
+                "resolvable": cols["ok"][i],
+                "fix_success_rate": cols["rate"][i],
+                "confidence": cols["conf"][i],
+                "dead_ends": cols["de"][i],
+                "workarounds": cols["wa"][i],
+                "url": self.url_template.replace("{id}", cols["id"][i]),
+            })
+        hits.sort(key=lambda h: h["fix_success_rate"], reverse=True)
+        return hits[:limit] if limit is not None else hits
+
+
+def sync_snapshot(snapshot_path: str | Path, source: str | Path = SITE_URL) -> dict:
+    """Bring a local snapshot of all canons up to date with the published site.
+
+    The snapshot is a JSON file {"corpus": <hash>, "canons": {id: canon}}.
+    Deltas from /api/v1/changes/ are applied in order starting at the
+    snapshot's corpus hash; when the chain does not reach the latest hash
+    (or there is no snapshot yet) the full errors.ndjson is loaded instead.
+    source is the site root URL, or a local built site directory.
+    """
+    base = str(source).rstrip("/")
+    snapshot_path = Path(snapshot_path)
+    index = json.loads(_read(f"{base}/api/v1/changes/index.json"))
+    latest = index["latest"]
+
+    snapshot = None
+    if snapshot_path.is_file():
+        snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    previous = snapshot["corpus"] if snapshot else None
+    canons: dict[str, dict] = snapshot["canons"] if snapshot else {}
+
+    by_from = {d["from"]: d for d in index["deltas"]}
+    current = previous
+    applied = []
+    while current != latest and current in by_from and len(applied) < len(by_from):
+        delta = by_from[current]
+        for line in _read(f"{base}/api/v1/changes/{delta['file']}").splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record["op"] == "removed":
+                canons.pop(record["id"], None)
+            else:
+                canons[record["id"]] = record["canon"]
+        applied.append(delta["file"])
+        current = delta["to"]
+
+    full_reload = current != latest
+    if full_reload:
+        canons = {}
+        for line in _read(f"{base}/api/v1/errors.ndjson").splitlines():
+            if line.strip():
+                canon = json.loads(line)
+                canons[canon["id"]] = canon
+
+    if previous != latest or full_reload:
+        tmp = snapshot_path.with_name(snapshot_path.name + ".tmp")
+        tmp.write_text(
+            json.dumps({"corpus": latest, "canons": canons}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp, snapshot_path)
+    return {
+        "previous": previous,
+        "corpus": latest,
+        "deltas_applied": applied,
+        "full_reload": full_reload,
+        "canons": len(canons),
+    }
+
+
 def main():
     """CLI interface for error lookup."""
     if len(sys.argv) < 2:
         print("Usage: python -m generator.lookup 'ERROR MESSAGE'")
         print("       python -m generator.lookup --list")
+        print("       python -m generator.lookup --sync SNAPSHOT.json [SITE_URL]")
         sys.exit(1)
 
+    if sys.argv[1] == "--sync":
+        if len(sys.argv) not in (3, 4):
+            print("Usage: python -m generator.lookup --sync SNAPSHOT.json [SITE_URL]",
+                  file=sys.stderr)
+            sys.exit(2)
+        result = sync_snapshot(*sys.argv[2:4])
+        how = "full reload" if result["full_reload"] else (
+            f"{len(result['deltas_applied'])} delta(s)"
+        )
+        print(f"Snapshot at {result['corpus']} ({result['canons']} canons, {how})")
+        sys.exit(0)
+
     if sys.argv[1] == "--list":
         canons = _load_canons()
         domains: dict[str, list[str]] = {}
@@ -4,6 +4,7 @@ Usage:
     python -m generator.pipeline          # Full pipeline
     python -m generator.pipeline --build  # Build only (skip generation)
     python -m generator.pipeline --gen    # Generate canons only
+    python -m generator.pipeline --report pipeline-report.json  # Per-step metrics
 """
 
 import argparse
@@ -12,6 +13,8 @@ import sys
 import time
 from pathlib import Path
 
+from generator.profiling import BuildProfiler
+
 PROJECT_ROOT = Path(__file__).parent.parent
 
 STEPS = {
@@ -38,17 +41,24 @@ STEPS = {
 }
 
 
-def run_step(name: str, step: dict) -> bool:
-    """Run a pipeline step and return True if successful."""
+def run_step(name: str, step: dict, profiler: BuildProfiler | None = None) -> bool:
+    """Run a pipeline step and return True if successful.
+
+    With a profiler, the step's wall time, child CPU time and child RSS
+    (growth of the children's high-water mark) are recorded as a stage.
+    """
     print(f"\n{'='*60}")
     print(f"  STEP: {name} — {step['desc']}")
     print(f"{'='*60}\n")
 
+    profiler = profiler or BuildProfiler()
     start = time.time()
-    result = subprocess.run(
-        step["cmd"],
-        cwd=str(PROJECT_ROOT),
-    )
+    with profiler.stage(name) as record:
+        result = subprocess.run(
+            step["cmd"],
+            cwd=str(PROJECT_ROOT),
+        )
+        record["returncode"] = result.returncode
     elapsed = time.time() - start
 
     status = "PASSED" if result.returncode == 0 else "FAILED"
@@ -60,6 +70,10 @@ def main():
     parser = argparse.ArgumentParser(description="deadends.dev pipeline")
     parser.add_argument("--build", action="store_true", help="Build only")
     parser.add_argument("--gen", action="store_true", help="Generate only")
+    parser.add_argument(
+        "--report", type=Path, metavar="PATH",
+        help="Write per-step timing/CPU/memory metrics as JSON",
+    )
     args = parser.parse_args()
 
     print("=" * 60)
@@ -74,8 +88,9 @@ def main():
         steps_to_run = list(STEPS.keys())
 
     results = {}
+    profiler = BuildProfiler()
     for name in steps_to_run:
-        ok = run_step(name, STEPS[name])
+        ok = run_step(name, STEPS[name], profiler)
         results[name] = ok
         if not ok and name != "validate-site":
             # validate-site warnings shouldn't stop the pipeline
@@ -90,6 +105,9 @@ def main():
         print(f"  [{icon}] {name}")
 
     all_ok = all(results.values())
+    if args.report:
+        profiler.write_report(args.report, passed=all_ok)
+        print(f"\n  Step report written to {args.report}")
     print(f"\n  {'Pipeline PASSED' if all_ok else 'Pipeline FAILED'}")
     sys.exit(0 if all_ok else 1)
 
@@ -0,0 +1,255 @@
+"""Checkpointed pipeline state: which items finished which stage, and how.
+
+One SQLite row per (item, stage) with status, attempt count, last error and
+timestamps, in data/pipeline/state.db. Items are pair ids ("domain/slug/env"),
+except the signature stage, which is keyed by signature dedup hash.
+
+Collectors claim work with ``claim`` instead of statting output files, so
+parallel runs never pick the same item, crashed runs are picked up again
+after a lease expires, and failures are recorded for ``--retry-failed``.
+
+Usage:
+    python -m generator.pipeline_state                 # counts per stage
+    python -m generator.pipeline_state --failed canon  # failures with errors
+    python -m generator.pipeline_state --stale-days 30 evidence
+"""
+
+import argparse
+import os
+import platform
+import sqlite3
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+STATE_DB = PROJECT_ROOT / "data" / "pipeline" / "state.db"
+
+STAGES = ("signature", "pair", "evidence", "canon", "validated")
+STATUSES = ("pending", "running", "done", "failed")
+
+# A "running" row older than this belongs to a dead worker and may be reclaimed
+DEFAULT_LEASE_S = 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    item TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    worker TEXT,
+    claimed_at REAL,
+    completed_at REAL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (stage, item)
+);
+CREATE INDEX IF NOT EXISTS items_status ON items (stage, status, completed_at);
+"""
+
+
+class PipelineState:
+    """SQLite-backed stage tracker. Use one instance per thread or process.
+
+    ``clock`` is injectable so tests can age rows without sleeping.
+    """
+
+    def __init__(self, path: Path = STATE_DB, lease: float = DEFAULT_LEASE_S,
+                 clock: Callable[[], float] = time.time):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease = lease
+        self.clock = clock
+        self.worker = f"{platform.node()}:{os.getpid()}"
+        self.db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _check(self, stage: str) -> None:
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage '{stage}' (expected one of {', '.join(STAGES)})")
+
+    def claim(self, stage: str, item: str, *, force: bool = False,
+              retry_failed: bool = False, stale_days: float | None = None,
+              done: Callable[[str], bool] | None = None, peek: bool = False) -> bool:
+        """Atomically mark ``item`` running for this worker if it needs work.
+
+        New and pending items are always claimable, as are "running" rows
+        whose lease expired. Failed items need ``retry_failed``; done items
+        need ``force`` or a completion older than ``stale_days``. For an item
+        with no row yet, ``done(item)`` may adopt existing output as done
+        (checked once; afterwards the row answers). ``peek`` answers without
+        writing anything (for dry runs).
+        """
+        self._check(stage)
+        now = self.clock()
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.db.execute(
+                "SELECT status, claimed_at, completed_at FROM items WHERE stage = ? AND item = ?",
+                (stage, item),
+            ).fetchone()
+            if row is None and done is not None and done(item):
+                self.db.execute(
+                    "INSERT INTO items (item, stage, status, completed_at, updated_at) "
+                    "VALUES (?, ?, 'done', ?, ?)",
+                    (item, stage, now, now),
+                )
+                row = ("done", None, now)
+            claimable = row is None or self._claimable(row, now, force, retry_failed, stale_days)
+            if peek or not claimable:
+                self.db.execute("ROLLBACK" if peek else "COMMIT")
+                return claimable
+            self.db.execute(
+                "INSERT INTO items (item, stage, status, attempts, worker, claimed_at, "
+                "updated_at) VALUES (?, ?, 'running', 1, ?, ?, ?) "
+                "ON CONFLICT (stage, item) DO UPDATE SET status = 'running', "
+                "attempts = attempts + 1, worker = excluded.worker, "
+                "claimed_at = excluded.claimed_at, updated_at = excluded.updated_at",
+                (item, stage, self.worker, now, now),
+            )
+            self.db.execute("COMMIT")
+            return True
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+
+    def _claimable(self, row: tuple, now: float, force: bool, retry_failed: bool,
+                   stale_days: float | None) -> bool:
+        status, claimed_at, completed_at = row
+        if status == "pending":
+            return True
+        if status == "running":
+            return now - (claimed_at or 0) > self.lease
+        if status == "failed":
+            return retry_failed or force
+        if force:
+            return True
+        return stale_days is not None and now - (completed_at or 0) > stale_days * 86400
+
+    def claimed(self, stage: str, items: Iterable[dict], key: str = "id",
+                **options) -> Iterator[dict]:
+        """Lazily yield the records of ``items`` that this worker claims."""
+        for record in items:
+            if self.claim(stage, record[key], **options):
+                yield record
+
+    def complete(self, stage: str, item: str) -> None:
+        self._finish(stage, item, "done", None)
+
+    def fail(self, stage: str, item: str, error: str) -> None:
+        self._finish(stage, item, "failed", error)
+
+    def _finish(self, stage: str, item: str, status: str, error: str | None) -> None:
+        self._check(stage)
+        now = self.clock()
+        self.db.execute(
+            "INSERT INTO items (item, stage, status, attempts, error, completed_at, updated_at) "
+            "VALUES (?, ?, ?, 1, ?, ?, ?) "
+            "ON CONFLICT (stage, item) DO UPDATE SET status = excluded.status, "
+            "error = excluded.error, completed_at = excluded.completed_at, "
+            "updated_at = excluded.updated_at",
+            (item, stage, status, error, now if status == "done" else None, now),
+        )
+
+    def mark_done(self, stage: str, items: Iterable[str]) -> None:
+        """Record many items as done in one transaction (e.g. generator outputs)."""
+        self._check(stage)
+        now = self.clock()
+        self.db.execute("BEGIN")
+        self.db.executemany(
+            "INSERT INTO items (item, stage, status, attempts, completed_at, updated_at) "
+            "VALUES (?, ?, 'done', 1, ?, ?) "
+            "ON CONFLICT (stage, item) DO UPDATE SET status = 'done', error = NULL, "
+            "completed_at = excluded.completed_at, updated_at = excluded.updated_at",
+            ((item, stage, now, now) for item in items),
+        )
+        self.db.execute("COMMIT")
+
+    def status(self, stage: str, item: str) -> dict | None:
+        self._check(stage)
+        cur = self.db.execute(
+            "SELECT item, stage, status, attempts, error, worker, claimed_at, completed_at, "
+            "updated_at FROM items WHERE stage = ? AND item = ?",
+            (stage, item),
+        )
+        row = cur.fetchone()
+        return dict(zip([c[0] for c in cur.description], row)) if row else None
+
+    def items(self, stage: str, status: str | None = None,
+              stale_days: float | None = None) -> list[dict]:
+        """Rows of a stage, optionally by status and/or completed > stale_days ago."""
+        self._check(stage)
+        sql = "SELECT item, status, attempts, error, completed_at FROM items WHERE stage = ?"
+        args: list = [stage]
+        if status is not None:
+            sql += " AND status = ?"
+            args.append(status)
+        if stale_days is not None:
+            sql += " AND status = 'done' AND completed_at < ?"
+            args.append(self.clock() - stale_days * 86400)
+        cur = self.db.execute(sql + " ORDER BY item", args)
+        names = [c[0] for c in cur.description]
+        return [dict(zip(names, row)) for row in cur]
+
+    def counts(self) -> dict[str, dict[str, int]]:
+        """{stage: {status: count}} for every stage with rows, in pipeline order."""
+        counts: dict[str, dict[str, int]] = {}
+        for stage, status, n in self.db.execute(
+            "SELECT stage, status, COUNT(*) FROM items GROUP BY stage, status"
+        ):
+            counts.setdefault(stage, {})[status] = n
+        return {stage: counts[stage] for stage in STAGES if stage in counts}
+
+
+def add_state_arguments(parser) -> None:
+    """Add the shared --state / --retry-failed / --stale-days CLI options."""
+    parser.add_argument("--state", type=Path, default=STATE_DB,
+                        help="Pipeline state database (SQLite)")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Also retry items whose last attempt failed")
+    parser.add_argument("--stale-days", type=float, default=None, metavar="DAYS",
+                        help="Also redo items completed more than DAYS ago")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect the pipeline state store")
+    parser.add_argument("stage", nargs="?", choices=STAGES, help="Stage to list")
+    parser.add_argument("--db", type=Path, default=STATE_DB, help="State database")
+    parser.add_argument("--failed", action="store_true", help="List failed items")
+    parser.add_argument("--stale-days", type=float, default=None,
+                        help="List items completed more than this many days ago")
+    args = parser.parse_args()
+
+    if not args.db.exists():
+        print(f"No pipeline state at {args.db}")
+        return
+
+    with PipelineState(args.db) as state:
+        if args.stage is None:
+            for stage, counts in state.counts().items():
+                summary = ", ".join(f"{counts.get(s, 0)} {s}" for s in STATUSES)
+                print(f"{stage:<10} {summary}")
+            return
+
+        rows = state.items(args.stage, "failed" if args.failed else None, args.stale_days)
+        for row in rows:
+            line = f"{row['item']}  {row['status']}  attempts={row['attempts']}"
+            if row["error"]:
+                line += f"  {row['error']}"
+            print(line)
+        print(f"{len(rows)} item(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Lightweight build instrumentation: per-stage timing, memory and output stats.
+
+Used by build_site (``--report`` / ``--profile``) and the pipeline runner to
+produce a machine-readable JSON report that can be diffed between builds.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_kb(children: bool = False) -> int | None:
+    """Peak resident set size in KiB of this process (or its reaped children)."""
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    maxrss = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is bytes on macOS, KiB on Linux
+    return maxrss // 1024 if sys.platform == "darwin" else maxrss
+
+
+def children_cpu_s() -> float:
+    """User + system CPU seconds consumed by reaped child processes."""
+    t = os.times()
+    return t.children_user + t.children_system
+
+
+def _rss_fields(prefix: str, before: int | None, after: int | None) -> dict:
+    """Per-stage growth and cumulative high-water mark of an RSS peak."""
+    growth = None if after is None else max(0, after - (before or 0))
+    return {f"{prefix}_growth_kb": growth, f"{prefix}_high_water_kb": after}
+
+
+class BuildProfiler:
+    """Collect per-stage metrics for one build.
+
+    ``outputs`` is the build's list of written paths; files and bytes written
+    by a stage are taken from the entries it appended.
+
+    The OS only reports a process-lifetime RSS high-water mark, so each stage
+    records how far it raised that mark (``rss_growth_kb``, 0 if it stayed
+    below an earlier stage's peak) next to the cumulative
+    ``rss_high_water_kb``; likewise for reaped child processes.
+    """
+
+    def __init__(self, outputs: list[Path] | None = None):
+        self.outputs = outputs if outputs is not None else []
+        self.stages: list[dict] = []
+        self.started = time.perf_counter()
+        self.started_cpu = time.process_time() + children_cpu_s()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a stage; yields its record so callers can add fields."""
+        record: dict = {"name": name}
+        start_out = len(self.outputs)
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        child_cpu = children_cpu_s()
+        rss = peak_rss_kb()
+        child_rss = peak_rss_kb(children=True)
+        try:
+            yield record
+        finally:
+            written = self.outputs[start_out:]
+            record["wall_s"] = round(time.perf_counter() - wall, 4)
+            record["cpu_s"] = round(time.process_time() - cpu, 4)
+            record["child_cpu_s"] = round(children_cpu_s() - child_cpu, 4)
+            record.update(_rss_fields("rss", rss, peak_rss_kb()))
+            record.update(_rss_fields("child_rss", child_rss, peak_rss_kb(children=True)))
+            record["files_written"] = len(written)
+            record["bytes_written"] = sum(
+                p.stat().st_size for p in written if p.is_file()
+            )
+            self.stages.append(record)
+
+    def report(self, templates: dict[str, list] | None = None, **extra) -> dict:
+        """Build the JSON-serializable report for all recorded stages."""
+        report = {
+            "generated": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "wall_s": round(time.perf_counter() - self.started, 4),
+            "cpu_s": round(
+                time.process_time() + children_cpu_s() - self.started_cpu, 4
+            ),
+            "peak_rss_kb": peak_rss_kb(),
+            "peak_child_rss_kb": peak_rss_kb(children=True),
+            "files_written": sum(s["files_written"] for s in self.stages),
+            "bytes_written": sum(s["bytes_written"] for s in self.stages),
+            **extra,
+            "stages": self.stages,
+        }
+        if templates is not None:
+            report["templates"] = {
+                name: {"renders": count, "total_s": round(total, 4)}
+                for name, (total, count) in sorted(templates.items())
+            }
+        return report
+
+    def write_report(self, path: Path, **kwargs) -> dict:
+        """Write the report as JSON to path and return it."""
+        report = self.report(**kwargs)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        return report
+
+    def print_summary(self, top: int = 5) -> None:
+        """Print the slowest stages."""
+        print(f"Slowest stages (of {len(self.stages)}):")
+        for s in sorted(self.stages, key=lambda s: s["wall_s"], reverse=True)[:top]:
+            print(
+                f"  {s['name']:<24} {s['wall_s']:7.2f}s wall "
+                f"{s['cpu_s'] + s['child_cpu_s']:7.2f}s cpu "
+                f"{s['files_written']:6d} files"
+            )
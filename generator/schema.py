@@ -1,5 +1,11 @@
 """ErrorCanon JSON Schema definition and validation."""
 
+import argparse
+import json
+import time
+from functools import lru_cache
+from pathlib import Path
+
 ERRORCANON_SCHEMA = {
     "$schema": "https://json-schema.org/draft/2020-12/schema",
     "type": "object",
@@ -199,3 +205,79 @@ ERRORCANON_SCHEMA = {
         },
     },
 }
+
+
+@lru_cache(maxsize=None)
+def get_validator():
+    """Return the ErrorCanon validator, built (and the schema checked) once.
+
+    jsonschema.validate() re-checks the schema against its metaschema and
+    builds a new validator on every call; reuse this instead.
+    """
+    from jsonschema.validators import validator_for
+
+    cls = validator_for(ERRORCANON_SCHEMA)
+    cls.check_schema(ERRORCANON_SCHEMA)
+    return cls(ERRORCANON_SCHEMA)
+
+
+def schema_error(instance: dict):
+    """Return the most relevant ValidationError for instance, or None if valid.
+
+    Same error jsonschema.validate() would raise.
+    """
+    from jsonschema.exceptions import best_match
+
+    return best_match(get_validator().iter_errors(instance))
+
+
+def benchmark(canon_files: list[Path]) -> dict[str, float]:
+    """Time per-canon schema validation: uncached validate() vs get_validator()."""
+    from jsonschema import validate
+
+    canons = [json.loads(f.read_text(encoding="utf-8")) for f in canon_files]
+    start = time.perf_counter()
+    for canon in canons:
+        try:
+            validate(instance=canon, schema=ERRORCANON_SCHEMA)
+        except Exception:
+            pass
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    get_validator()
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    for canon in canons:
+        schema_error(canon)
+    cached = time.perf_counter() - start
+
+    return {
+        "canons": len(canons),
+        "uncached_us_per_canon": round(uncached / len(canons) * 1e6, 1),
+        "cached_us_per_canon": round(cached / len(canons) * 1e6, 1),
+        "validator_build_ms": round(build * 1e3, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ErrorCanon schema tools")
+    parser.add_argument(
+        "--bench", type=int, nargs="?", const=200, metavar="N",
+        help="Benchmark per-canon validation over the first N canons (default 200)",
+    )
+    args = parser.parse_args()
+    if args.bench is None:
+        print(json.dumps(ERRORCANON_SCHEMA, indent=2))
+        return
+
+    data_dir = Path(__file__).parent.parent / "data" / "canons"
+    result = benchmark(sorted(data_dir.rglob("*.json"))[: args.bench])
+    print(f"Validated {result['canons']} canons")
+    print(f"  jsonschema.validate(): {result['uncached_us_per_canon']:>10.1f} us/canon")
+    print(f"  cached validator:      {result['cached_us_per_canon']:>10.1f} us/canon "
+          f"(+ {result['validator_build_ms']} ms once)")
+
+
+if __name__ == "__main__":
+    main()
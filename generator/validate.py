@@ -1,16 +1,21 @@
 """Validation script for ErrorCanon JSON files and generated HTML pages."""
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-from jsonschema import ValidationError, validate
-
-from generator.schema import ERRORCANON_SCHEMA
+from generator.schema import ERRORCANON_SCHEMA, schema_error
 
 BASE_URL = "https://deadends.dev"
+VALIDATE_CACHE_NAME = ".validate-cache.json"
+# Written next to data/canons on every data validation run (gitignored)
+GRAPH_REPORT_NAME = ".graph-report.json"
 
 
 def validate_canon_json(data: dict) -> tuple[list[str], list[str]]:
@@ -22,10 +27,9 @@ def validate_canon_json(data: dict) -> tuple[list[str], list[str]]:
     warnings = []
 
     # Schema validation
-    try:
-        validate(instance=data, schema=ERRORCANON_SCHEMA)
-    except ValidationError as e:
-        errors.append(f"Schema validation error: {e.message}")
+    error = schema_error(data)
+    if error is not None:
+        errors.append(f"Schema validation error: {error.message}")
         return errors, warnings  # No point checking business rules if schema fails
 
     # Business rule: dead_ends must have at least 1 item
@@ -98,45 +102,165 @@ def validate_canon_json(data: dict) -> tuple[list[str], list[str]]:
     return errors, warnings
 
 
+_REF_FIELDS = ("leads_to", "preceded_by", "frequently_confused_with")
+
+
+def _canon_refs(canon: dict) -> list[list]:
+    """[field, error_id, probability] per transition_graph reference, in file order.
+
+    probability is None for frequently_confused_with entries.
+    """
+    graph = canon.get("transition_graph", {})
+    return [
+        [field, ref["error_id"], ref.get("probability")]
+        for field in _REF_FIELDS
+        for ref in graph.get(field, [])
+        if isinstance(ref, dict) and "error_id" in ref
+    ]
+
+
+def _cross_reference_warnings(nodes: list[tuple[str, list[list]]]) -> list[str]:
+    """Cross-reference warnings from (canon id, refs) pairs."""
+    known_ids = {cid for cid, _ in nodes}
+    warnings = []
+    for cid, refs in nodes:
+        for field, target, _ in refs:
+            if target not in known_ids:
+                if field == "frequently_confused_with":
+                    warnings.append(
+                        f"{cid}: transition_graph.frequently_confused_with "
+                        f"references non-existent error '{target}'"
+                    )
+                else:
+                    warnings.append(
+                        f"{cid}: transition_graph.{field} references "
+                        f"non-existent error '{target}'"
+                    )
+    return warnings
+
+
 def validate_cross_references(canons: list[dict]) -> list[str]:
     """Validate that all referenced error_ids exist in the dataset.
 
     Returns warnings (not errors) since early data may reference future pages.
     """
-    warnings = []
-    known_ids = {c["id"] for c in canons}
+    return _cross_reference_warnings([(c["id"], _canon_refs(c)) for c in canons])
 
-    for canon in canons:
-        graph = canon.get("transition_graph", {})
 
-        for lt in graph.get("leads_to", []):
-            if lt["error_id"] not in known_ids:
-                warnings.append(
-                    f"{canon['id']}: transition_graph.leads_to references "
-                    f"non-existent error '{lt['error_id']}'"
-                )
+def validate_graph(nodes: list[tuple[str, list[list]]]) -> dict:
+    """Check transition graph integrity in one pass over (canon id, refs) pairs.
 
-        for pb in graph.get("preceded_by", []):
-            if pb["error_id"] not in known_ids:
-                warnings.append(
-                    f"{canon['id']}: transition_graph.preceded_by references "
-                    f"non-existent error '{pb['error_id']}'"
-                )
+    Reports dangling references, self-loops, outgoing leads_to probability
+    sums above 1, leads_to/preceded_by pairs missing their reverse edge, and
+    the connected components of the transition graph (clusters unreachable
+    from the largest one). Lists are sorted so reports diff cleanly.
+    """
+    known_ids = {cid for cid, _ in nodes}
+    parent = {cid: cid for cid in known_ids}
+
+    def find(x: str) -> str:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    edges = {field: 0 for field in _REF_FIELDS}
+    forward: set[tuple[str, str]] = set()  # a leads_to b
+    backward: set[tuple[str, str]] = set()  # b preceded_by a, i.e. edge a -> b
+    dangling, self_loops, over_one = [], [], []
+    for cid, refs in nodes:
+        outgoing = 0.0
+        for field, target, probability in refs:
+            edges[field] += 1
+            if target == cid:
+                self_loops.append([cid, field])
+                continue
+            if target not in known_ids:
+                dangling.append([cid, field, target])
+                continue
+            if field == "leads_to":
+                outgoing += probability or 0.0
+                forward.add((cid, target))
+            elif field == "preceded_by":
+                backward.add((target, cid))
+            else:
+                continue
+            root_a, root_b = find(cid), find(target)
+            if root_a != root_b:
+                parent[root_a] = root_b
+        if outgoing > 1.0 + 1e-9:
+            over_one.append({"id": cid, "sum": round(outgoing, 6)})
+
+    asymmetric = sorted(
+        [{"from": a, "to": b, "missing": "preceded_by"} for a, b in forward - backward]
+        + [{"from": a, "to": b, "missing": "leads_to"} for a, b in backward - forward],
+        key=lambda e: (e["from"], e["to"], e["missing"]),
+    )
 
-        for fc in graph.get("frequently_confused_with", []):
-            if fc["error_id"] not in known_ids:
-                warnings.append(
-                    f"{canon['id']}: transition_graph.frequently_confused_with "
-                    f"references non-existent error '{fc['error_id']}'"
-                )
+    components: dict[str, list[str]] = {}
+    for cid in sorted(known_ids):
+        components.setdefault(find(cid), []).append(cid)
+    ranked = sorted(components.values(), key=lambda c: (-len(c), c[0]))
+    clusters = [c for c in ranked[1:] if len(c) > 1]
+
+    return {
+        "nodes": len(known_ids),
+        "edges": edges,
+        "dangling": sorted(dangling),
+        "self_loops": sorted(self_loops),
+        "probability_over_1": sorted(over_one, key=lambda e: e["id"]),
+        "asymmetric": asymmetric,
+        "components": {
+            "count": len(ranked),
+            "largest": len(ranked[0]) if ranked else 0,
+            "isolated": sum(1 for c in ranked if len(c) == 1),
+            "unreachable_clusters": clusters,
+        },
+    }
+
+
+def _graph_errors(report: dict) -> list[str]:
+    """Graph problems that fail validation (the rest are reported as warnings).
+
+    Self-loops and leads_to probability sums above 1 are never intended and
+    the corpus has none, so they fail validation rather than accumulate.
+    """
+    errors = [
+        f"{cid}: transition_graph.{field} references itself"
+        for cid, field in report["self_loops"]
+    ]
+    errors += [
+        f"{e['id']}: transition_graph.leads_to probabilities sum to {e['sum']} > 1"
+        for e in report["probability_over_1"]
+    ]
+    return errors
 
-    return warnings
 
+_JSON_LD_RE = re.compile(
+    r'<script type="application/ld\+json">\s*(.*?)\s*</script>', re.DOTALL
+)
 
-def validate_html(html_path: Path) -> list[str]:
-    """Validate a generated HTML page."""
+
+def _parse_json_ld(content: str) -> tuple[dict | None, str | None]:
+    """Extract the page's JSON-LD.
+
+    Returns (data, None) on success, else (None, problem) where problem is
+    "missing" or the JSON decode error message.
+    """
+    json_ld_match = _JSON_LD_RE.search(content)
+    if not json_ld_match:
+        return None, "missing"
+    try:
+        return json.loads(json_ld_match.group(1)), None
+    except json.JSONDecodeError as e:
+        return None, str(e)
+
+
+def _html_errors(
+    html_path: Path, content: str, ld_data: dict | None, ld_problem: str | None
+) -> list[str]:
+    """Structural checks of an error page."""
     errors = []
-    content = html_path.read_text(encoding="utf-8")
 
     # Must contain JSON-LD
     if 'application/ld+json' not in content:
@@ -154,43 +278,28 @@ def validate_html(html_path: Path) -> list[str]:
     if 'id="dead-ends"' not in content:
         errors.append(f"{html_path}: Missing dead-ends section")
 
-    # Extract and validate embedded JSON-LD
-    json_ld_match = re.search(
-        r'<script type="application/ld\+json">\s*(.*?)\s*</script>',
-        content,
-        re.DOTALL,
-    )
-    if json_ld_match:
-        try:
-            json.loads(json_ld_match.group(1))
-        except json.JSONDecodeError as e:
-            errors.append(f"{html_path}: Invalid JSON-LD: {e}")
-    else:
+    # Embedded JSON-LD must parse
+    if ld_problem == "missing":
         errors.append(f"{html_path}: Could not extract JSON-LD")
+    elif ld_problem:
+        errors.append(f"{html_path}: Invalid JSON-LD: {ld_problem}")
 
     return errors
 
 
-def validate_html_json_consistency(
-    html_path: Path, canons_by_id: dict[str, dict]
+def _consistency_errors(
+    html_path: Path,
+    ld_data: dict | None,
+    ld_problem: str | None,
+    canons_by_id: dict[str, dict],
 ) -> list[str]:
-    """Verify that HTML page content matches the source JSON data."""
-    errors = []
-    content = html_path.read_text(encoding="utf-8")
-
-    json_ld_match = re.search(
-        r'<script type="application/ld\+json">\s*(.*?)\s*</script>',
-        content,
-        re.DOTALL,
-    )
-    if not json_ld_match:
+    """Check that a page's JSON-LD verdict matches its source canon."""
+    if ld_problem == "missing":
         return [f"{html_path}: Could not extract JSON-LD for consistency check"]
-
-    try:
-        ld_data = json.loads(json_ld_match.group(1))
-    except json.JSONDecodeError:
+    if ld_problem:
         return [f"{html_path}: Invalid JSON-LD for consistency check"]
 
+    errors = []
     canon_id = ld_data.get("id")
     if canon_id and canon_id in canons_by_id:
         source = canons_by_id[canon_id]
@@ -209,10 +318,129 @@ def validate_html_json_consistency(
     return errors
 
 
+def validate_html(html_path: Path) -> list[str]:
+    """Validate a generated HTML page."""
+    content = html_path.read_text(encoding="utf-8")
+    return _html_errors(html_path, content, *_parse_json_ld(content))
+
+
+def validate_html_json_consistency(
+    html_path: Path, canons_by_id: dict[str, dict]
+) -> list[str]:
+    """Verify that HTML page content matches the source JSON data."""
+    content = html_path.read_text(encoding="utf-8")
+    return _consistency_errors(html_path, *_parse_json_ld(content), canons_by_id)
+
+
+def validate_page(
+    html_path: Path, canons_by_id: dict[str, dict] | None = None
+) -> tuple[list[str], list[str]]:
+    """Read and parse a page once; return (html errors, consistency errors).
+
+    Consistency is only checked when canons_by_id is given.
+    """
+    content = html_path.read_text(encoding="utf-8")
+    ld_data, ld_problem = _parse_json_ld(content)
+    html_errors = _html_errors(html_path, content, ld_data, ld_problem)
+    if not canons_by_id:
+        return html_errors, []
+    return html_errors, _consistency_errors(html_path, ld_data, ld_problem, canons_by_id)
+
+
+def _canon_entry(canon_file: Path, check: bool = True) -> dict:
+    """Load (and optionally validate) one canon file into a cacheable summary.
+
+    The entry keeps what later checks need — id, references, verdict — so
+    cached runs never re-parse unchanged files.
+    """
+    raw = canon_file.read_bytes()
+    entry = {
+        "hash": hashlib.sha256(raw).hexdigest(),
+        "parsed": False,
+        "id": None,
+        "refs": [],
+        "verdict": None,
+        "errors": [],
+        "warnings": [],
+    }
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as e:
+        entry["errors"] = [f"Invalid JSON: {e}"]
+        return entry
+    entry["parsed"] = True
+    if check:
+        entry["errors"], entry["warnings"] = validate_canon_json(data)
+    entry["id"] = data.get("id")
+    entry["refs"] = _canon_refs(data)
+    verdict = data.get("verdict", {})
+    entry["verdict"] = {
+        "resolvable": verdict.get("resolvable"),
+        "fix_success_rate": verdict.get("fix_success_rate"),
+    }
+    return entry
+
+
+def _rules_digest() -> str:
+    """Version of the validation rules: the schema plus this module's source."""
+    h = hashlib.sha256(json.dumps(ERRORCANON_SCHEMA, sort_keys=True).encode("utf-8"))
+    h.update(Path(__file__).read_bytes())
+    return h.hexdigest()
+
+
+def _load_cache(cache_path: Path, rules: str) -> dict[str, dict]:
+    """Cached entries by relative path (empty if missing or rules changed)."""
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if cache.get("rules") != rules:
+        return {}
+    return cache.get("entries", {})
+
+
+def _save_cache(cache_path: Path, rules: str, entries: dict[str, dict]) -> None:
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    tmp.write_text(
+        json.dumps({"version": 1, "rules": rules, "entries": entries}),
+        encoding="utf-8",
+    )
+    os.replace(tmp, cache_path)
+
+
+# Per-worker state for pooled page checks (set once by the initializer)
+_worker_canons: dict[str, dict] | None = None
+
+
+def _init_page_worker(canons_by_id: dict[str, dict] | None) -> None:
+    global _worker_canons
+    _worker_canons = canons_by_id
+
+
+def _validate_page_worker(html_path: Path) -> tuple[list[str], list[str]]:
+    return validate_page(html_path, _worker_canons)
+
+
+def _map(fn, items: list, jobs: int, initializer=None, initargs=()) -> list:
+    """Map fn over items in order, across a process pool when jobs > 1."""
+    if jobs <= 1 or len(items) < 2:
+        if initializer:
+            initializer(*initargs)
+        return [fn(item) for item in items]
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=initializer, initargs=initargs
+    ) as pool:
+        return list(pool.map(fn, items, chunksize=chunksize))
+
+
 def validate_all(
     data_dir: Path | None = None,
     site_dir: Path | None = None,
     skip_data_validation: bool = False,
+    jobs: int = 1,
+    cache_path: Path | None = None,
+    graph_report: Path | None = None,
 ) -> bool:
     """Validate canon JSON files and/or generated HTML.
 
@@ -222,49 +450,103 @@ def validate_all(
         site_dir: Path to generated site. If provided, validates HTML pages.
         skip_data_validation: If True, loads canon data (for consistency checks)
             but skips JSON schema/business rule validation.
+        jobs: Number of worker processes for per-file checks. Output order is
+            the sorted file order regardless of jobs.
+        cache_path: Optional validation cache file. Canon files whose content
+            hash (and the schema/rules version) match a cached entry are not
+            re-parsed or re-validated; cross-references and site consistency
+            use the cached ids, references and verdicts.
+        graph_report: Optional path for the JSON transition graph integrity
+            report (see validate_graph); written when data is validated.
 
     Returns True if all validations pass (warnings don't cause failure).
     """
     all_errors = []
     all_warnings = []
-    all_canons = []
+    entries: list[dict] = []
 
     # Load and optionally validate canon JSON files
     if data_dir:
-        canon_files = list(data_dir.rglob("*.json"))
+        canon_files = sorted(data_dir.rglob("*.json"))
         if not canon_files:
             print("WARNING: No canon JSON files found")
         else:
-            for canon_file in canon_files:
-                try:
-                    with open(canon_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                    all_canons.append(data)
-
-                    if not skip_data_validation:
-                        errors, warnings = validate_canon_json(data)
-                        for error in errors:
-                            all_errors.append(f"{canon_file}: {error}")
-                            print(f"  FAIL: {canon_file}: {error}")
-                        for warning in warnings:
-                            all_warnings.append(f"{canon_file}: {warning}")
-                            print(f"  WARN: {canon_file}: {warning}")
-                        if not errors:
-                            print(f"  OK: {canon_file}")
-                except json.JSONDecodeError as e:
-                    all_errors.append(f"{canon_file}: Invalid JSON: {e}")
-                    print(f"  FAIL: {canon_file}: Invalid JSON: {e}")
-
-            if not skip_data_validation:
-                # Cross-reference validation (warnings only)
-                xref_warnings = validate_cross_references(all_canons)
+            check = not skip_data_validation
+            rules = _rules_digest() if cache_path else ""
+            cached = _load_cache(cache_path, rules) if cache_path else {}
+            rels = [f.relative_to(data_dir).as_posix() for f in canon_files]
+            entries = [None] * len(canon_files)
+            missing = []
+            for i, (canon_file, rel) in enumerate(zip(canon_files, rels)):
+                hit = cached.get(rel)
+                if hit and hit["hash"] == hashlib.sha256(canon_file.read_bytes()).hexdigest():
+                    entries[i] = hit
+                else:
+                    missing.append(i)
+            # Cached entries are always fully validated, so a cache forces checks
+            fresh = _map(
+                partial(_canon_entry, check=check or bool(cache_path)),
+                [canon_files[i] for i in missing],
+                jobs,
+            )
+            for i, entry in zip(missing, fresh):
+                entries[i] = entry
+            if cache_path:
+                if missing or len(cached) != len(rels):
+                    _save_cache(cache_path, rules, dict(zip(rels, entries)))
+                print(f"  Validation cache: {len(rels) - len(missing)} unchanged, "
+                      f"{len(missing)} checked")
+
+            for canon_file, entry in zip(canon_files, entries):
+                # Unchecked runs still report files that are not valid JSON
+                errors = entry["errors"] if check or not entry["parsed"] else []
+                for error in errors:
+                    all_errors.append(f"{canon_file}: {error}")
+                    print(f"  FAIL: {canon_file}: {error}")
+                if check:
+                    for warning in entry["warnings"]:
+                        all_warnings.append(f"{canon_file}: {warning}")
+                        print(f"  WARN: {canon_file}: {warning}")
+                    if not errors:
+                        print(f"  OK: {canon_file}")
+
+            if check:
+                # Cross-reference validation (warnings only), from ids and refs
+                xref_warnings = _cross_reference_warnings(
+                    [(e["id"], e["refs"]) for e in entries if e["id"] is not None]
+                )
                 for warning in xref_warnings:
                     all_warnings.append(warning)
                     print(f"  WARN: {warning}")
 
+                graph = validate_graph(
+                    [(e["id"], e["refs"]) for e in entries if e["id"] is not None]
+                )
+                for error in _graph_errors(graph):
+                    all_errors.append(error)
+                    print(f"  FAIL: {error}")
+                comps = graph["components"]
+                print(
+                    f"  Graph: {graph['nodes']} nodes, "
+                    f"{len(graph['asymmetric'])} asymmetric leads_to/preceded_by "
+                    f"pair(s), {comps['count']} component(s) (largest "
+                    f"{comps['largest']}, {comps['isolated']} isolated, "
+                    f"{len(comps['unreachable_clusters'])} unreachable cluster(s))"
+                )
+                if graph["asymmetric"]:
+                    all_warnings.append(
+                        f"{len(graph['asymmetric'])} asymmetric transition edge(s)"
+                    )
+                if graph_report:
+                    graph_report.parent.mkdir(parents=True, exist_ok=True)
+                    graph_report.write_text(
+                        json.dumps(graph, indent=2) + "\n", encoding="utf-8"
+                    )
+                    print(f"  Graph report written to {graph_report}")
+
     # Validate HTML files if site_dir provided
     if site_dir and site_dir.exists():
-        html_files = list(site_dir.rglob("index.html"))
+        html_files = sorted(site_dir.rglob("index.html"))
         # Only validate env-specific error pages (depth >= 4: domain/slug/env/index.html)
         # Excludes: top-level index, domain listings (depth 2), error summaries (depth 3)
         error_pages = [
@@ -272,8 +554,18 @@ def validate_all(
             for f in html_files
             if f.parent != site_dir and len(f.relative_to(site_dir).parts) > 3
         ]
-        for html_file in error_pages:
-            errors = validate_html(html_file)
+        # Each page is read and parsed once for both checks
+        canons_by_id = {
+            e["id"]: {"verdict": e["verdict"]} for e in entries if e["id"] is not None
+        }
+        results = _map(
+            _validate_page_worker,
+            error_pages,
+            jobs,
+            initializer=_init_page_worker,
+            initargs=(canons_by_id,),
+        )
+        for html_file, (errors, _) in zip(error_pages, results):
             for error in errors:
                 all_errors.append(error)
                 print(f"  FAIL: {error}")
@@ -281,13 +573,10 @@ def validate_all(
                 print(f"  OK: {html_file}")
 
         # HTML-JSON consistency check
-        if all_canons:
-            canons_by_id = {c["id"]: c for c in all_canons}
-            for html_file in error_pages:
-                errors = validate_html_json_consistency(html_file, canons_by_id)
-                for error in errors:
-                    all_errors.append(error)
-                    print(f"  FAIL: {error}")
+        for _, consistency_errors in results:
+            for error in consistency_errors:
+                all_errors.append(error)
+                print(f"  FAIL: {error}")
 
     if all_warnings:
         print(f"\n{len(all_warnings)} warning(s)")
@@ -308,22 +597,53 @@ def main():
     parser.add_argument(
         "--site-only", action="store_true", help="Validate generated HTML only"
     )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, metavar="N",
+        help="Validate files across N processes (0 = all CPU cores)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Re-validate every canon instead of only new or changed files",
+    )
+    parser.add_argument(
+        "--graph-report", type=Path, metavar="PATH",
+        help=f"Where to write the transition graph integrity report (JSON; "
+             f"default: data/{GRAPH_REPORT_NAME})",
+    )
+    parser.add_argument(
+        "--no-graph-report", action="store_true",
+        help="Do not write the transition graph report",
+    )
     args = parser.parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
     project_root = Path(__file__).parent.parent
     data_dir = project_root / "data" / "canons"
     site_dir = project_root / "site"
+    cache_path = None if args.no_cache else project_root / "data" / VALIDATE_CACHE_NAME
+    graph_report = None if args.no_graph_report else (
+        args.graph_report or project_root / "data" / GRAPH_REPORT_NAME
+    )
 
     print("Validating ErrorCanon data and site...\n")
 
     if args.site_only:
         # HTML validation + JSON-HTML consistency (loads canon data for comparison)
-        success = validate_all(data_dir=data_dir, site_dir=site_dir, skip_data_validation=True)
+        success = validate_all(
+            data_dir=data_dir, site_dir=site_dir, skip_data_validation=True,
+            jobs=jobs, cache_path=cache_path,
+        )
     elif args.data_only:
-        success = validate_all(data_dir=data_dir, site_dir=None)
+        success = validate_all(
+            data_dir=data_dir, site_dir=None, jobs=jobs, cache_path=cache_path,
+            graph_report=graph_report,
+        )
     else:
         site_path = site_dir if site_dir.exists() else None
-        success = validate_all(data_dir, site_path)
+        success = validate_all(
+            data_dir, site_path, jobs=jobs, cache_path=cache_path,
+            graph_report=graph_report,
+        )
 
     sys.exit(0 if success else 1)
 
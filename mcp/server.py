@@ -7,6 +7,12 @@ and error chains without web search.
 Usage:
     python -m mcp.server              # stdio mode (for Claude Desktop, Cursor)
 
+New canon data is picked up without a restart: every DEADENDS_RELOAD_INTERVAL
+seconds (default 5, 0 disables) a background thread checks
+data/.canons-manifest.json and the canon files' count and mtimes, and
+rebuilds the index when they changed; requests never wait for it. A
+``notifications/deadends/reload`` message forces a reload.
+
 Claude Desktop config (~/.claude/claude_desktop_config.json):
 {
   "mcpServers": {
@@ -31,47 +37,133 @@ Cursor config (MCP settings):
 """
 
 import json
+import os
 import re
 import sys
+import threading
+import time
 from pathlib import Path
 
 DATA_DIR = Path(__file__).parent.parent / "data" / "canons"
+# Rewritten by the data pipeline (generator.canon_writer) after every commit
+MANIFEST = DATA_DIR.parent / ".canons-manifest.json"
 
-# Module-level cache — loaded once on first request
-_CANONS: list[dict] | None = None
-_DOMAIN_INDEX: dict[str, list[str]] | None = None
+# Seconds between checks for new canon data; 0 disables hot reload
+RELOAD_INTERVAL_S = float(os.environ.get("DEADENDS_RELOAD_INTERVAL", "5"))
 
 
-def _get_canons() -> list[dict]:
-    """Load all ErrorCanon JSON files (cached after first call)."""
-    global _CANONS
-    if _CANONS is not None:
-        return _CANONS
+class _Corpus:
+    """One immutable snapshot of the canons and the indexes built from them.
+
+    Requests keep a reference to the snapshot they started with; a reload
+    swaps in a new one, and the old one is freed when its last request ends.
+    """
+
+    def __init__(self, canons: list[dict], version: tuple):
+        self.canons = canons
+        self.version = version
+        index: dict[str, list[str]] = {}
+        for c in canons:
+            d = c["error"]["domain"]
+            sig = c["error"]["signature"]
+            index.setdefault(d, [])
+            if sig not in index[d]:
+                index[d].append(sig)
+        self.domain_index = index
+
 
+_CORPUS: _Corpus | None = None
+_RELOADER: threading.Thread | None = None
+_reload_lock = threading.Lock()
+_last_check = 0.0
+_failed_version: tuple | None = None
+
+
+def _data_version() -> tuple:
+    """Cheap fingerprint of the canon data.
+
+    The manifest's stat (rewritten by the pipeline on every commit) plus the
+    file count and newest mtime under DATA_DIR, so edits made outside the
+    pipeline (by hand, ``git pull``) are noticed too.
+    """
+    try:
+        st = MANIFEST.stat()
+        manifest = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        manifest = None
+    files = list(DATA_DIR.rglob("*.json"))
+    return (manifest, len(files), max((f.stat().st_mtime_ns for f in files), default=0))
+
+
+def _load_corpus() -> _Corpus:
+    """Load all ErrorCanon JSON files into a new snapshot."""
+    version = _data_version()
     canons = []
     for f in sorted(DATA_DIR.rglob("*.json")):
         with open(f, encoding="utf-8") as fh:
             canons.append(json.load(fh))
-    _CANONS = canons
-    return canons
+    return _Corpus(canons, version)
+
+
+def _get_corpus() -> _Corpus:
+    """Current snapshot (loaded on first call, hot-reloaded afterwards)."""
+    global _CORPUS
+    if _CORPUS is None:
+        with _reload_lock:
+            if _CORPUS is None:
+                _CORPUS = _load_corpus()
+    else:
+        _maybe_reload()
+    return _CORPUS
+
+
+def _maybe_reload(force: bool = False) -> None:
+    """Start a background check for changed data (at most every interval).
+
+    Never blocks: the request that triggers the check only starts a thread.
+    Scanning DATA_DIR and building the new snapshot both happen there, and
+    lookups keep using the current snapshot until the new one is ready.
+    """
+    global _RELOADER, _last_check
+    if not force:
+        if RELOAD_INTERVAL_S <= 0 or time.monotonic() - _last_check < RELOAD_INTERVAL_S:
+            return
+        _last_check = time.monotonic()
+    with _reload_lock:
+        if _RELOADER is not None and _RELOADER.is_alive():
+            return
+        _RELOADER = threading.Thread(target=_reload, args=(force,), name="canon-reload",
+                                     daemon=True)
+        _RELOADER.start()
+
+
+def _reload(force: bool = False) -> None:
+    global _CORPUS, _failed_version
+    if not force and _data_version() in (_CORPUS.version, _failed_version):
+        return
+    try:
+        corpus = _load_corpus()
+    except (OSError, ValueError) as e:
+        # e.g. a file written outside the pipeline's atomic writer; retried once
+        # the data changes again
+        _failed_version = _data_version()
+        sys.stderr.write(f"WARNING: canon reload failed, keeping current data: {e}\n")
+        return
+    _CORPUS = corpus
+    sys.stderr.write(
+        f"deadends.dev MCP server reloaded: {len(corpus.canons)} errors "
+        f"across {len(corpus.domain_index)} domains\n"
+    )
+
+
+def _get_canons() -> list[dict]:
+    """All ErrorCanon dicts of the current snapshot."""
+    return _get_corpus().canons
 
 
 def _get_domain_index() -> dict[str, list[str]]:
-    """Build domain -> [signature] index (cached)."""
-    global _DOMAIN_INDEX
-    if _DOMAIN_INDEX is not None:
-        return _DOMAIN_INDEX
-
-    canons = _get_canons()
-    index: dict[str, list[str]] = {}
-    for c in canons:
-        d = c["error"]["domain"]
-        sig = c["error"]["signature"]
-        index.setdefault(d, [])
-        if sig not in index[d]:
-            index[d].append(sig)
-    _DOMAIN_INDEX = index
-    return index
+    """Domain -> [signature] index of the current snapshot."""
+    return _get_corpus().domain_index
 
 
 def match_error(error_message: str, canons: list[dict]) -> list[dict]:
@@ -439,8 +531,9 @@ TOOLS = [
 ]
 
 
-def handle_request(method: str, params: dict, canons: list[dict]) -> dict:
-    """Handle a JSON-RPC request."""
+def handle_request(method: str, params: dict, corpus: _Corpus) -> dict:
+    """Handle a JSON-RPC request against one corpus snapshot."""
+    canons = corpus.canons
     if method == "initialize":
         return {
             "protocolVersion": "2025-03-26",
@@ -482,7 +575,7 @@ def handle_request(method: str, params: dict, canons: list[dict]) -> dict:
                 text = (
                     "No matching errors found in deadends.dev database.\n\n"
                     f"Searched {len(canons)} error patterns across "
-                    f"{len(_get_domain_index())} domains.\n"
+                    f"{len(corpus.domain_index)} domains.\n"
                 )
                 if suggested != "unknown":
                     text += (
@@ -845,16 +938,19 @@ def handle_request(method: str, params: dict, canons: list[dict]) -> dict:
 
     elif method == "notifications/initialized":
         return None  # No response needed for notifications
+    elif method == "notifications/deadends/reload":
+        _maybe_reload(force=True)  # Sent by the data pipeline or an operator
+        return None
 
     return {"error": {"code": -32601, "message": f"Unknown method: {method}"}}
 
 
 def main():
     """Run MCP server in stdio mode."""
-    canons = _get_canons()
+    corpus = _get_corpus()
     sys.stderr.write(
-        f"deadends.dev MCP server loaded: {len(canons)} errors "
-        f"across {len(_get_domain_index())} domains\n"
+        f"deadends.dev MCP server loaded: {len(corpus.canons)} errors "
+        f"across {len(corpus.domain_index)} domains\n"
     )
 
     for line in sys.stdin:
@@ -866,10 +962,11 @@ def main():
         except json.JSONDecodeError:
             continue
 
+        # Each request runs against the snapshot current when it arrived
         result = handle_request(
             request.get("method", ""),
             request.get("params", {}),
-            canons,
+            _get_corpus(),
         )
 
         if result is None:
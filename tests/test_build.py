@@ -1,8 +1,15 @@
 """Tests for the site build process."""
 
+import io
+import json
+import re
 from pathlib import Path
 
+import pytest
+
+import generator.build_site as bs
 from generator.build_site import (
+    CorpusModel,
     build_env_summary,
     collect_sources,
     load_canons,
@@ -96,3 +103,99 @@ class TestCollectSources:
         }
         sources = collect_sources(canon)
         assert len(sources) == 1
+
+
+class TestCorpusModel:
+    def _canon(self, make_canon, cid, domain, rate=0.5, resolvable="true"):
+        return make_canon(
+            id=cid,
+            error={"domain": domain, "signature": f"sig {cid}"},
+            verdict={"fix_success_rate": rate, "resolvable": resolvable},
+        )
+
+    def test_groupings(self, make_canon):
+        canons = [
+            self._canon(make_canon, "go/b/env1", "go"),
+            self._canon(make_canon, "python/a/env2", "python"),
+            self._canon(make_canon, "python/a/env1", "python"),
+            self._canon(make_canon, "go/a/env1", "go"),
+        ]
+        corpus = CorpusModel(canons)
+
+        assert len(corpus) == 4
+        assert [c["id"] for c in corpus.sorted] == sorted(c["id"] for c in canons)
+        assert list(corpus.by_domain) == ["go", "python"]
+        assert corpus.domains == ["go", "python"]
+        assert [c["id"] for c in corpus.sorted_by_domain["python"]] == [
+            "python/a/env1", "python/a/env2",
+        ]
+        assert list(corpus.by_slug) == ["go/b", "python/a", "go/a"]
+        assert corpus.slug_signatures["python/a"] == "sig python/a/env2"
+        assert corpus.slugs_by_prefix["go"] == ["go/b", "go/a"]
+        assert [e["slug_key"] for e in corpus.domain_slugs["go"]] == ["go/b", "go/a"]
+
+    def test_duplicate_ids_last_loaded_wins(self, make_canon):
+        first = self._canon(make_canon, "pip/x/env", "pip", rate=0.1)
+        second = self._canon(make_canon, "pip/x/env", "pip", rate=0.9)
+        corpus = CorpusModel([first, second])
+        assert corpus.unique == [second]
+        assert corpus.env_summary(first) == build_env_summary(first)
+
+    def test_domain_stats(self, make_canon):
+        canons = [
+            self._canon(make_canon, "go/a/e1", "go", rate=0.2, resolvable="true"),
+            self._canon(make_canon, "go/b/e1", "go", rate=0.6, resolvable="partial"),
+        ]
+        stats = CorpusModel(canons).domain_stats["go"]
+        assert stats["count"] == 2
+        assert stats["fix_rate_sum"] == 0.2 + 0.6
+        assert stats["resolvability"] == {"true": 1, "partial": 1, "false": 0}
+        assert stats["dead_ends"] == sum(len(c["dead_ends"]) for c in canons)
+
+
+class TestStreamingWriters:
+    @pytest.mark.parametrize("items", [
+        [],
+        [{"id": "a"}],
+        [{"id": "a", "nested": {"x": [1, 2], "empty": []}}, {"id": "b\nc", "s": "é"}],
+    ])
+    def test_json_stream_matches_dumps(self, items):
+        head = {"version": "1.0", "total": len(items)}
+        f = io.StringIO()
+        count = bs._write_json_stream(f, head, "errors", iter(items))
+        expected = json.dumps({**head, "errors": items}, indent=2, ensure_ascii=False)
+        assert f.getvalue() == expected
+        assert count == len(items)
+
+    def test_write_lines_matches_join(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bs, "_OUTPUTS", [])
+        lines = ["# title", "", "body", ""]
+        path = tmp_path / "out" / "x.txt"
+        assert bs._write_lines(path, iter(lines)) == 4
+        assert path.read_text(encoding="utf-8") == "\n".join(lines)
+        assert bs._OUTPUTS == [path]
+
+
+class TestLiteralCover:
+    @pytest.mark.parametrize("regex,cover", [
+        (r"ModuleNotFoundError: No module named '(\w+)'",
+         ["ModuleNotFoundError: No module named '"]),
+        (r"E0382.*borrow of moved value", ["borrow of moved value"]),
+        (r"AccessDenied.*AssumeRole|not authorized to perform",
+         ["AccessDenied", "not authorized to perform"]),
+        (r"(foo)+barbaz", ["barbaz"]),
+        (r"(optional)?ab", []),
+        (r"ab|cdef", []),
+        (r"[unclosed", []),
+    ])
+    def test_cover(self, regex, cover):
+        assert bs._literal_cover(regex) == cover
+
+    def test_cover_is_required(self):
+        """Any string matching the regex contains a literal of its cover."""
+        regex = r"(Build failed|COMMAND_EXECUTION_ERROR|Phase .+ failed with exit code \d+)"
+        cover = bs._literal_cover(regex)
+        for text in ["Build failed", "x COMMAND_EXECUTION_ERROR y",
+                     "Phase BUILD failed with exit code 2"]:
+            assert re.search(regex, text)
+            assert any(lit in text for lit in cover)
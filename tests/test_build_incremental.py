@@ -0,0 +1,373 @@
+"""Tests for build modes: incremental (--clean), parallel (--jobs), --report/--profile."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+import generator.build_site as bs
+from generator import profiling
+from generator.profiling import BuildProfiler
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "canons"
+
+SAMPLE_SLUGS = [
+    "python/keyerror",
+    "python/typeerror-nonetype-not-subscriptable",
+    "docker/cannot-connect-to-docker-daemon",
+]
+
+
+@pytest.fixture
+def small_site(tmp_path, monkeypatch):
+    """A temp data dir with a handful of canons and an empty site dir."""
+    data_dir = tmp_path / "canons"
+    for slug in SAMPLE_SLUGS:
+        src = DATA_DIR / slug
+        if not src.is_dir():
+            pytest.skip(f"sample canon directory missing: {slug}")
+        shutil.copytree(src, data_dir / slug)
+    site_dir = tmp_path / "site"
+    monkeypatch.setattr(bs, "DATA_DIR", data_dir)
+    monkeypatch.setattr(bs, "SITE_DIR", site_dir)
+    return data_dir, site_dir
+
+
+def _canon_files(data_dir: Path) -> list[Path]:
+    return sorted(data_dir.rglob("*.json"))
+
+
+def _mtimes(site_dir: Path) -> dict[str, int]:
+    return {
+        p.relative_to(site_dir).as_posix(): p.stat().st_mtime_ns
+        for p in site_dir.rglob("*")
+        if p.is_file() and p.name != bs.BUILD_MANIFEST_NAME
+    }
+
+
+class TestIncrementalBuild:
+    def test_first_build_writes_manifest(self, small_site):
+        _, site_dir = small_site
+        bs.main([])
+        manifest = json.loads((site_dir / bs.BUILD_MANIFEST_NAME).read_text())
+        assert any(k.startswith("page:") for k in manifest["entries"])
+        assert "stage:sitemap" in manifest["entries"]
+
+    def test_noop_rebuild_rewrites_nothing(self, small_site):
+        _, site_dir = small_site
+        bs.main([])
+        before = _mtimes(site_dir)
+        bs.main([])
+        assert _mtimes(site_dir) == before
+
+    def test_changed_canon_rerenders_only_dependents(self, small_site):
+        data_dir, site_dir = small_site
+        bs.main([])
+        before = _mtimes(site_dir)
+
+        changed = next(f for f in _canon_files(data_dir) if "docker" in f.parts)
+        canon = json.loads(changed.read_text())
+        canon["verdict"]["summary"] = "Edited summary for incremental test."
+        changed.write_text(json.dumps(canon, indent=2))
+
+        bs.main([])
+        after = _mtimes(site_dir)
+        rewritten = {p for p in after if after[p] != before.get(p)}
+
+        assert f"{canon['id']}/index.html" in rewritten
+        assert f"api/v1/{canon['id']}.json" in rewritten
+        assert "llms-full.txt" in rewritten
+        # Pages of other domains are untouched
+        assert not any(p.startswith("python/") for p in rewritten)
+        assert "robots.txt" not in rewritten
+        assert "Edited summary" in (site_dir / canon["id"] / "index.html").read_text()
+
+    def test_removed_canon_outputs_are_deleted(self, small_site):
+        data_dir, site_dir = small_site
+        bs.main([])
+
+        removed = DATA_DIR / SAMPLE_SLUGS[0]
+        removed_ids = [
+            json.loads(f.read_text())["id"] for f in sorted(removed.glob("*.json"))
+        ]
+        shutil.rmtree(data_dir / SAMPLE_SLUGS[0])
+
+        bs.main([])
+        for cid in removed_ids:
+            assert not (site_dir / cid).exists()
+            assert not (site_dir / "api" / "v1" / f"{cid}.json").exists()
+        assert not (site_dir / SAMPLE_SLUGS[0]).exists()
+        assert (site_dir / SAMPLE_SLUGS[1] / "index.html").exists()
+
+    def test_clean_rebuild_removes_untracked_files(self, small_site):
+        _, site_dir = small_site
+        bs.main([])
+        stray = site_dir / "stray.txt"
+        stray.write_text("left over")
+
+        bs.main([])
+        assert stray.exists()  # incremental builds only touch tracked outputs
+
+        bs.main(["--clean"])
+        assert not stray.exists()
+        assert (site_dir / "index.html").exists()
+
+
+def _render_pages(canons, site_dir, monkeypatch, jobs):
+    monkeypatch.setattr(bs, "SITE_DIR", site_dir)
+    jinja_env = bs.create_jinja_env()
+    corpus = bs.CorpusModel(canons)
+    bs.build_error_pages(corpus, jinja_env, jobs=jobs)
+    bs.build_error_summary_pages(corpus, jinja_env, jobs=jobs)
+    return {
+        p.relative_to(site_dir).as_posix(): p.read_bytes()
+        for p in sorted(site_dir.rglob("*"))
+        if p.is_file()
+    }
+
+
+class TestParallelBuild:
+    def test_pool_output_matches_serial(self, tmp_path, monkeypatch):
+        canons = [
+            c for c in bs.load_canons(DATA_DIR)
+            if c["error"]["domain"] in ("python", "pip")
+        ]
+        assert len(canons) > 20
+
+        serial = _render_pages(canons, tmp_path / "serial", monkeypatch, jobs=1)
+        pooled = _render_pages(canons, tmp_path / "pooled", monkeypatch, jobs=3)
+
+        assert serial.keys() == pooled.keys()
+        assert len(serial) > 2 * len({c["id"] for c in canons}) - 1
+        mismatched = [p for p in serial if serial[p] != pooled[p]]
+        assert mismatched == []
+
+    def test_pool_outputs_are_tracked(self, small_site):
+        _, site_dir = small_site
+        bs.main(["--jobs", "2"])
+        manifest = json.loads((site_dir / bs.BUILD_MANIFEST_NAME).read_text())
+        page_entries = [
+            e for k, e in manifest["entries"].items() if k.startswith("page:")
+        ]
+        assert page_entries
+        assert all(len(e["outputs"]) == 2 for e in page_entries)
+
+
+class TestBuildReport:
+    def test_profiler_counts_stage_outputs(self, tmp_path):
+        outputs: list[Path] = []
+        profiler = BuildProfiler(outputs)
+        with profiler.stage("write") as record:
+            record["note"] = "x"
+            f = tmp_path / "a.txt"
+            f.write_text("12345")
+            outputs.append(f)
+        with profiler.stage("noop"):
+            pass
+
+        write, noop = profiler.stages
+        assert write["note"] == "x"
+        assert (write["files_written"], write["bytes_written"]) == (1, 5)
+        assert (noop["files_written"], noop["bytes_written"]) == (0, 0)
+        assert write["wall_s"] >= 0 and write["cpu_s"] >= 0
+
+    def test_rss_is_reported_per_stage(self, monkeypatch):
+        # ru_maxrss only ever grows: 100 MiB before "heavy", 900 after, then flat
+        high_water = iter([100_000, 0, 900_000, 0, 900_000, 0, 900_000, 0])
+        monkeypatch.setattr(profiling, "peak_rss_kb", lambda children=False: next(high_water))
+        profiler = BuildProfiler()
+        with profiler.stage("heavy"):
+            pass
+        with profiler.stage("light"):
+            pass
+
+        heavy, light = profiler.stages
+        assert (heavy["rss_growth_kb"], heavy["rss_high_water_kb"]) == (800_000, 900_000)
+        assert (light["rss_growth_kb"], light["rss_high_water_kb"]) == (0, 900_000)
+        assert light["child_rss_growth_kb"] == 0
+
+    def test_build_writes_report_and_profile(self, small_site, tmp_path):
+        _, site_dir = small_site
+        report_path = tmp_path / "report.json"
+        profile_path = tmp_path / "build.prof"
+        bs.main(["--report", str(report_path), "--profile", str(profile_path)])
+
+        report = json.loads(report_path.read_text())
+        stages = {s["name"]: s for s in report["stages"]}
+        assert {"load", "error-pages", "summary-pages", "sitemap"} <= stages.keys()
+        assert stages["error-pages"]["files_written"] > 0
+        assert report["files_written"] == sum(
+            s["files_written"] for s in report["stages"]
+        )
+        assert report["templates"]["page.html"]["renders"] == report["canons"]
+        assert profile_path.stat().st_size > 0
+
+        # A no-op rebuild reports its aggregate stages as skipped
+        bs.main(["--report", str(report_path)])
+        stages = {s["name"]: s for s in json.loads(report_path.read_text())["stages"]}
+        assert stages["sitemap"]["skipped"] is True
+        assert stages["error-pages"]["files_written"] == 0
+
+
+class TestPrecompress:
+    def test_siblings_match_and_only_changed_files_recompress(self, small_site):
+        import gzip
+
+        data_dir, site_dir = small_site
+        bs.main(["--precompress"])
+        page = next(site_dir.glob("python/*/*/index.html"))
+        gz = page.with_name("index.html.gz")
+        assert gzip.decompress(gz.read_bytes()) == page.read_bytes()
+        assert (site_dir / "llms-full.txt.gz").exists()
+        assert not (site_dir / "CNAME.gz").exists()  # below the size threshold
+        if bs.brotli is not None:
+            br = page.with_name("index.html.br")
+            assert bs.brotli.decompress(br.read_bytes()) == page.read_bytes()
+
+        before = _mtimes(site_dir)
+        bs.main(["--precompress"])
+        assert _mtimes(site_dir) == before
+
+        changed = next(f for f in _canon_files(data_dir) if "docker" in f.parts)
+        canon = json.loads(changed.read_text())
+        canon["verdict"]["summary"] = "Edited summary for precompress test."
+        changed.write_text(json.dumps(canon, indent=2))
+        bs.main(["--precompress"])
+        after = _mtimes(site_dir)
+        rewritten = {p for p in after if after[p] != before.get(p)}
+        assert f"{canon['id']}/index.html.gz" in rewritten
+        assert not any(p.startswith("python/") for p in rewritten)
+
+    def test_build_without_flag_removes_siblings(self, small_site):
+        _, site_dir = small_site
+        bs.main(["--precompress"])
+        assert (site_dir / "llms-full.txt.gz").exists()
+        bs.main([])
+        assert not (site_dir / "llms-full.txt.gz").exists()
+        assert not list(site_dir.rglob("index.html.gz"))
+
+
+class TestContentManifest:
+    def test_hashes_ignore_timestamps_and_track_data(self, small_site, monkeypatch):
+        from datetime import datetime
+
+        data_dir, site_dir = small_site
+        manifest_path = site_dir / "api" / "v1" / "manifest.json"
+        bs.main([])
+        first = manifest_path.read_bytes()
+        match_before = (site_dir / "api" / "v1" / "match.json").read_bytes()
+        version = json.loads((site_dir / "api" / "v1" / "version.json").read_text())
+        assert version["endpoints"]["manifest"].endswith("/api/v1/manifest.json")
+
+        class Later(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2031, 1, 2, 3, 4, 5, tzinfo=tz)
+
+        monkeypatch.setattr(bs, "datetime", Later)
+        bs.main(["--clean"])
+        assert (site_dir / "api" / "v1" / "match.json").read_bytes() != match_before
+        assert "2031-01-02" in (site_dir / "llms-full.txt").read_text()
+        assert manifest_path.read_bytes() == first
+
+        changed = next(f for f in _canon_files(data_dir) if "docker" in f.parts)
+        canon = json.loads(changed.read_text())
+        canon["verdict"]["summary"] = "Edited summary for manifest test."
+        changed.write_text(json.dumps(canon, indent=2))
+        bs.main([])
+        before = json.loads(first)
+        after = json.loads(manifest_path.read_text())
+        assert after["content_hash"] != before["content_hash"]
+        ndjson = "/api/v1/errors.ndjson"
+        assert after["artifacts"][ndjson]["sha256"] != before["artifacts"][ndjson]["sha256"]
+        match = "/api/v1/match.json"
+        assert after["artifacts"][match] == before["artifacts"][match]
+        assert after["artifacts"][ndjson]["records"] == len(_canon_files(data_dir))
+
+    def test_llms_txt_counts_listed_signatures(self, small_site):
+        data_dir, site_dir = small_site
+        # A second environment of an existing error shares its llms.txt line
+        src = _canon_files(data_dir)[0]
+        canon = json.loads(src.read_text())
+        canon["id"] = canon["id"].rsplit("/", 1)[0] + "/other-env"
+        (src.parent / "other-env.json").write_text(json.dumps(canon, indent=2))
+        bs.main([])
+
+        manifest = json.loads((site_dir / "api" / "v1" / "manifest.json").read_text())
+        listed = [
+            line for line in (site_dir / "llms.txt").read_text().split("## How to Use")[1]
+            .splitlines() if line.startswith("- [")
+        ]
+        assert len(listed) == len(_canon_files(data_dir)) - 1
+        assert manifest["artifacts"]["/llms.txt"]["records"] == len(listed)
+
+
+class TestChangesFeed:
+    def test_delta_feed_and_snapshot_sync(self, small_site, tmp_path):
+        from generator.lookup import sync_snapshot
+
+        data_dir, site_dir = small_site
+        snapshot = tmp_path / "snapshot.json"
+        changes = site_dir / "api" / "v1" / "changes"
+
+        bs.main([])
+        first = json.loads((changes / "index.json").read_text())
+        assert first["deltas"] == []
+        result = sync_snapshot(snapshot, site_dir)
+        assert result["full_reload"] and result["corpus"] == first["latest"]
+
+        changed = next(f for f in _canon_files(data_dir) if "docker" in f.parts)
+        canon = json.loads(changed.read_text())
+        canon["verdict"]["summary"] = "Edited summary for delta test."
+        changed.write_text(json.dumps(canon, indent=2))
+        removed = sorted((data_dir / SAMPLE_SLUGS[0]).glob("*.json"))
+        removed_ids = {json.loads(f.read_text())["id"] for f in removed}
+        shutil.rmtree(data_dir / SAMPLE_SLUGS[0])
+        bs.main([])
+
+        index = json.loads((changes / "index.json").read_text())
+        (delta,) = index["deltas"]
+        assert (delta["from"], delta["to"]) == (first["latest"], index["latest"])
+        assert (delta["added"], delta["modified"], delta["removed"]) == (
+            0, 1, len(removed_ids)
+        )
+        records = [
+            json.loads(line)
+            for line in (changes / delta["file"]).read_text().splitlines()
+        ]
+        assert {r["id"] for r in records if r["op"] == "removed"} == removed_ids
+
+        result = sync_snapshot(snapshot, site_dir)
+        assert result["deltas_applied"] == [delta["file"]]
+        assert not result["full_reload"]
+        synced = json.loads(snapshot.read_text())["canons"]
+        mirrored = {
+            c["id"]: c
+            for c in map(json.loads, (site_dir / "api/v1/errors.ndjson").read_text().splitlines())
+        }
+        assert synced == mirrored
+        assert synced[canon["id"]]["verdict"]["summary"] == canon["verdict"]["summary"]
+
+        # A clean rebuild diffs against the published site, not the source tree
+        published = tmp_path / "published"
+        shutil.copytree(site_dir, published)
+        bs.main(["--clean", "--previous-site", str(published)])
+        assert json.loads((changes / "index.json").read_text())["deltas"] == index["deltas"]
+        assert (changes / delta["file"]).read_bytes() == \
+            (published / "api/v1/changes" / delta["file"]).read_bytes()
+        assert sync_snapshot(snapshot, site_dir)["deltas_applied"] == []
+        assert not (data_dir.parent / "deltas").exists()
+
+        bs.main(["--clean"])
+        assert json.loads((changes / "index.json").read_text())["deltas"] == []
+
+    @pytest.mark.parametrize("argv", [["--sync"], ["--sync", "a.json", "b", "c"]])
+    def test_sync_without_a_snapshot_path_fails(self, argv, monkeypatch, capsys):
+        from generator import lookup
+
+        monkeypatch.setattr("sys.argv", ["lookup", *argv])
+        with pytest.raises(SystemExit) as exc:
+            lookup.main()
+        assert exc.value.code == 2
+        assert "Usage" in capsys.readouterr().err
@@ -7,10 +7,12 @@ from pathlib import Path
 import pytest
 
 from generator.build_site import (
+    CorpusModel,
     build_domain_pages,
     build_error_pages,
     build_error_summary_pages,
     build_index_page,
+    build_match_v2_json,
     build_search_page,
     build_sitemap,
     load_canons,
@@ -56,12 +58,14 @@ def built_site(tmp_path_factory):
 
         jinja_env.filters["json_escape"] = _json_escape
 
-        build_error_pages(canons, jinja_env)
-        build_domain_pages(canons, jinja_env)
-        summary_urls = build_error_summary_pages(canons, jinja_env)
-        build_search_page(canons, jinja_env)
-        build_index_page(canons, jinja_env)
-        build_sitemap(canons, summary_urls)
+        corpus = CorpusModel(canons)
+        build_error_pages(corpus, jinja_env)
+        build_domain_pages(corpus, jinja_env)
+        summary_urls = build_error_summary_pages(corpus, jinja_env)
+        build_search_page(corpus, jinja_env)
+        build_index_page(corpus, jinja_env)
+        build_sitemap(corpus, summary_urls)
+        build_match_v2_json(corpus)
 
         return {
             "site_dir": site_dir,
@@ -179,12 +183,64 @@ class TestSiteBuildIntegration:
             assert page_path.exists(), f"Missing summary page for {slug}"
 
     def test_search_page_created(self, built_site):
-        """The search page should exist and contain search data."""
+        """The search page should exist and reference its search index."""
         search_path = built_site["site_dir"] / "search" / "index.html"
         assert search_path.exists()
         content = search_path.read_text(encoding="utf-8")
         assert "search-input" in content
-        assert "regex" in content
+        match = re.search(r"var indexUrl = '/search/(index-[0-9a-f]{12}\.json)'", content)
+        assert match, "search page should reference the hashed search index"
+        # Regexes are no longer inlined into the page
+        assert "var errors =" not in content
+
+    def test_search_index_and_shards(self, built_site):
+        """Every entry is in the index and its regex in its domain shard."""
+        search_dir = built_site["site_dir"] / "search"
+        (index_path,) = search_dir.glob("index-*.json")
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        canons = sorted(built_site["canons"], key=lambda c: c["id"])
+        ids = [e[0] for e in index["entries"]]
+        assert ids == [c["id"] for c in canons]
+
+        regexes = {}
+        for domain, shard_name in index["shards"].items():
+            for idx, regex in json.loads((search_dir / shard_name).read_text()):
+                assert index["domains"][index["entries"][idx][2]] == domain
+                regexes[idx] = regex
+        assert len(regexes) == len(ids)
+        for idx, canon in enumerate(canons):
+            assert regexes[idx] == canon["error"]["regex"]
+
+        # Each entry is reachable via a posting token or the unfiltered list
+        posted = {i for posting in index["tokens"].values() for i in posting}
+        assert posted | set(index["unfiltered"]) == set(range(len(ids)))
+
+    def test_match_v2_prefilter_agrees_with_full_scan(self, built_site):
+        """The literal prefilter never drops a regex match."""
+        from generator.lookup import MatchIndex
+
+        path = built_site["site_dir"] / "api" / "v1" / "match-v2.json"
+        index = MatchIndex.load(path)
+        assert MatchIndex.load(path.with_name("match-v2.json.gz")).data == index.data
+        canons = sorted(built_site["canons"], key=lambda c: c["id"])
+        assert index.columns["id"] == [c["id"] for c in canons]
+        assert all(len(col) == len(canons) for col in index.columns.values())
+
+        queries = [c["error"]["signature"] for c in canons] + [
+            "ModuleNotFoundError: No module named 'torch'",
+            "CUDA error: out of memory",
+            "nothing to see here",
+        ]
+        compiled = [re.compile(c["error"]["regex"], re.IGNORECASE) for c in canons]
+        total_hits = 0
+        for query in queries:
+            expected = {canons[i]["id"] for i, rx in enumerate(compiled) if rx.search(query)}
+            hits = index.match(query)
+            assert {h["id"] for h in hits} == expected, query
+            rates = [h["fix_success_rate"] for h in hits]
+            assert rates == sorted(rates, reverse=True)
+            total_hits += len(hits)
+        assert total_hits > len(canons) // 2
 
     def test_sitemap_includes_search_and_summaries(self, built_site):
         """Sub-sitemaps should include search page and summary pages."""
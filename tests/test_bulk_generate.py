@@ -0,0 +1,114 @@
+"""Tests for the seed registry generator (bulk_generate)."""
+
+import json
+
+import pytest
+
+from generator import bulk_generate as bg
+from generator.schema import schema_error
+
+
+def seed(canon_id: str, summary: str = "Original summary") -> dict:
+    return {
+        "id": canon_id,
+        "error": {"signature": "KeyError: 'x'", "last_confirmed": "$TODAY"},
+        "verdict": {"summary": summary, "last_updated": "$TODAY"},
+        "metadata": {"generation_date": "$TODAY", "tags": ["$TODAY", "keep"]},
+    }
+
+
+def write_seeds(path, seeds):
+    path.write_text("".join(json.dumps(s) + "\n" for s in seeds), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def registry(tmp_path):
+    data_dir = tmp_path / "canons"
+    applied = tmp_path / "applied.json"
+
+    def run(*seed_files, extra=()):
+        bg.main([*map(str, seed_files), "--data-dir", str(data_dir),
+                 "--applied", str(applied), *extra])
+        return json.loads(applied.read_text()) if applied.exists() else {}
+
+    run.data_dir = data_dir
+    return run
+
+
+class TestRender:
+    def test_today_placeholder_is_replaced_everywhere(self):
+        out = bg.render(seed("python/keyerror/py311-linux"), "2030-01-02")
+        assert out["error"]["last_confirmed"] == "2030-01-02"
+        assert out["metadata"]["tags"] == ["2030-01-02", "keep"]
+        assert out["error"]["signature"] == "KeyError: 'x'"
+
+    def test_hash_ignores_key_order(self):
+        a = {"id": "a/b/c", "x": 1, "y": 2}
+        assert bg.seed_hash(a) == bg.seed_hash({"y": 2, "x": 1, "id": "a/b/c"})
+
+    def test_flat_layout_is_found(self, tmp_path):
+        flat = tmp_path / "python" / "keyerror_py311-linux.json"
+        assert bg.canon_path("python/keyerror/py311-linux", tmp_path) == \
+            tmp_path / "python" / "keyerror" / "py311-linux.json"
+        flat.parent.mkdir()
+        flat.write_text("{}")
+        assert bg.canon_path("python/keyerror/py311-linux", tmp_path) == flat
+
+
+class TestGenerate:
+    def test_writes_new_then_skips_unchanged(self, registry, tmp_path, capsys):
+        seeds = write_seeds(tmp_path / "wave.jsonl", [seed("python/a/env"), seed("node/b/env")])
+        applied = registry(seeds)
+        assert set(applied) == {"python/a/env", "node/b/env"}
+        out = json.loads((registry.data_dir / "python" / "a" / "env.json").read_text())
+        assert "$TODAY" not in json.dumps(out)
+        assert "2 created" in capsys.readouterr().out
+
+        (registry.data_dir / "node" / "b" / "env.json").unlink()
+        registry(seeds)
+        assert "0 created, 0 updated, 2 unchanged" in capsys.readouterr().out
+        assert not (registry.data_dir / "node" / "b" / "env.json").exists()
+        registry(seeds, extra=["--rescan"])
+        assert "1 created" in capsys.readouterr().out
+        assert (registry.data_dir / "node" / "b" / "env.json").exists()
+
+    def test_changed_seed_is_rewritten(self, registry, tmp_path):
+        path = tmp_path / "wave.jsonl"
+        registry(write_seeds(path, [seed("python/a/env")]))
+        registry(write_seeds(path, [seed("python/a/env", "Better summary")]))
+        out = json.loads((registry.data_dir / "python" / "a" / "env.json").read_text())
+        assert out["verdict"]["summary"] == "Better summary"
+
+    def test_existing_canons_are_adopted_not_overwritten(self, registry, tmp_path, capsys):
+        curated = registry.data_dir / "python" / "a_env.json"
+        curated.parent.mkdir(parents=True)
+        curated.write_text('{"curated": true}\n')
+        applied = registry(write_seeds(tmp_path / "wave.jsonl", [seed("python/a/env")]))
+        assert curated.read_text() == '{"curated": true}\n'
+        assert not (registry.data_dir / "python" / "a").exists()
+        assert "python/a/env" in applied
+        assert "1 adopted" in capsys.readouterr().out
+
+    def test_only_named_seed_files_are_read(self, registry, tmp_path):
+        good = write_seeds(tmp_path / "wave-2.jsonl", [seed("python/b/env")])
+        (tmp_path / "wave-1.jsonl").write_text("not json\n")
+        assert set(registry(good)) == {"python/b/env"}
+
+    def test_first_duplicate_wins(self, registry, tmp_path, capsys):
+        registry(write_seeds(tmp_path / "wave.jsonl",
+                             [seed("python/a/env", "first"), seed("python/a/env", "second")]))
+        out = json.loads((registry.data_dir / "python" / "a" / "env.json").read_text())
+        assert out["verdict"]["summary"] == "first"
+        assert "1 duplicate(s) ignored" in capsys.readouterr().out
+
+
+class TestSeedRegistry:
+    def test_seeds_are_unique_valid_canons(self):
+        ids = set()
+        for s in bg.iter_seeds(bg.seed_files()):
+            assert s["id"] not in ids, f"duplicate seed {s['id']}"
+            ids.add(s["id"])
+            error = schema_error(bg.render(s, "2030-01-01"))
+            assert error is None, f"{s['id']}: {error.message}"
+        assert len(ids) > 400
@@ -0,0 +1,125 @@
+"""Tests for the atomic, batched canon writer."""
+
+import json
+import os
+import threading
+
+import pytest
+
+from generator import canon_writer as cw
+from generator.canon_writer import CanonWriter
+
+
+def canon(canon_id: str, summary: str = "summary") -> dict:
+    return {"id": canon_id, "verdict": {"summary": summary}}
+
+
+def target(root, canon_id: str):
+    return root / f"{canon_id}.json"
+
+
+def manifest(root) -> dict:
+    return json.loads(cw.manifest_path(root).read_text())
+
+
+def temp_files(root) -> list:
+    return list(root.rglob("*.tmp"))
+
+
+class TestCanonWriter:
+    def test_batches_commit_files_and_manifest_together(self, tmp_path):
+        root = tmp_path / "canons"
+        committed = []
+        with CanonWriter(root, batch_size=2) as writer:
+            for i in range(3):
+                writer.write(target(root, f"python/e{i}/env"), canon(f"python/e{i}/env"),
+                             on_commit=lambda i=i: committed.append(i))
+            # First batch is in place; the third file is still only staged
+            assert committed == [0, 1]
+            assert not target(root, "python/e2/env").exists()
+            assert manifest(root)["generation"] == 1
+        assert committed == [0, 1, 2]
+        assert temp_files(root) == []
+        assert cw.manifest_path(root) == tmp_path / ".canons-manifest.json"
+
+        data = manifest(root)
+        assert data["generation"] == 2
+        assert data["files"] == cw.build_manifest(root)["files"]
+        assert json.loads(target(root, "python/e0/env").read_text())["id"] == "python/e0/env"
+
+    def test_unchanged_files_are_not_rewritten(self, tmp_path):
+        root = tmp_path / "canons"
+        path = target(root, "python/a/env")
+        with CanonWriter(root) as writer:
+            writer.write(path, canon("python/a/env"))
+        before = os.stat(path)
+
+        committed = []
+        with CanonWriter(root) as writer:
+            assert not writer.write(path, canon("python/a/env"),
+                                    on_commit=lambda: committed.append(True))
+            assert writer.write(target(root, "python/b/env"), canon("python/b/env"))
+        assert committed == [True]
+        assert os.stat(path).st_ino == before.st_ino
+        assert os.stat(path).st_mtime_ns == before.st_mtime_ns
+        assert writer.unchanged == 1 and writer.written == 1
+
+    def test_existing_corpus_is_hashed_into_first_manifest(self, tmp_path):
+        root = tmp_path / "canons"
+        old = target(root, "python/old/env")
+        old.parent.mkdir(parents=True)
+        old.write_text('{"id": "python/old/env"}\n')
+        with CanonWriter(root) as writer:
+            writer.write(target(root, "python/new/env"), canon("python/new/env"))
+        assert set(manifest(root)["files"]) == {"python/old/env.json", "python/new/env.json"}
+
+    def test_failed_commit_keeps_old_files_whole(self, tmp_path, monkeypatch):
+        root = tmp_path / "canons"
+        with CanonWriter(root) as writer:
+            for name in ("a", "b"):
+                writer.write(target(root, f"python/{name}/env"), canon(name, "old"))
+
+        real_replace = os.replace
+        calls = []
+
+        def flaky_replace(src, dst):
+            calls.append(dst)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            real_replace(src, dst)
+
+        monkeypatch.setattr(cw.os, "replace", flaky_replace)
+        committed = []
+        with pytest.raises(OSError, match="disk full"):
+            with CanonWriter(root) as writer:
+                for name in ("a", "b"):
+                    writer.write(target(root, f"python/{name}/env"), canon(name, "new"),
+                                 on_commit=lambda: committed.append(True))
+        monkeypatch.setattr(cw.os, "replace", real_replace)
+
+        summaries = {
+            name: json.loads(target(root, f"python/{name}/env").read_text())["verdict"]["summary"]
+            for name in ("a", "b")
+        }
+        assert summaries == {"a": "new", "b": "old"}
+        assert committed == []
+        assert temp_files(root) == []
+        # The manifest was rebuilt from disk, so it matches what readers will load
+        assert manifest(root)["files"] == cw.build_manifest(root)["files"]
+
+    def test_threads_share_one_writer(self, tmp_path):
+        root = tmp_path / "canons"
+        with CanonWriter(root, batch_size=7) as writer:
+            def work(slot):
+                for i in range(25):
+                    cid = f"python/t{slot}-{i}/env"
+                    writer.write(target(root, cid), canon(cid))
+
+            threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert writer.written == 100
+        assert len(manifest(root)["files"]) == 100
+        assert temp_files(root) == []
@@ -0,0 +1,381 @@
+"""Tests for concurrent evidence collection against a local stub API server."""
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+try:
+    import requests
+
+    from generator import collect_evidence as ce
+    from generator import collect_signatures as cs
+    from generator.api_client import ApiClient, HttpCache, TokenBucket
+    from generator.pipeline_state import PipelineState
+except ImportError:
+    pytest.skip(
+        "pipeline dependencies not installed (pip install -e '.[pipeline]')",
+        allow_module_level=True,
+    )
+
+
+class StubApi:
+    """StackExchange/GitHub lookalike: /so/... and /gh/... on one server."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.rate_limit_next_gh = True
+        self.failing_queries: set[str] = set()
+        self.failing_answers = False
+        self.lock = threading.Lock()
+
+    def handle(self, path: str, query: dict,
+               headers: dict | None = None) -> tuple[int, dict, dict]:
+        with self.lock:
+            self.requests.append(path)
+        m = re.fullmatch(r"/gh/repos/([\w-]+/[\w-]+)/issues", path)
+        if m:
+            etag = f'"{m.group(1)}-v1"'
+            if (headers or {}).get("If-None-Match") == etag:
+                return 304, {"ETag": etag}, {}
+            return 200, {"ETag": etag}, [
+                {"number": 1, "body": "fatal: not a git repository (or any parent)"},
+            ]
+        if path == "/so/questions":
+            tag = query["tagged"][0]
+            return 200, {}, {"items": [
+                {"question_id": 1, "title": f"{tag}: RuntimeError: something broke here",
+                 "body": "", "score": 3},
+            ]}
+        if path == "/so/search/advanced":
+            qid = sum(map(ord, query["q"][0])) * 10
+            return 200, {}, {"items": [
+                {"question_id": qid, "title": query["q"][0], "answer_count": 2},
+                {"question_id": qid + 1, "title": "unanswered", "answer_count": 0},
+            ], "backoff": 0.01}
+        m = re.fullmatch(r"/so/questions/([\d;]+)/answers", path)
+        if m:
+            ids = [int(qid) for qid in m.group(1).split(";")]
+            if len(ids) > 100:
+                return 400, {}, {"error_message": "too many ids"}
+            if self.failing_answers:
+                return 400, {}, {"error_message": "bad request"}
+            answers = [
+                {"answer_id": qid * 10 + i, "question_id": qid, "body": f"a{i}",
+                 "score": 5 - i, "is_accepted": i == 0}
+                for i in range(2)
+                for qid in ids
+            ]
+            page, size = int(query["page"][0]), int(query["pagesize"][0])
+            return 200, {}, {"items": answers[(page - 1) * size:page * size],
+                             "has_more": page * size < len(answers)}
+        if path == "/gh/search/issues":
+            if any(q in query["q"][0] for q in self.failing_queries):
+                return 404, {}, {"message": "not found"}
+            with self.lock:
+                limited, self.rate_limit_next_gh = self.rate_limit_next_gh, False
+            if limited:
+                return 429, {"Retry-After": "0.05"}, {"message": "rate limited"}
+            return 200, {"X-RateLimit-Remaining": "29"}, {"items": [
+                {"number": 7, "title": "issue", "body": None, "labels": [{"name": "bug"}]},
+            ]}
+        return 404, {}, {"message": "not found"}
+
+
+@pytest.fixture
+def stub_api():
+    api = StubApi()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            with api.lock:
+                api.in_flight += 1
+                api.max_in_flight = max(api.max_in_flight, api.in_flight)
+            try:
+                time.sleep(api.delay)
+                status, headers, body = api.handle(
+                    url.path, parse_qs(url.query), dict(self.headers)
+                )
+            finally:
+                with api.lock:
+                    api.in_flight -= 1
+            payload = json.dumps(body).encode() if status != 304 else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    api.base = f"http://127.0.0.1:{server.server_address[1]}"
+    yield api
+    server.shutdown()
+    server.server_close()
+
+
+def _pairs(n: int) -> list[dict]:
+    return [
+        {
+            "id": f"python/error-{i}/py311-linux",
+            "signature": {"domain": "python", "signature": f"ValueError: case {i}"},
+            "environment": {"os": "linux"},
+        }
+        for i in range(n)
+    ]
+
+
+class TestTokenBucket:
+    def test_rate_and_pause(self):
+        now = [0.0]
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2.0, clock=lambda: now[0], sleep=sleep)
+        for _ in range(3):
+            bucket.acquire()
+        assert now[0] == pytest.approx(1.0)
+
+        bucket.pause(5.0)
+        bucket.acquire()
+        assert now[0] == pytest.approx(6.5)
+
+
+class TestCollector:
+    def test_main_writes_evidence_for_every_pair(self, stub_api, tmp_path):
+        pairs_file = tmp_path / "pairs.jsonl"
+        pairs_file.write_text("\n".join(json.dumps(p) for p in _pairs(5)))
+        out = tmp_path / "evidence"
+
+        ce.main([
+            "--input", str(pairs_file), "--output-dir", str(out),
+            "--so-api-base", f"{stub_api.base}/so", "--gh-api-base", f"{stub_api.base}/gh",
+            "--so-rate", "500", "--gh-rate", "500", "--workers", "3",
+            "--cache-dir", str(tmp_path / "cache"), "--state", str(tmp_path / "state.db"),
+        ])
+
+        files = sorted(out.glob("*.json"))
+        assert len(files) == 5
+        evidence = json.loads((out / "python_error-0_py311-linux.json").read_text())
+        answered, unanswered = evidence["stackoverflow"]
+        assert [a["body"] for a in answered["answers"]] == ["a0", "a1"]
+        assert unanswered["answers"] == []
+        assert evidence["github_issues"][0]["labels"] == ["bug"]
+        assert evidence["total_sources"] == 3
+        # The rate-limited GitHub search was retried, not lost
+        assert stub_api.requests.count("/gh/search/issues") == 6
+        # All five pairs' answers came from one batched request
+        assert len([r for r in stub_api.requests if r.endswith("/answers")]) == 1
+
+    def test_resume_skips_done_pairs_and_retries_failed(self, stub_api, tmp_path):
+        pairs_file = tmp_path / "pairs.jsonl"
+        pairs_file.write_text("\n".join(json.dumps(p) for p in _pairs(4)))
+        out = tmp_path / "evidence"
+        stub_api.rate_limit_next_gh = False
+        stub_api.failing_queries = {"case 2"}
+        argv = [
+            "--input", str(pairs_file), "--output-dir", str(out), "--resume",
+            "--so-api-base", f"{stub_api.base}/so", "--gh-api-base", f"{stub_api.base}/gh",
+            "--so-rate", "500", "--gh-rate", "500", "--no-cache",
+            "--state", str(tmp_path / "state.db"),
+        ]
+        (out / "python_error-3_py311-linux.json").parent.mkdir(parents=True)
+        (out / "python_error-3_py311-linux.json").write_text("{}")  # pre-existing output
+
+        ce.main(argv)
+        searched = stub_api.requests.count("/so/search/advanced")
+        assert searched == 3
+        state = PipelineState(tmp_path / "state.db")
+        failed = state.items("evidence", "failed")
+        assert [r["item"] for r in failed] == ["python/error-2/py311-linux"]
+        assert "GH search failed" in failed[0]["error"]
+
+        ce.main(argv)
+        assert stub_api.requests.count("/so/search/advanced") == searched
+
+        stub_api.failing_queries = set()
+        ce.main([*argv, "--retry-failed"])
+        assert stub_api.requests.count("/so/search/advanced") == searched + 1
+        assert state.counts()["evidence"] == {"done": 4}
+
+    def test_pairs_stream_from_stdin_and_limit_is_lazy(self, stub_api, tmp_path, monkeypatch):
+        read = []
+
+        class Stdin:
+            def __iter__(self):
+                for pair in _pairs(50):
+                    read.append(pair["id"])
+                    yield json.dumps(pair) + "\n"
+
+        monkeypatch.setattr("sys.stdin", Stdin())
+        out = tmp_path / "evidence"
+        ce.main([
+            "--input", "-", "--output-dir", str(out), "--limit", "3", "--workers", "2",
+            "--so-api-base", f"{stub_api.base}/so", "--gh-api-base", f"{stub_api.base}/gh",
+            "--so-rate", "500", "--gh-rate", "500", "--no-cache",
+            "--state", str(tmp_path / "state.db"),
+        ])
+        assert len(list(out.glob("*.json"))) == 3
+        assert len(read) == 3
+
+    def test_in_flight_pairs_are_bounded(self, stub_api):
+        stub_api.delay = 0.05
+        clients = ce.make_clients(
+            so_base=f"{stub_api.base}/so", gh_base=f"{stub_api.base}/gh",
+            so_rate=1000, gh_rate=1000,
+        )
+        results = list(ce.collect_all(_pairs(8), clients, workers=3))
+        assert sorted(r["pair_id"] for r in results) == [p["id"] for p in _pairs(8)]
+        assert 1 < stub_api.max_in_flight <= 3
+
+    def test_answers_are_fetched_in_batches_across_pairs(self, stub_api):
+        clients = ce.make_clients(
+            so_base=f"{stub_api.base}/so", gh_base=f"{stub_api.base}/gh",
+            so_rate=1000, gh_rate=1000,
+        )
+        results = list(ce.collect_all(_pairs(150), clients, workers=4))
+
+        assert len(results) == 150
+        for evidence in results:
+            answered = evidence["stackoverflow"][0]
+            assert [a["answer_id"] for a in answered["answers"]] == [
+                answered["question_id"] * 10, answered["question_id"] * 10 + 1,
+            ]
+        batches = [r for r in stub_api.requests if r.endswith("/answers")]
+        # ~150 distinct answered questions: two 100-id batches of two pages each
+        assert len(batches) <= 6
+        assert stub_api.requests.count("/so/search/advanced") == 150
+
+    def test_answer_batches_repeat_across_runs(self, stub_api):
+        clients = ce.make_clients(
+            so_base=f"{stub_api.base}/so", gh_base=f"{stub_api.base}/gh",
+            so_rate=1000, gh_rate=1000,
+        )
+        runs = []
+        for workers in (8, 3):
+            stub_api.requests.clear()
+            results = list(ce.collect_all(_pairs(150), clients, workers=workers))
+            assert [r["pair_id"] for r in results] == [p["id"] for p in _pairs(150)]
+            runs.append([r for r in stub_api.requests if r.endswith("/answers")])
+        # Same pairs, same answer requests, whatever order the searches finished in
+        assert runs[0] == runs[1]
+        first = [int(qid) for qid in runs[0][0].split("/")[3].split(";")]
+        assert first == sorted(first)
+
+    def test_failed_answer_batch_fails_its_pairs(self, stub_api, tmp_path):
+        pairs_file = tmp_path / "pairs.jsonl"
+        pairs_file.write_text("\n".join(json.dumps(p) for p in _pairs(3)))
+        stub_api.rate_limit_next_gh = False
+        stub_api.failing_answers = True
+        argv = [
+            "--input", str(pairs_file), "--output-dir", str(tmp_path / "evidence"),
+            "--resume", "--so-api-base", f"{stub_api.base}/so",
+            "--gh-api-base", f"{stub_api.base}/gh", "--so-rate", "500", "--gh-rate", "500",
+            "--no-cache", "--state", str(tmp_path / "state.db"),
+        ]
+        ce.main(argv)
+        state = PipelineState(tmp_path / "state.db")
+        failed = state.items("evidence", "failed")
+        assert len(failed) == 3
+        assert all("SO answers fetch failed" in r["error"] for r in failed)
+
+        stub_api.failing_answers = False
+        ce.main([*argv, "--retry-failed"])
+        assert state.counts()["evidence"] == {"done": 3}
+
+    def test_client_raises_after_retries(self, stub_api):
+        client = ApiClient(f"{stub_api.base}/nope", rate=1000, max_retries=1)
+        with pytest.raises(requests.HTTPError):
+            client.get_json("/missing")
+        assert client.requests_made == 1  # 404 is not retried
+
+
+class TestHttpCache:
+    def test_fresh_entries_skip_the_network_and_ignore_credentials(self, stub_api, tmp_path):
+        cache = HttpCache(tmp_path, ttl=3600)
+        first = ApiClient(f"{stub_api.base}/so", rate=1000, cache=cache,
+                          default_params={"key": "one"})
+        other = ApiClient(f"{stub_api.base}/so", rate=1000, cache=cache,
+                          default_params={"key": "two"})
+
+        data = first.get_json("/questions", {"tagged": "python"})
+        assert first.get_json("/questions", {"tagged": "python"}) == data
+        assert other.get_json("/questions", {"tagged": "python"}) == data
+        assert first.requests_made + other.requests_made == 1
+        assert cache.hits == 2
+        # Different params are a different entry
+        other.get_json("/questions", {"tagged": "git"})
+        assert other.requests_made == 1
+
+    def test_stale_entries_are_revalidated_with_etag(self, stub_api, tmp_path):
+        cache = HttpCache(tmp_path, ttl=0)
+        client = ApiClient(f"{stub_api.base}/gh", rate=1000, cache=cache)
+
+        issues = client.get_json("/repos/git/git/issues")
+        assert client.get_json("/repos/git/git/issues") == issues
+        assert client.requests_made == 2
+        assert cache.revalidated == 1
+
+    def test_size_is_bounded_by_evicting_least_recently_used(self, stub_api, tmp_path):
+        cache = HttpCache(tmp_path, ttl=3600, max_bytes=1500)
+        client = ApiClient(f"{stub_api.base}/so", rate=1000, cache=cache)
+        for i in range(20):
+            client.get_json("/questions", {"tagged": f"tag{i}"})
+            time.sleep(0.01)  # distinct mtimes for LRU order
+
+        files = list(tmp_path.glob("*/*.json"))
+        assert 0 < len(files) < 20
+        assert sum(f.stat().st_size for f in files) <= 1500
+        # The newest entry survived eviction
+        client.get_json("/questions", {"tagged": "tag19"})
+        assert cache.hits == 1
+
+    def test_first_write_is_counted_once(self, stub_api, tmp_path):
+        probe = ApiClient(f"{stub_api.base}/so", rate=1000,
+                          cache=HttpCache(tmp_path / "probe", ttl=3600))
+        probe.get_json("/questions", {"tagged": "python"})
+        (entry,) = (tmp_path / "probe").glob("*/*.json")
+
+        # Room for one entry (not two): the first write of a process must not evict it
+        cache = HttpCache(tmp_path / "cache", ttl=3600,
+                          max_bytes=entry.stat().st_size * 21 // 20)
+        client = ApiClient(f"{stub_api.base}/so", rate=1000, cache=cache)
+        client.get_json("/questions", {"tagged": "python"})
+        assert len(list((tmp_path / "cache").glob("*/*.json"))) == 1
+        client.get_json("/questions", {"tagged": "python"})
+        assert cache.hits == 1
+
+    def test_collect_signatures_reruns_from_cache(self, stub_api, tmp_path):
+        argv = [
+            "--so-tags", "python", "--gh-repos", "git/git",
+            "--so-api-base", f"{stub_api.base}/so", "--gh-api-base", f"{stub_api.base}/gh",
+            "--cache-dir", str(tmp_path / "cache"), "--output", str(tmp_path / "sigs.jsonl"),
+            "--state", str(tmp_path / "state.db"),
+        ]
+        cs.main(argv)
+        fetched = len(stub_api.requests)
+        first = (tmp_path / "sigs.jsonl").read_text()
+        cs.main(argv)
+        assert len(stub_api.requests) == fetched
+        assert (tmp_path / "sigs.jsonl").read_text() == first
+        assert "fatal: not a git repository" in first
+
+        cs.main([*argv, "--no-cache"])
+        assert len(stub_api.requests) == fetched + 2
@@ -0,0 +1,283 @@
+"""Tests for concurrent and batch canon generation, using a fake Claude client."""
+
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    import anthropic
+    import httpx
+
+    from generator import generate_canons as gc
+    from generator.pipeline_state import PipelineState
+except ImportError:
+    pytest.skip(
+        "pipeline dependencies not installed (pip install -e '.[pipeline]')",
+        allow_module_level=True,
+    )
+
+TEMPLATE = Path(__file__).parent.parent / "data" / "canons" / "python" / "keyerror" / \
+    "py311-linux.json"
+
+
+EVIDENCE = {
+    "pair_id": "python/fake-error/py311-linux",
+    "signature": "KeyError: 'k'",
+    "domain": "python",
+    "environment": {"runtime": {"name": "python", "version_range": ">=3.11"}, "os": "linux"},
+    "stackoverflow": [],
+    "github_issues": [],
+}
+
+
+def canon_for(pair_id: str) -> dict:
+    canon = json.loads(TEMPLATE.read_text(encoding="utf-8"))
+    canon["id"] = pair_id
+    canon["url"] = f"https://deadends.dev/{pair_id}"
+    return canon
+
+
+class FakeClient:
+    """Stands in for anthropic.Anthropic: replies with a canon for the prompt's id."""
+
+    def __init__(self, rate_limits: int = 0, delay: float = 0.0, bad: set[str] = frozenset(),
+                 failures: list[Exception] = ()):
+        self.rate_limits = rate_limits
+        self.failures = list(failures)
+        self.delay = delay
+        self.bad = set(bad)
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.messages = SimpleNamespace(create=self.create)
+
+    def create(self, model, max_tokens, messages):
+        pair_id = re.search(r'"id": "([^"]+)"', messages[0]["content"]).group(1)
+        with self.lock:
+            self.calls.append(pair_id)
+            if self.failures:
+                raise self.failures.pop(0)
+            if self.rate_limits:
+                self.rate_limits -= 1
+                request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+                response = httpx.Response(429, headers={"retry-after": "0.01"},
+                                          request=request)
+                raise anthropic.RateLimitError("rate limited", response=response, body=None)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        text = "Sorry, no." if pair_id in self.bad else \
+            "```json\n" + json.dumps(canon_for(pair_id)) + "\n```"
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    evidence_dir = tmp_path / "evidence"
+    evidence_dir.mkdir()
+    for i in range(6):
+        _write_evidence(evidence_dir, f"python/fake-error-{i}/py311-linux", f"KeyError: 'k{i}'")
+    return tmp_path
+
+
+def _write_evidence(evidence_dir: Path, pair_id: str, signature: str, os_name: str = "linux",
+                    sources: int = 0) -> None:
+    (evidence_dir / f"{pair_id.replace('/', '_')}.json").write_text(json.dumps({
+        "pair_id": pair_id,
+        "signature": signature,
+        "domain": "python",
+        "environment": {"runtime": {"name": "python", "version_range": ">=3.11"},
+                        "os": os_name},
+        "stackoverflow": [],
+        "github_issues": [],
+        "total_sources": sources,
+    }))
+
+
+def _argv(ws: Path, *extra: str) -> list[str]:
+    return [
+        "--input-dir", str(ws / "evidence"), "--output-dir", str(ws / "canons"),
+        "--state", str(ws / "state.db"), "--prompt-cache-dir", str(ws / "prompt-cache"),
+        "--rate", "1000", *extra,
+    ]
+
+
+def _canons(ws: Path) -> list[str]:
+    return sorted(p.parent.name for p in (ws / "canons").glob("python/*/*.json"))
+
+
+class TestConcurrentGeneration:
+    def test_generates_concurrently_and_backs_off(self, workspace):
+        client = FakeClient(rate_limits=2, delay=0.05)
+        gc.main(_argv(workspace, "--workers", "3", "--validate"), client=client)
+
+        assert _canons(workspace) == [f"fake-error-{i}" for i in range(6)]
+        assert len(client.calls) == 8  # two rate-limited attempts were retried
+        assert 1 < client.max_in_flight <= 3
+        with PipelineState(workspace / "state.db") as state:
+            assert state.counts()["canon"] == {"done": 6}
+            assert state.counts()["validated"] == {"done": 6}
+
+    def test_failures_are_recorded_and_retried_on_request(self, workspace):
+        bad = "python/fake-error-4/py311-linux"
+        gc.main(_argv(workspace, "--resume"), client=FakeClient(bad={bad}))
+        with PipelineState(workspace / "state.db") as state:
+            failed = state.items("canon", "failed")
+        assert [r["item"] for r in failed] == [bad]
+        assert "parse" in failed[0]["error"]
+
+        client = FakeClient()
+        gc.main(_argv(workspace, "--resume"), client=client)
+        assert client.calls == []
+        # The unparseable reply was not cached, so the retry asks again
+        gc.main(_argv(workspace, "--resume", "--retry-failed"), client=client)
+        assert client.calls == [bad]
+        assert len(_canons(workspace)) == 6
+
+    @pytest.mark.parametrize("status", [500, 503])
+    def test_connection_and_server_errors_are_retried(self, monkeypatch, status):
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        client = FakeClient(failures=[
+            anthropic.APIConnectionError(request=request),
+            anthropic.InternalServerError(
+                "server error", response=httpx.Response(status, request=request), body=None,
+            ),
+        ])
+        monkeypatch.setattr(gc.time, "sleep", lambda s: None)
+        limiter = gc.AdaptiveLimiter(rate=1000)
+        canon = gc.generate_canon_from_evidence(EVIDENCE, client, limiter=limiter)
+        assert canon["id"] == EVIDENCE["pair_id"]
+        assert len(client.calls) == 3
+        assert limiter.throttles == 0  # Transient errors do not slow other workers
+
+    def test_client_errors_are_not_retried(self):
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        client = FakeClient(failures=[anthropic.BadRequestError(
+            "bad", response=httpx.Response(400, request=request), body=None,
+        )])
+        errors: list[str] = []
+        assert gc.generate_canon_from_evidence(EVIDENCE, client, errors=errors) is None
+        assert len(client.calls) == 1
+        assert "Claude API error" in errors[0]
+
+    def test_limiter_halves_on_throttle_and_recovers(self):
+        limiter = gc.AdaptiveLimiter(rate=4.0)
+        limiter.throttled(0)
+        limiter.throttled(0)
+        assert limiter.rate == pytest.approx(1.0)
+        for _ in range(20):
+            limiter.succeeded()
+        assert limiter.rate == pytest.approx(4.0)
+
+
+class TestDeduplication:
+    def test_identical_prompts_are_answered_from_cache(self, workspace):
+        first = FakeClient()
+        gc.main(_argv(workspace), client=first)
+        assert len(first.calls) == 6
+
+        again = FakeClient()
+        gc.main(_argv(workspace, "--validate"), client=again)
+        assert again.calls == []
+        assert len(_canons(workspace)) == 6
+
+        gc.main(_argv(workspace, "--no-prompt-cache"), client=again)
+        assert len(again.calls) == 6
+
+    def test_prompt_key_is_per_pair_and_environment(self):
+        rerun = {**EVIDENCE, "collection_timestamp": "2030-01-01T00:00:00Z"}
+        assert gc.prompt_key("m", rerun) == gc.prompt_key("m", EVIDENCE)
+        other_env = {**EVIDENCE, "environment": {**EVIDENCE["environment"], "os": "macos"}}
+        assert gc.prompt_key("m", other_env) != gc.prompt_key("m", EVIDENCE)
+        assert gc.prompt_key("other", EVIDENCE) != gc.prompt_key("m", EVIDENCE)
+
+    def test_per_signature_generates_one_base_per_signature(self, tmp_path):
+        evidence_dir = tmp_path / "evidence"
+        evidence_dir.mkdir()
+        for os_name, sources in (("linux", 1), ("macos", 4), ("windows", 2)):
+            _write_evidence(evidence_dir, f"python/shared-error/py311-{os_name}",
+                            "KeyError: 'shared'", os_name, sources)
+        _write_evidence(evidence_dir, "python/other-error/py311-linux", "KeyError: 'other'")
+
+        client = FakeClient()
+        gc.main(_argv(tmp_path, "--per-signature", "--validate"), client=client)
+
+        assert sorted(client.calls) == [
+            "python/other-error/py311-linux", "python/shared-error/py311-macos",
+        ]
+        windows = json.loads(
+            (tmp_path / "canons" / "python" / "shared-error" / "py311-windows.json").read_text()
+        )
+        assert windows["id"] == "python/shared-error/py311-windows"
+        assert windows["environment"]["os"] == "windows"
+        assert windows["metadata"]["derived_from"] == "python/shared-error/py311-macos"
+        with PipelineState(tmp_path / "state.db") as state:
+            assert state.counts()["validated"] == {"done": 4}
+
+    def test_per_signature_batch_derives_on_ingest(self, tmp_path):
+        evidence_dir = tmp_path / "evidence"
+        evidence_dir.mkdir()
+        for os_name in ("linux", "macos"):
+            _write_evidence(evidence_dir, f"python/shared-error/py311-{os_name}",
+                            "KeyError: 'shared'", os_name)
+        requests_file = tmp_path / "requests.jsonl"
+        gc.main(_argv(tmp_path, "--per-signature", "--batch-prepare", str(requests_file)))
+
+        (request,) = [json.loads(line) for line in requests_file.read_text().splitlines()]
+        results_file = tmp_path / "results.jsonl"
+        results_file.write_text(json.dumps({"custom_id": request["custom_id"], "result": {
+            "type": "succeeded", "message": {"content": [
+                {"type": "text",
+                 "text": json.dumps(canon_for("python/shared-error/py311-linux"))},
+            ]},
+        }}) + "\n")
+        gc.main(_argv(tmp_path, "--batch-ingest", str(results_file),
+                      "--batch-requests", str(requests_file), "--validate"))
+        assert _canons(tmp_path) == ["shared-error", "shared-error"]
+
+
+class TestBatchMode:
+    def test_prepare_then_ingest(self, workspace):
+        requests_file = workspace / "batch" / "requests.jsonl"
+        gc.main(_argv(workspace, "--batch-prepare", str(requests_file), "--limit", "4"))
+
+        lines = [json.loads(line) for line in requests_file.read_text().splitlines()]
+        assert len(lines) == 4
+        assert all(re.fullmatch(r"[A-Za-z0-9_-]{1,64}", r["custom_id"]) for r in lines)
+        assert lines[0]["params"]["model"] == gc.DEFAULT_MODEL
+        assert "python/fake-error-0/py311-linux" in lines[0]["params"]["messages"][0]["content"]
+        assert not (workspace / "canons").exists()
+
+        ids = json.loads((workspace / "batch" / "requests.jsonl.ids.json").read_text())
+        results = []
+        for r in lines:
+            pair_id = ids[r["custom_id"]]["pair_id"]
+            if pair_id.endswith("-3/py311-linux"):
+                result = {"type": "errored",
+                          "error": {"type": "error", "error": {"message": "overloaded"}}}
+            else:
+                result = {"type": "succeeded", "message": {"content": [
+                    {"type": "text", "text": json.dumps(canon_for(pair_id))},
+                ]}}
+            results.append(json.dumps({"custom_id": r["custom_id"], "result": result}))
+        results_file = workspace / "batch" / "results.jsonl"
+        results_file.write_text("\n".join(results) + "\n")
+
+        gc.main(_argv(workspace, "--batch-ingest", str(results_file),
+                      "--batch-requests", str(requests_file), "--validate"))
+
+        assert _canons(workspace) == ["fake-error-0", "fake-error-1", "fake-error-2"]
+        with PipelineState(workspace / "state.db") as state:
+            failed = state.items("canon", "failed")
+        assert [r["item"] for r in failed] == ["python/fake-error-3/py311-linux"]
+        assert "errored: overloaded" in failed[0]["error"]
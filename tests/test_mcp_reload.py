@@ -0,0 +1,162 @@
+"""Tests for hot reloading canon data in the stdio MCP server."""
+
+import gc
+import json
+import threading
+import weakref
+
+import pytest
+
+from generator.canon_writer import CanonWriter
+from mcp import server
+
+
+def canon(canon_id: str, signature: str) -> dict:
+    domain = canon_id.split("/")[0]
+    return {
+        "id": canon_id,
+        "url": f"https://deadends.dev/{canon_id}",
+        "error": {"signature": signature, "regex": signature, "domain": domain},
+        "verdict": {"resolvable": "true", "fix_success_rate": 0.9, "summary": "s"},
+        "dead_ends": [],
+        "workarounds": [],
+    }
+
+
+@pytest.fixture
+def corpus_dir(tmp_path, monkeypatch):
+    root = tmp_path / "canons"
+    with CanonWriter(root) as writer:
+        writer.write(root / "python" / "a" / "env.json", canon("python/a/env", "AError"))
+    monkeypatch.setattr(server, "DATA_DIR", root)
+    monkeypatch.setattr(server, "MANIFEST", tmp_path / ".canons-manifest.json")
+    monkeypatch.setattr(server, "RELOAD_INTERVAL_S", 0.001)
+    monkeypatch.setattr(server, "_CORPUS", None)
+    monkeypatch.setattr(server, "_failed_version", None)
+    yield root
+    if server._RELOADER is not None:
+        server._RELOADER.join()
+
+
+def wait_for_reload():
+    if server._RELOADER is not None:
+        server._RELOADER.join(timeout=10)
+
+
+def add_canon(root, canon_id: str, signature: str) -> None:
+    with CanonWriter(root) as writer:
+        writer.write(root / f"{canon_id}.json", canon(canon_id, signature))
+
+
+class TestHotReload:
+    def test_new_canons_are_swapped_in_without_blocking(self, corpus_dir, monkeypatch):
+        old = server._get_corpus()
+        assert [c["id"] for c in old.canons] == ["python/a/env"]
+
+        add_canon(corpus_dir, "node/b/env", "BError")
+        monkeypatch.setattr(server, "_last_check", 0.0)
+        # The request that notices the change is still served from the old snapshot
+        assert server._get_canons() is old.canons
+        wait_for_reload()
+
+        current = server._get_corpus()
+        assert current is not old
+        assert sorted(c["id"] for c in current.canons) == ["node/b/env", "python/a/env"]
+        assert set(current.domain_index) == {"python", "node"}
+        # A request that started on the old snapshot still sees consistent data
+        assert [c["id"] for c in old.canons] == ["python/a/env"]
+
+        old_ref = weakref.ref(old)
+        del old
+        gc.collect()
+        assert old_ref() is None
+
+    def test_unchanged_data_is_not_reloaded(self, corpus_dir, monkeypatch):
+        first = server._get_corpus()
+        monkeypatch.setattr(server, "_last_check", 0.0)
+        assert server._get_corpus() is first
+        wait_for_reload()
+        assert server._get_corpus() is first
+
+    def test_requests_never_scan_the_data(self, corpus_dir, monkeypatch):
+        server._get_corpus()
+        real_version = server._data_version
+        scanned_on = []
+
+        def data_version():
+            scanned_on.append(threading.current_thread().name)
+            return real_version()
+
+        monkeypatch.setattr(server, "_data_version", data_version)
+        add_canon(corpus_dir, "node/b/env", "BError")
+        monkeypatch.setattr(server, "_last_check", 0.0)
+        server._get_corpus()
+        wait_for_reload()
+        assert scanned_on and set(scanned_on) == {"canon-reload"}
+        assert len(server._get_corpus().canons) == 2
+
+    def test_reload_notification_forces_a_rebuild(self, corpus_dir):
+        first = server._get_corpus()
+        assert server.handle_request("notifications/deadends/reload", {}, first) is None
+        wait_for_reload()
+        assert server._get_corpus() is not first
+
+    def test_broken_data_keeps_the_current_snapshot(self, corpus_dir, monkeypatch, capsys):
+        first = server._get_corpus()
+        (corpus_dir / "python" / "torn.json").write_text('{"id": ')
+        add_canon(corpus_dir, "node/b/env", "BError")
+        monkeypatch.setattr(server, "_last_check", 0.0)
+        server._get_corpus()
+        wait_for_reload()
+        assert server._get_corpus() is first
+        assert "canon reload failed" in capsys.readouterr().err
+
+        # The same broken version is not retried on every check
+        monkeypatch.setattr(server, "_last_check", 0.0)
+        server._get_corpus()
+        wait_for_reload()
+        assert server._get_corpus() is first
+        assert "canon reload failed" not in capsys.readouterr().err
+
+    def test_lookup_sees_reloaded_canons(self, corpus_dir, monkeypatch):
+        server._get_corpus()
+        add_canon(corpus_dir, "node/b/env", "BError")
+        monkeypatch.setattr(server, "_last_check", 0.0)
+        server._get_corpus()
+        wait_for_reload()
+        result = server.handle_request(
+            "tools/call",
+            {"name": "lookup_error", "arguments": {"error_message": "BError happened"}},
+            server._get_corpus(),
+        )
+        assert "node/b/env" in json.dumps(result)
+
+    def test_edits_outside_the_pipeline_are_noticed(self, corpus_dir, monkeypatch):
+        first = server._get_corpus()
+        assert server.MANIFEST.exists()
+        # e.g. a hand edit or git pull: the manifest is not rewritten
+        path = corpus_dir / "node" / "b" / "env.json"
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps(canon("node/b/env", "BError")))
+        monkeypatch.setattr(server, "_last_check", 0.0)
+        server._get_corpus()
+        wait_for_reload()
+        assert sorted(c["id"] for c in server._get_corpus().canons) == [
+            "node/b/env", "python/a/env",
+        ]
+        assert server._get_corpus() is not first
+
+    def test_request_uses_only_its_own_snapshot(self, corpus_dir, monkeypatch):
+        old = server._get_corpus()
+        add_canon(corpus_dir, "node/b/env", "BError")
+        monkeypatch.setattr(server, "_last_check", 0.0)
+        server._get_corpus()
+        wait_for_reload()
+        assert len(server._get_corpus().domain_index) == 2
+
+        result = server.handle_request(
+            "tools/call",
+            {"name": "lookup_error", "arguments": {"error_message": "no such error"}},
+            old,
+        )
+        assert "Searched 1 error patterns across 1 domains" in result["content"][0]["text"]
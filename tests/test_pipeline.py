@@ -1,11 +1,16 @@
 """Tests for the pipeline steps (collect_signatures, generate_pairs)."""
 
+import io
+import json
+
 import pytest
 
 try:
+    from generator import generate_pairs as gp
     from generator.collect_signatures import (
         SEED_SIGNATURES,
         build_regex_from_signature,
+        cluster_signatures,
         deduplicate_signatures,
         normalize_signature,
         signature_hash,
@@ -89,6 +94,102 @@ class TestDeduplication:
         assert len(result) == 2
 
 
+class TestClustering:
+    def test_merges_messages_differing_in_names_and_numbers(self):
+        sigs = [
+            {"signature": "ModuleNotFoundError: No module named 'numpy'",
+             "domain": "python", "score": 3},
+            {"signature": "ModuleNotFoundError: No module named 'torch'",
+             "domain": "python", "score": 40},
+            {"signature": "ModuleNotFoundError: No module named 'yaml.cyaml'",
+             "domain": "python", "score": 1},
+            {"signature": "ConnectionRefusedError: [Errno 111] Connection refused (port 5432)",
+             "domain": "python"},
+            {"signature": "ConnectionRefusedError: [Errno 111] Connection refused (port 6379)",
+             "domain": "python"},
+        ]
+        result = sorted(cluster_signatures(sigs), key=lambda s: -s["cluster_size"])
+        assert [r["cluster_size"] for r in result] == [3, 2]
+        assert result[0]["score"] == 40  # Best-evidenced member represents the cluster
+        assert {m["signature"] for m in result[0]["cluster_members"]} == {
+            s["signature"] for s in sigs[:3]
+        }
+
+    def test_keeps_distinct_errors_and_domains_apart(self):
+        sigs = [
+            {"signature": "KeyError: 'user_id'", "domain": "python"},
+            {"signature": "IndexError: list index out of range", "domain": "python"},
+            {"signature": "TypeError: 'NoneType' object is not subscriptable",
+             "domain": "python"},
+            {"signature": "KeyError: 'user_id'", "domain": "node"},
+        ]
+        result = cluster_signatures(sigs)
+        assert len(result) == 4
+        assert all(r["cluster_size"] == 1 for r in result)
+
+    @pytest.mark.parametrize("pair", [
+        ("TypeError: 'int' object is not callable",
+         "TypeError: 'NoneType' object is not subscriptable"),
+        ("RuntimeError: Set changed size during iteration",
+         "RuntimeError: dictionary changed size during iteration"),
+        ("error[E0412]: cannot find type `Foo` in this scope",
+         "error[E0425]: cannot find value `foo` in this scope"),
+        ("cuDNN error: CUDNN_STATUS_NOT_SUPPORTED",
+         "cuDNN error: CUDNN_STATUS_NOT_INITIALIZED"),
+        ("java.lang.NullPointerException", "java.lang.ClassCastException"),
+        ("java.lang.OutOfMemoryError: Java heap space",
+         "java.lang.OutOfMemoryError: Metaspace"),
+    ])
+    def test_same_template_different_errors_stay_apart(self, pair):
+        sigs = [{"signature": sig, "domain": "python"} for sig in pair]
+        assert len(cluster_signatures(sigs, threshold=0.0)) == 2
+
+    def test_added_context_still_merges(self):
+        sigs = [
+            {"signature": "error[E0382]: borrow of moved value", "domain": "rust"},
+            {"signature": "error[E0382]: borrow of moved value: `x`", "domain": "rust"},
+            {"signature": "Error: listen EADDRINUSE: address already in use :::3000",
+             "domain": "node"},
+            {"signature": "Error: listen EADDRINUSE: address already in use :::8080",
+             "domain": "node"},
+        ]
+        assert sorted(r["cluster_size"] for r in cluster_signatures(sigs)) == [2, 2]
+
+    def test_chained_matches_do_not_join_different_errors(self):
+        # A~B and A~C each add context to A, but B and C add different words
+        sigs = [
+            {"signature": "error[E0382]: borrow of moved value", "domain": "rust"},
+            {"signature": "error[E0382]: borrow of moved value in loop", "domain": "rust"},
+            {"signature": "error[E0382]: borrow of moved value in closure", "domain": "rust"},
+        ]
+        for order in (sigs, sigs[::-1], [sigs[1], sigs[0], sigs[2]]):
+            for r in cluster_signatures(order, threshold=0.0):
+                members = {m["signature"] for m in r["cluster_members"]}
+                assert not {sigs[1]["signature"], sigs[2]["signature"]} <= members
+
+    def test_manual_seeds_are_never_merged(self):
+        sigs = [
+            {"signature": "ModuleNotFoundError: No module named 'a'",
+             "domain": "python", "source": "manual_seed"},
+            {"signature": "ModuleNotFoundError: No module named 'b'",
+             "domain": "python", "source": "manual_seed"},
+            {"signature": "ModuleNotFoundError: No module named 'c'",
+             "domain": "python", "source": "stackoverflow:1", "score": 99},
+        ]
+        result = cluster_signatures(sigs)
+        assert len(result) == 2
+        assert all(r["source"] == "manual_seed" for r in result)
+        assert sorted(r["cluster_size"] for r in result) == [1, 2]
+
+    def test_scales_to_thousands_of_variants(self):
+        sigs = [
+            {"signature": f"error: could not compile `crate{i}` due to {i % 7 + 2} errors",
+             "domain": "rust"}
+            for i in range(5000)
+        ]
+        assert len(cluster_signatures(sigs)) == 1
+
+
 class TestBuildRegex:
     def test_basic_regex(self):
         regex = build_regex_from_signature("Error: X")
@@ -212,3 +313,35 @@ class TestEnvironmentMatrix:
         for domain, envs in ENVIRONMENT_MATRIX.items():
             for env in envs:
                 assert "os" in env, f"Missing os in {domain} env"
+
+
+class TestStreamingPairs:
+    def test_pairs_are_generated_lazily(self):
+        pulled = []
+
+        def signatures():
+            for i in range(1000):
+                pulled.append(i)
+                yield {"signature": f"KeyError: 'k{i}'", "domain": "python"}
+
+        pairs = gp.generate_pairs(signatures(), max_per_sig=2)
+        first = [next(pairs) for _ in range(3)]
+        assert pulled == [0, 1]
+        assert [p["signature"]["signature"] for p in first] == [
+            "KeyError: 'k0'", "KeyError: 'k0'", "KeyError: 'k1'",
+        ]
+
+    def test_main_streams_stdin_to_stdout(self, monkeypatch, tmp_path):
+        sigs = [
+            {"signature": "RuntimeError: CUDA error: out of memory", "domain": "cuda"},
+            {"signature": "fatal: not a git repository", "domain": "git"},
+        ]
+        monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(map(json.dumps, sigs))))
+        out = io.StringIO()
+        monkeypatch.setattr("sys.stdout", out)
+
+        gp.main(["--input", "-", "--output", "-", "--state", str(tmp_path / "state.db")])
+
+        pairs = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert pairs and all(p["id"].startswith(("cuda/", "git/")) for p in pairs)
+        assert all(p["environment"]["os"] == "linux" for p in pairs if p["id"][:5] == "cuda/")
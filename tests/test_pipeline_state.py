@@ -0,0 +1,105 @@
+"""Tests for the SQLite pipeline state store."""
+
+import threading
+
+import pytest
+
+from generator.pipeline_state import PipelineState
+
+
+@pytest.fixture
+def clock():
+    now = [1_000_000.0]
+    return now
+
+
+@pytest.fixture
+def state(tmp_path, clock):
+    with PipelineState(tmp_path / "state.db", lease=60, clock=lambda: clock[0]) as s:
+        yield s
+
+
+class TestClaim:
+    def test_new_items_are_claimed_once(self, state):
+        assert state.claim("evidence", "python/a/env")
+        assert not state.claim("evidence", "python/a/env")
+        row = state.status("evidence", "python/a/env")
+        assert row["status"] == "running"
+        assert row["attempts"] == 1
+
+    def test_expired_lease_is_reclaimed(self, state, clock):
+        state.claim("evidence", "x")
+        clock[0] += 61
+        assert state.claim("evidence", "x")
+        assert state.status("evidence", "x")["attempts"] == 2
+
+    def test_failed_items_need_retry_failed(self, state):
+        state.claim("canon", "x")
+        state.fail("canon", "x", "no usable canon")
+        assert not state.claim("canon", "x")
+        assert state.items("canon", "failed")[0]["error"] == "no usable canon"
+        assert state.claim("canon", "x", retry_failed=True)
+        state.complete("canon", "x")
+        row = state.status("canon", "x")
+        assert (row["status"], row["error"], row["attempts"]) == ("done", None, 2)
+
+    def test_done_items_need_force_or_staleness(self, state, clock):
+        state.claim("evidence", "x")
+        state.complete("evidence", "x")
+        assert not state.claim("evidence", "x")
+        assert not state.claim("evidence", "x", stale_days=30)
+        clock[0] += 31 * 86400
+        assert [r["item"] for r in state.items("evidence", stale_days=30)] == ["x"]
+        assert state.claim("evidence", "x", stale_days=30)
+        state.complete("evidence", "x")
+        assert state.claim("evidence", "x", force=True)
+
+    def test_existing_output_is_adopted_once(self, state):
+        checked = []
+
+        def done(item):
+            checked.append(item)
+            return item == "old"
+
+        assert not state.claim("canon", "old", done=done)
+        assert state.claim("canon", "new", done=done)
+        assert not state.claim("canon", "old", done=done)
+        assert checked == ["old", "new"]
+        assert state.status("canon", "old")["status"] == "done"
+
+    def test_peek_writes_nothing(self, state):
+        assert state.claim("evidence", "x", peek=True)
+        assert state.status("evidence", "x") is None
+
+    def test_unknown_stage_is_rejected(self, state):
+        with pytest.raises(ValueError, match="Unknown stage"):
+            state.claim("deploy", "x")
+
+
+class TestStore:
+    def test_counts_follow_pipeline_order(self, state):
+        state.mark_done("pair", ["a", "b"])
+        state.claim("evidence", "a")
+        state.fail("evidence", "b", "boom")
+        assert state.counts() == {
+            "pair": {"done": 2},
+            "evidence": {"running": 1, "failed": 1},
+        }
+
+    def test_parallel_workers_claim_disjoint_items(self, tmp_path):
+        items = [f"python/e{i}/env" for i in range(200)]
+        PipelineState(tmp_path / "state.db").close()
+        claimed: list[list[str]] = [[] for _ in range(4)]
+
+        def work(slot):
+            with PipelineState(tmp_path / "state.db") as s:
+                claimed[slot] = [item for item in items if s.claim("evidence", item)]
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        everything = [item for batch in claimed for item in batch]
+        assert sorted(everything) == sorted(items)
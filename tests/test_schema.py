@@ -3,7 +3,7 @@
 import pytest
 from jsonschema import ValidationError, validate
 
-from generator.schema import ERRORCANON_SCHEMA
+from generator.schema import ERRORCANON_SCHEMA, get_validator, schema_error
 
 
 class TestSchemaEdgeCases:
@@ -75,3 +75,32 @@ class TestSchemaEdgeCases:
             canon = make_canon()
             canon["verdict"]["resolvable"] = val
             validate(instance=canon, schema=ERRORCANON_SCHEMA)
+
+
+class TestCachedValidator:
+    def test_validator_is_built_once(self):
+        assert get_validator() is get_validator()
+
+    def test_valid_canon_has_no_error(self, valid_canon):
+        assert schema_error(valid_canon) is None
+
+    def test_error_matches_uncached_validate(self, make_canon):
+        broken = []
+        canon = make_canon()
+        del canon["environment"]["os"]
+        broken.append(canon)
+        canon = make_canon()
+        canon["verdict"]["resolvable"] = "maybe"
+        canon["schema_version"] = "x"
+        broken.append(canon)
+        canon = make_canon()
+        canon["dead_ends"][0]["fail_rate"] = "high"
+        broken.append(canon)
+        for canon in broken:
+            with pytest.raises(ValidationError) as exc:
+                validate(instance=canon, schema=ERRORCANON_SCHEMA)
+            error = schema_error(canon)
+            assert error is not None
+            assert (error.message, list(error.path)) == (
+                exc.value.message, list(exc.value.path)
+            )
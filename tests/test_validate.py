@@ -1,8 +1,26 @@
 """Tests for ErrorCanon validation logic."""
 
+import json
 
+from generator.validate import (
+    validate_all,
+    validate_canon_json,
+    validate_cross_references,
+    validate_graph,
+    validate_page,
+)
 
-from generator.validate import validate_canon_json, validate_cross_references
+
+def _write_page(site_dir, canon_id, ld):
+    page = site_dir / canon_id / "index.html"
+    page.parent.mkdir(parents=True)
+    page.write_text(
+        '<link rel="canonical" href="x"><pre id="ai-summary"></pre>'
+        '<section id="dead-ends"></section>'
+        f'<script type="application/ld+json">{json.dumps(ld)}</script>',
+        encoding="utf-8",
+    )
+    return page
 
 
 class TestValidCanon:
@@ -171,3 +189,138 @@ class TestCrossReferences:
         )
         warnings = validate_cross_references([canon1])
         assert len(warnings) == 1
+
+
+class TestPageValidation:
+    def test_single_parse_reports_both_checks(self, tmp_path, valid_canon):
+        verdict = dict(valid_canon["verdict"], fix_success_rate=0.01)
+        page = _write_page(tmp_path, valid_canon["id"], {
+            "id": valid_canon["id"], "verdict": verdict,
+        })
+        html_errors, consistency = validate_page(page, {valid_canon["id"]: valid_canon})
+        assert html_errors == []
+        assert len(consistency) == 1 and "fix_success_rate mismatch" in consistency[0]
+        assert validate_page(page) == ([], [])
+
+    def test_missing_json_ld(self, tmp_path, valid_canon):
+        page = tmp_path / "index.html"
+        page.write_text("<html></html>", encoding="utf-8")
+        html_errors, consistency = validate_page(page, {valid_canon["id"]: valid_canon})
+        assert any("Could not extract JSON-LD" in e for e in html_errors)
+        assert consistency == [f"{page}: Could not extract JSON-LD for consistency check"]
+
+    def test_pooled_output_is_deterministic(self, tmp_path, make_canon, capsys):
+        data_dir = tmp_path / "data"
+        site_dir = tmp_path / "site"
+        for i in range(6):
+            cid = f"python/error-{i}/env1"
+            canon = make_canon(id=cid, url=f"https://deadends.dev/{cid}")
+            if i == 3:
+                canon["verdict"]["resolvable"] = "maybe"  # schema error
+            path = data_dir / f"{cid}.json"
+            path.parent.mkdir(parents=True)
+            path.write_text(json.dumps(canon), encoding="utf-8")
+            verdict = dict(canon["verdict"], fix_success_rate=0.01 if i == 4 else
+                           canon["verdict"]["fix_success_rate"])
+            _write_page(site_dir, cid, {"id": cid, "verdict": verdict})
+
+        assert validate_all(data_dir, site_dir, jobs=1) is False
+        serial = capsys.readouterr().out
+        assert validate_all(data_dir, site_dir, jobs=3) is False
+        assert capsys.readouterr().out == serial
+        assert "error-3/env1.json: Schema validation error" in serial
+        assert "error-4/env1/index.html: JSON-LD fix_success_rate mismatch" in serial
+
+
+class TestValidationCache:
+    def _write(self, data_dir, canon):
+        path = data_dir / f"{canon['id']}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(canon), encoding="utf-8")
+        return path
+
+    def test_only_changed_files_are_revalidated(self, tmp_path, make_canon, capsys):
+        data_dir = tmp_path / "canons"
+        cache = tmp_path / "cache.json"
+        ids = [f"python/error-{i}/env1" for i in range(3)]
+        paths = []
+        for i, cid in enumerate(ids):
+            graph = {
+                "leads_to": [{"error_id": ids[(i + 1) % 3], "probability": 0.5}],
+                "preceded_by": [],
+                "frequently_confused_with": [],
+            }
+            canon = make_canon(
+                id=cid, url=f"https://deadends.dev/{cid}", transition_graph=graph
+            )
+            paths.append(self._write(data_dir, canon))
+
+        assert validate_all(data_dir, cache_path=cache)
+        cold = capsys.readouterr().out
+        assert "0 unchanged, 3 checked" in cold
+        assert validate_all(data_dir, cache_path=cache)
+        warm = capsys.readouterr().out
+        assert "3 unchanged, 0 checked" in warm
+        strip = lambda out: [ln for ln in out.splitlines() if "cache" not in ln]  # noqa: E731
+        assert strip(warm) == strip(cold)
+
+        # A changed file is re-validated; a removed one breaks a cached reference
+        canon = json.loads(paths[0].read_text())
+        canon["verdict"]["resolvable"] = "maybe"
+        paths[0].write_text(json.dumps(canon), encoding="utf-8")
+        paths[2].unlink()
+        assert validate_all(data_dir, cache_path=cache) is False
+        out = capsys.readouterr().out
+        assert "1 unchanged, 1 checked" in out
+        assert "error-0/env1.json: Schema validation error" in out
+        assert "python/error-1/env1: transition_graph.leads_to references " \
+            "non-existent error 'python/error-2/env1'" in out
+
+
+class TestGraphValidation:
+    NODES = [
+        ("a", [["leads_to", "b", 0.5], ["leads_to", "c", 0.4]]),
+        ("b", [["preceded_by", "a", 0.5], ["frequently_confused_with", "x", None]]),
+        ("c", []),
+        ("d", [["leads_to", "d", 0.2]]),
+        ("e", [["leads_to", "f", 0.7], ["leads_to", "a", 0.6]]),
+        ("f", [["preceded_by", "e", 0.7]]),
+        ("g", [["preceded_by", "h", 0.3]]),
+        ("h", [["leads_to", "g", 0.3]]),
+    ]
+
+    def test_report(self):
+        report = validate_graph(self.NODES)
+        assert report["nodes"] == 8
+        assert report["edges"] == {
+            "leads_to": 6, "preceded_by": 3, "frequently_confused_with": 1,
+        }
+        assert report["dangling"] == [["b", "frequently_confused_with", "x"]]
+        assert report["self_loops"] == [["d", "leads_to"]]
+        assert report["probability_over_1"] == [{"id": "e", "sum": 1.3}]
+        assert report["asymmetric"] == [
+            {"from": "a", "to": "c", "missing": "preceded_by"},
+            {"from": "e", "to": "a", "missing": "preceded_by"},
+        ]
+        components = report["components"]
+        assert (components["count"], components["largest"]) == (3, 5)
+        assert components["isolated"] == 1
+        assert components["unreachable_clusters"] == [["g", "h"]]
+
+    def test_validate_all_writes_report_and_fails_on_self_loop(
+        self, tmp_path, make_canon, capsys
+    ):
+        data_dir = tmp_path / "canons"
+        cid = "python/loop/env1"
+        canon = make_canon(id=cid, url=f"https://deadends.dev/{cid}", transition_graph={
+            "leads_to": [{"error_id": cid, "probability": 0.5}],
+            "preceded_by": [],
+            "frequently_confused_with": [],
+        })
+        (data_dir / "python" / "loop").mkdir(parents=True)
+        (data_dir / f"{cid}.json").write_text(json.dumps(canon), encoding="utf-8")
+        report_path = tmp_path / "reports" / "graph.json"
+
+        assert validate_all(data_dir, graph_report=report_path) is False
+        assert "references itself" in capsys.readouterr().out
+        assert json.loads(report_path.read_text())["self_loops"] == [[cid, "leads_to"]]